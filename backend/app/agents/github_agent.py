@@ -10,6 +10,7 @@ import requests
 from langchain_core.language_models import BaseChatModel
 
 from app.core.llm import get_llm
+from app.core.tracing import span, traced
 
 try:  # Prefer async ingest if available
     from gitingest import ingest_async as _gitingest_async  # type: ignore
@@ -161,6 +162,7 @@ class GitHubAgent:
             print(f"Error fetching repository info: {e}")
             return {"error": f"Failed to fetch repository information: {str(e)}"}
 
+    @traced("agent.github.ingest")
     async def _ingest_repository(
         self, url: str, timeout: float = 60.0
     ) -> Optional[IngestedContent]:
@@ -288,7 +290,8 @@ class GitHubAgent:
 
             if not self.llm:
                 raise RuntimeError("LLM is not configured")
-            response = await self.llm.ainvoke(prompt)
+            with span("agent.github.insights"):
+                response = await self.llm.ainvoke(prompt)
             insights_text = (
                 str(response.content) if hasattr(response, "content") else str(response)
             )
@@ -12,6 +12,7 @@ from tavily import TavilyClient
 from app.agents.web_content_agent import return_markdown
 from app.core.llm import get_llm
 from app.core.settings import get_settings
+from app.core.tracing import span, traced
 
 settings = get_settings()
 
@@ -126,6 +127,7 @@ class WebSearchAgent:
         self.max_results = max_results
         self.llm = llm or get_llm()
 
+    @traced("agent.websearch.search")
     def search_web(
         self, query: str, max_results: Optional[int] = None
     ) -> List[Dict[str, str]]:
@@ -140,6 +142,7 @@ class WebSearchAgent:
             for u in urls
         ]
 
+    @traced("agent.websearch.extract")
     def extract_page_content(self, url: str) -> str:
         return return_markdown(url)
 
@@ -191,7 +194,8 @@ class WebSearchAgent:
                 f"Summarize key insights, trends, and takeaways about '{topic}' for a professional LinkedIn post. "
                 f"Base it ONLY on the following material. Be concise (2-3 sentences).\n\n{research_text}\nSummary:"
             )
-            resp = await self.llm.ainvoke(prompt)
+            with span("agent.websearch.summarize"):
+                resp = await self.llm.ainvoke(prompt)
             return str(getattr(resp, "content", resp)).strip()
         except Exception as e:
             logger.warning(f"[websearch] summarization failed: {e}")
@@ -226,7 +230,8 @@ class LinkedInResearcher(WebSearchAgent):
                 "Avoid hashtags except at most 2 at end if they add clarity. Maintain professional, optimistic tone.\n\n"
                 f"SUMMARY:\n{summary}\n\nPOST:"
             )
-            resp = await self.llm.ainvoke(prompt)
+            with span("agent.linkedin.post"):
+                resp = await self.llm.ainvoke(prompt)
             research["linkedin_post"] = str(getattr(resp, "content", resp)).strip()
             return research
 
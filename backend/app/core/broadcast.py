@@ -0,0 +1,56 @@
+"""Fan out one producer's output to any number of async listeners."""
+
+import asyncio
+from typing import Any, AsyncIterator
+
+
+class StreamBroadcast:
+    """One upstream stream that any number of listeners can follow.
+
+    Listeners attaching late first receive every chunk produced so far.
+    When the last listener leaves before the stream is done, the stream is
+    abandoned and its upstream task cancelled.
+    """
+
+    def __init__(self) -> None:
+        self.chunks: list[Any] = []
+        self.done = False
+        self.error: BaseException | None = None
+        self.listeners = 0
+        self.abandoned = False
+        self.task: asyncio.Task | None = None
+        self._changed = asyncio.Condition()
+
+    async def publish(self, chunk: Any) -> None:
+        async with self._changed:
+            self.chunks.append(chunk)
+            self._changed.notify_all()
+
+    async def finish(self, error: BaseException | None = None) -> None:
+        async with self._changed:
+            self.done = True
+            self.error = error
+            self._changed.notify_all()
+
+    async def listen(self) -> AsyncIterator[Any]:
+        index = 0
+        self.listeners += 1
+        try:
+            while True:
+                while index < len(self.chunks):
+                    yield self.chunks[index]
+                    index += 1
+                if self.done:
+                    if self.error is not None:
+                        raise self.error
+                    return
+                async with self._changed:
+                    await self._changed.wait_for(
+                        lambda: index < len(self.chunks) or self.done
+                    )
+        finally:
+            self.listeners -= 1
+            if self.listeners == 0 and not self.done:
+                self.abandoned = True
+                if self.task is not None:
+                    self.task.cancel()
@@ -4,6 +4,7 @@ import logging
 from typing import Any
 
 from app.core.settings import get_settings
+from app.core.tracing import span
 
 try:
     import redis
@@ -89,11 +90,13 @@ async def get_cached_json(cache_key: str) -> dict[str, Any] | None:
     if _redis_async_client is None and not await connect_redis_cache():
         return None
 
-    try:
-        raw = await _redis_async_client.get(cache_key)
-    except Exception:
-        logger.debug("Redis async get failed", exc_info=True)
-        return None
+    with span("cache.get") as current:
+        try:
+            raw = await _redis_async_client.get(cache_key)
+        except Exception:
+            logger.debug("Redis async get failed", exc_info=True)
+            return None
+        current.set_attribute("cache.hit", bool(raw))
 
     if not raw:
         return None
@@ -119,11 +122,12 @@ async def set_cached_json(
 
     ttl = ttl_seconds or settings.REDIS_CACHE_TTL_SECONDS
 
-    try:
-        payload = json.dumps(value, ensure_ascii=True)
-        await _redis_async_client.set(cache_key, payload, ex=ttl)
-    except Exception:
-        logger.debug("Redis async set failed", exc_info=True)
+    with span("cache.set"):
+        try:
+            payload = json.dumps(value, ensure_ascii=True)
+            await _redis_async_client.set(cache_key, payload, ex=ttl)
+        except Exception:
+            logger.debug("Redis async set failed", exc_info=True)
 
 
 def get_cached_json_sync(cache_key: str) -> dict[str, Any] | None:
@@ -131,11 +135,13 @@ def get_cached_json_sync(cache_key: str) -> dict[str, Any] | None:
     if client is None:
         return None
 
-    try:
-        raw = client.get(cache_key)
-    except Exception:
-        logger.debug("Redis sync get failed", exc_info=True)
-        return None
+    with span("cache.get") as current:
+        try:
+            raw = client.get(cache_key)
+        except Exception:
+            logger.debug("Redis sync get failed", exc_info=True)
+            return None
+        current.set_attribute("cache.hit", bool(raw))
 
     if not raw:
         return None
@@ -162,11 +168,12 @@ def set_cached_json_sync(
 
     ttl = ttl_seconds or settings.REDIS_CACHE_TTL_SECONDS
 
-    try:
-        payload = json.dumps(value, ensure_ascii=True)
-        client.set(cache_key, payload, ex=ttl)
-    except Exception:
-        logger.debug("Redis sync set failed", exc_info=True)
+    with span("cache.set"):
+        try:
+            payload = json.dumps(value, ensure_ascii=True)
+            client.set(cache_key, payload, ex=ttl)
+        except Exception:
+            logger.debug("Redis sync set failed", exc_info=True)
 
 
 async def redis_health() -> dict[str, Any]:
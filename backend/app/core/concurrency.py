@@ -0,0 +1,76 @@
+"""Run service coroutines concurrently under the shared parallelism limit."""
+
+import asyncio
+import inspect
+from typing import Any, AsyncIterator, Awaitable, Iterable
+
+from app.core.settings import get_settings
+
+settings = get_settings()
+
+
+def _resolve_limit(limit: int | None) -> int:
+    return max(1, limit or settings.MAX_SERVICE_PARALLELISM)
+
+
+async def _await_with_permit(
+    semaphore: asyncio.Semaphore,
+    awaitable: Awaitable[Any],
+) -> Any:
+    try:
+        async with semaphore:
+            return await awaitable
+    except asyncio.CancelledError:
+        # Avoid "never awaited" warnings for coroutines cancelled while queued.
+        if inspect.iscoroutine(awaitable):
+            awaitable.close()
+        raise
+
+
+async def gather_limited(
+    awaitables: Iterable[Awaitable[Any]],
+    *,
+    limit: int | None = None,
+) -> list[Any]:
+    """Await everything concurrently, at most ``limit`` at a time.
+
+    Results keep the input order. Exceptions are returned in place of the
+    result so one failing item does not discard the others.
+    """
+    semaphore = asyncio.Semaphore(_resolve_limit(limit))
+    return list(
+        await asyncio.gather(
+            *(_await_with_permit(semaphore, aw) for aw in awaitables),
+            return_exceptions=True,
+        )
+    )
+
+
+async def as_completed_limited(
+    awaitables: Iterable[Awaitable[Any]],
+    *,
+    limit: int | None = None,
+) -> AsyncIterator[tuple[int, Any]]:
+    """Yield ``(index, result)`` pairs as soon as each awaitable finishes.
+
+    Like ``gather_limited``, exceptions are yielded in place of the result.
+    Work that is still pending is cancelled if the consumer stops early.
+    """
+    semaphore = asyncio.Semaphore(_resolve_limit(limit))
+
+    async def _run(index: int, awaitable: Awaitable[Any]) -> tuple[int, Any]:
+        try:
+            return index, await _await_with_permit(semaphore, awaitable)
+        except Exception as error:
+            return index, error
+
+    tasks = [
+        asyncio.create_task(_run(index, aw)) for index, aw in enumerate(awaitables)
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
@@ -1,6 +1,6 @@
 from typing import Optional
 
-from fastapi import Request
+from fastapi.requests import HTTPConnection
 from langchain_core.language_models import BaseChatModel
 
 from app.core.llm import create_llm, get_faster_llm, get_llm
@@ -19,9 +19,11 @@ def get_faster_llm_dep() -> Optional[BaseChatModel]:
     return get_faster_llm()
 
 
-def get_request_llm(request: Request) -> BaseChatModel:
+def get_request_llm(request: HTTPConnection) -> BaseChatModel:
     """FastAPI dependency that builds a per-request LLM instance.
 
+    Works for WebSocket routes as well, reading the handshake headers.
+
     The frontend proxy routes attach these headers when the user has a custom
     LLM configuration stored in the database:
         X-LLM-Provider  (e.g. "openai", "anthropic", "google", ...)
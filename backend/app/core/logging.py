@@ -1,22 +1,169 @@
 from __future__ import annotations
 
+import json
 import logging
 import logging.config
+import logging.handlers
+import queue
+import threading
+import time
 from contextvars import ContextVar
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 from uuid import uuid4
 
+from app.core.metrics import increment
 from app.core.settings import get_settings
 
 request_id_ctx: ContextVar[str] = ContextVar("request_id", default="-")
 
+# Attributes every LogRecord has; anything else was passed through ``extra``
+_RECORD_ATTRIBUTES = frozenset(
+    logging.LogRecord("", 0, "", 0, "", (), None).__dict__
+) | {"message", "asctime", "request_id", "color_message"}
+_STABLE_ARG_TYPES = (str, int, float, bool, bytes, type(None))
+
+# Queue handlers whose listener threads are started by setup_logging
+_QUEUE_HANDLERS = ("queue", "access_queue")
+
 
 class RequestIdFilter(logging.Filter):
     def filter(self, record: logging.LogRecord) -> bool:
-        record.request_id = request_id_ctx.get()
+        # Records handed over from a queue were stamped in the logging thread.
+        if not hasattr(record, "request_id"):
+            record.request_id = request_id_ctx.get()
+        return True
+
+
+class LazyLogArg:
+    """Base for log arguments formatted only when the record is written.
+
+    Their ``__str__`` then runs on the logging thread, off the request path,
+    so subclasses must not change after being logged.
+    """
+
+    __slots__ = ()
+
+
+class _RateLimiter:
+    """Token bucket per logger name."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, list[float]] = {}
+
+    def allow(self, name: str) -> bool:
+        if self.rate <= 0:
+            return True
+        now = time.monotonic()
+        bucket = self._buckets.get(name)
+        if bucket is None:
+            bucket = self._buckets[name] = [float(self.burst), now]
+        tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+        bucket[1] = now
+        if tokens < 1:
+            bucket[0] = tokens
+            return False
+        bucket[0] = tokens - 1
         return True
 
 
+class StructuredQueueHandler(logging.handlers.QueueHandler):
+    """Hands records to a listener thread without ever blocking the caller.
+
+    Records are dropped, and counted in the ``logging.dropped`` metric, when
+    their logger exceeds its rate limit (errors are exempt) or the queue is
+    full. Formatting is left to the listener thread unless a record's
+    arguments could change after the call.
+    """
+
+    def __init__(self, queue: queue.Queue, **kwargs: Any):
+        super().__init__(queue, **kwargs)
+        settings = get_settings()
+        self._limiter = _RateLimiter(
+            settings.LOG_RATE_LIMIT_PER_SECOND, settings.LOG_RATE_LIMIT_BURST
+        )
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        args = record.args
+        # A single mapping argument is stored as ``args`` itself.
+        if args and (
+            isinstance(args, dict)
+            or not all(isinstance(arg, (_STABLE_ARG_TYPES, LazyLogArg)) for arg in args)
+        ):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Handler.handle serializes emit calls, so the limiter needs no lock.
+        if record.levelno < logging.ERROR and not self._limiter.allow(record.name):
+            increment("logging.dropped", reason="rate_limited", logger=record.name)
+            return
+        try:
+            self.queue.put_nowait(self.prepare(record))
+        except queue.Full:
+            increment("logging.dropped", reason="queue_full", logger=record.name)
+        except Exception:
+            self.handleError(record)
+
+
+def build_log_queue() -> queue.Queue:
+    return queue.Queue(maxsize=get_settings().LOG_QUEUE_SIZE)
+
+
+def _truncate(value: str, limit: int) -> str:
+    if limit <= 0 or len(value) <= limit:
+        return value
+    return f"{value[:limit]}...[truncated {len(value) - limit} chars]"
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line; long text fields are truncated."""
+
+    def __init__(self, max_field_chars: Optional[int] = None, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.max_field_chars = (
+            max_field_chars
+            if max_field_chars is not None
+            else get_settings().LOG_MAX_FIELD_CHARS
+        )
+
+    def _field(self, value: Any) -> Any:
+        if isinstance(value, (bool, int, float, type(None))):
+            return value
+        if isinstance(value, (dict, list, tuple)):
+            text = json.dumps(value, ensure_ascii=False, default=str)
+            if len(text) <= self.max_field_chars:
+                return value
+            return _truncate(text, self.max_field_chars)
+        return _truncate(str(value), self.max_field_chars)
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc)
+            .isoformat(timespec="milliseconds")
+            .replace("+00:00", "Z"),
+            "level": record.levelname,
+            "logger": record.name,
+            "request_id": getattr(record, "request_id", "-"),
+            "message": _truncate(record.getMessage(), self.max_field_chars),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = self._field(value)
+        if record.exc_info:
+            entry["exception"] = _truncate(
+                self.formatException(record.exc_info), self.max_field_chars * 4
+            )
+        if record.stack_info:
+            entry["stack"] = _truncate(
+                self.formatStack(record.stack_info), self.max_field_chars
+            )
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
 def bind_request_id(request_id: str) -> Any:
     return request_id_ctx.set(request_id)
 
@@ -34,6 +181,7 @@ def _get_log_level() -> str:
 
 def get_logging_config() -> Dict[str, Any]:
     log_level = _get_log_level()
+    use_json = get_settings().LOG_FORMAT.lower() == "json"
 
     return {
         "version": 1,
@@ -53,53 +201,96 @@ def get_logging_config() -> Dict[str, Any]:
                 "format": '%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(client_addr)s - "%(request_line)s" %(status_code)s',
                 "datefmt": "%Y-%m-%d %H:%M:%S",
             },
+            "json": {
+                "()": "app.core.logging.JsonFormatter",
+            },
         },
         "handlers": {
+            # Written by the listener threads of the queue handlers below
             "console": {
                 "class": "logging.StreamHandler",
-                "formatter": "standard",
+                "formatter": "json" if use_json else "standard",
                 "filters": ["request_id"],
                 "stream": "ext://sys.stdout",
             },
             "access": {
                 "class": "logging.StreamHandler",
-                "formatter": "access",
+                "formatter": "json" if use_json else "access",
                 "filters": ["request_id"],
                 "stream": "ext://sys.stdout",
             },
+            # What loggers write to; never blocks on stdout
+            "queue": {
+                "class": "app.core.logging.StructuredQueueHandler",
+                "queue": "app.core.logging.build_log_queue",
+                "filters": ["request_id"],
+                "handlers": ["console"],
+            },
+            "access_queue": {
+                "class": "app.core.logging.StructuredQueueHandler",
+                "queue": "app.core.logging.build_log_queue",
+                "filters": ["request_id"],
+                "handlers": ["access"],
+            },
         },
         "loggers": {
             "uvicorn": {
-                "handlers": ["console"],
+                "handlers": ["queue"],
                 "level": log_level,
                 "propagate": False,
             },
             "uvicorn.error": {
-                "handlers": ["console"],
+                "handlers": ["queue"],
                 "level": log_level,
                 "propagate": False,
             },
             "uvicorn.access": {
-                "handlers": ["access"],
+                "handlers": ["access_queue"],
                 "level": "INFO",
                 "propagate": False,
             },
             "fastapi": {
-                "handlers": ["console"],
+                "handlers": ["queue"],
                 "level": log_level,
                 "propagate": False,
             },
         },
         "root": {
-            "handlers": ["console"],
+            "handlers": ["queue"],
             "level": log_level,
         },
     }
 
 
+_listeners_lock = threading.Lock()
+
+
+def _queue_listeners() -> list[logging.handlers.QueueListener]:
+    listeners = []
+    for name in _QUEUE_HANDLERS:
+        handler = logging.getHandlerByName(name)
+        listener = getattr(handler, "listener", None)
+        if listener is not None:
+            listeners.append(listener)
+    return listeners
+
+
 def setup_logging() -> None:
-    logging.config.dictConfig(get_logging_config())
-    logging.captureWarnings(True)
+    with _listeners_lock:
+        for listener in _queue_listeners():
+            listener.stop()
+        logging.config.dictConfig(get_logging_config())
+        logging.captureWarnings(True)
+        for listener in _queue_listeners():
+            listener.start()
+
+
+def stop_logging() -> None:
+    """Write out queued records and stop the listener threads."""
+    with _listeners_lock:
+        for listener in _queue_listeners():
+            # Safe to call on a listener that is not running.
+            listener.stop()
 
 
 def get_logger(name: str) -> logging.Logger:
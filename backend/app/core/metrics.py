@@ -0,0 +1,154 @@
+"""In-process counters, value aggregates and histograms exposed on the
+infrastructure routes."""
+
+import threading
+from bisect import bisect_left
+from typing import Any, Optional
+
+# Upper bounds of histogram buckets, in milliseconds; larger values overflow
+DURATION_BUCKETS_MS = (
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2500.0,
+    5000.0,
+    10000.0,
+    30000.0,
+    60000.0,
+)
+
+_lock = threading.Lock()
+_counters: dict[tuple[str, tuple[tuple[str, str], ...]], int] = {}
+_aggregates: dict[tuple[str, tuple[tuple[str, str], ...]], dict[str, float]] = {}
+_histograms: dict[tuple[str, tuple[tuple[str, str], ...]], dict[str, Any]] = {}
+
+
+def _key(name: str, labels: dict[str, Any]) -> tuple[str, tuple[tuple[str, str], ...]]:
+    return name, tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def increment(name: str, amount: int = 1, **labels: Any) -> None:
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + amount
+
+
+def observe(name: str, value: float, **labels: Any) -> None:
+    key = _key(name, labels)
+    with _lock:
+        aggregate = _aggregates.get(key)
+        if aggregate is None:
+            _aggregates[key] = {"count": 1, "sum": value, "min": value, "max": value}
+            return
+        aggregate["count"] += 1
+        aggregate["sum"] += value
+        aggregate["min"] = min(aggregate["min"], value)
+        aggregate["max"] = max(aggregate["max"], value)
+
+
+def histogram(name: str, value: float, **labels: Any) -> None:
+    """Count a duration (ms) into its ``DURATION_BUCKETS_MS`` bucket."""
+    key = _key(name, labels)
+    bucket = bisect_left(DURATION_BUCKETS_MS, value)
+    with _lock:
+        entry = _histograms.get(key)
+        if entry is None:
+            entry = _histograms[key] = {
+                "counts": [0] * (len(DURATION_BUCKETS_MS) + 1),
+                "count": 0,
+                "sum": 0.0,
+                "min": value,
+                "max": value,
+            }
+        entry["counts"][bucket] += 1
+        entry["count"] += 1
+        entry["sum"] += value
+        entry["min"] = min(entry["min"], value)
+        entry["max"] = max(entry["max"], value)
+
+
+def _quantile(entry: dict[str, Any], quantile: float) -> float:
+    """Estimate a quantile by interpolating within its bucket."""
+    rank = quantile * entry["count"]
+    cumulative = 0
+    for index, count in enumerate(entry["counts"]):
+        if count and cumulative + count >= rank:
+            lower = DURATION_BUCKETS_MS[index - 1] if index else 0.0
+            upper = (
+                DURATION_BUCKETS_MS[index]
+                if index < len(DURATION_BUCKETS_MS)
+                else entry["max"]
+            )
+            lower = max(lower, entry["min"])
+            upper = min(upper, entry["max"])
+            return lower + (upper - lower) * (rank - cumulative) / count
+        cumulative += count
+    return entry["max"]
+
+
+def histogram_snapshot(name: Optional[str] = None) -> list[dict[str, Any]]:
+    """Histograms (all, or those called ``name``) with estimated percentiles.
+
+    Bucket counts are cumulative, keyed by their upper bound.
+    """
+    with _lock:
+        entries = [
+            (entry_name, labels, {**entry, "counts": list(entry["counts"])})
+            for (entry_name, labels), entry in _histograms.items()
+            if name is None or entry_name == name
+        ]
+
+    snapshot = []
+    for entry_name, labels, entry in entries:
+        buckets = {}
+        cumulative = 0
+        for bound, count in zip((*DURATION_BUCKETS_MS, "+Inf"), entry["counts"]):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        snapshot.append(
+            {
+                "name": entry_name,
+                "labels": dict(labels),
+                "count": entry["count"],
+                "sum": round(entry["sum"], 4),
+                "mean": round(entry["sum"] / entry["count"], 4),
+                "min": round(entry["min"], 4),
+                "max": round(entry["max"], 4),
+                "p50": round(_quantile(entry, 0.5), 4),
+                "p95": round(_quantile(entry, 0.95), 4),
+                "p99": round(_quantile(entry, 0.99), 4),
+                "buckets": buckets,
+            }
+        )
+    return snapshot
+
+
+def metrics_snapshot() -> dict[str, list[dict[str, Any]]]:
+    with _lock:
+        counters = [
+            {"name": name, "labels": dict(labels), "value": value}
+            for (name, labels), value in _counters.items()
+        ]
+        aggregates = [
+            {
+                "name": name,
+                "labels": dict(labels),
+                "count": int(aggregate["count"]),
+                "mean": round(aggregate["sum"] / aggregate["count"], 4),
+                "min": round(aggregate["min"], 4),
+                "max": round(aggregate["max"], 4),
+            }
+            for (name, labels), aggregate in _aggregates.items()
+        ]
+    return {
+        "counters": counters,
+        "aggregates": aggregates,
+        "histograms": histogram_snapshot(),
+    }
@@ -0,0 +1,164 @@
+"""Request/response logging middleware.
+
+Bodies pass through untouched as they are produced, so streamed responses
+(SSE) keep their incremental delivery. Requests are logged at debug level
+only; while it is disabled the middleware does nothing. For a sampled share
+of requests, a capped prefix of each body is added to the record's
+``payload`` field; it is formatted on the logging thread.
+"""
+
+import json
+import logging
+import random
+import time
+from typing import Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logging import LazyLogArg
+from app.core.settings import get_settings
+
+settings = get_settings()
+
+request_logger = logging.getLogger("app.request")
+response_logger = logging.getLogger("app.response")
+
+_STREAMING_CONTENT_TYPES = ("text/event-stream",)
+
+
+class _BodyPrefix(LazyLogArg):
+    """First ``limit`` bytes of a body, formatted lazily for the log."""
+
+    __slots__ = ("limit", "parts", "size", "truncated", "content_type")
+
+    def __init__(self, limit: int, content_type: Optional[str] = None):
+        self.limit = limit
+        self.parts: list[bytes] = []
+        self.size = 0
+        self.truncated = False
+        self.content_type = content_type
+
+    def add(self, chunk: bytes) -> None:
+        room = self.limit - self.size
+        if len(chunk) > room:
+            self.truncated = True
+            chunk = chunk[:room]
+        if chunk:
+            self.parts.append(chunk)
+            self.size += len(chunk)
+
+    def __str__(self) -> str:
+        text = _format_payload(b"".join(self.parts), self.content_type)
+        if self.truncated:
+            text += "...[truncated]"
+        return text
+
+
+def _format_payload(payload: bytes, content_type: Optional[str]) -> str:
+    if not payload:
+        return ""
+    if content_type and "application/json" in content_type.lower():
+        try:
+            return json.dumps(json.loads(payload), ensure_ascii=True)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            pass
+    return payload.decode("utf-8", errors="replace")
+
+
+def _header(headers: list, name: bytes) -> Optional[str]:
+    for key, value in headers:
+        if key.lower() == name:
+            return value.decode("latin-1")
+    return None
+
+
+class RequestLoggingMiddleware:
+    """Logs each request and its response without buffering either."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not (
+            request_logger.isEnabledFor(logging.DEBUG)
+            or response_logger.isEnabledFor(logging.DEBUG)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path = scope["path"]
+        started = time.perf_counter()
+        capture = random.random() < settings.REQUEST_LOG_BODY_SAMPLE_RATE
+        limit = settings.REQUEST_LOG_BODY_MAX_BYTES
+        request_body = (
+            _BodyPrefix(limit, _header(scope["headers"], b"content-type"))
+            if capture
+            else None
+        )
+        response_body: Optional[_BodyPrefix] = None
+        status = 0
+        request_logged = False
+
+        def log_request() -> None:
+            nonlocal request_logged
+            if request_logged:
+                return
+            request_logged = True
+            fields = {
+                "method": method,
+                "path": path,
+                "query": scope.get("query_string", b"").decode("latin-1"),
+            }
+            if request_body is not None:
+                fields["payload"] = request_body
+            request_logger.debug("request %s %s", method, path, extra=fields)
+
+        async def receive_logged() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                if request_body is not None:
+                    request_body.add(message.get("body", b""))
+                if not message.get("more_body", False):
+                    log_request()
+            return message
+
+        async def send_logged(message: Message) -> None:
+            nonlocal response_body, status
+            if message["type"] == "http.response.start":
+                # Also covers handlers that never read the request body.
+                log_request()
+                status = message["status"]
+                content_type = _header(message.get("headers", []), b"content-type")
+                streaming = content_type is not None and content_type.startswith(
+                    _STREAMING_CONTENT_TYPES
+                )
+                if capture and not streaming:
+                    response_body = _BodyPrefix(limit, content_type)
+            elif message["type"] == "http.response.body" and response_body is not None:
+                response_body.add(message.get("body", b""))
+
+            await send(message)
+
+            if message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                duration_ms = round((time.perf_counter() - started) * 1000, 2)
+                fields = {
+                    "method": method,
+                    "path": path,
+                    "status": status,
+                    "duration_ms": duration_ms,
+                }
+                if response_body is not None:
+                    fields["payload"] = response_body
+                response_logger.debug(
+                    "response %s %s %s %.2fms",
+                    method,
+                    path,
+                    status,
+                    duration_ms,
+                    extra=fields,
+                )
+
+        await self.app(scope, receive_logged, send_logged)
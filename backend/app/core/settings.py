@@ -1,5 +1,5 @@
 from functools import lru_cache
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -16,7 +16,16 @@ class Settings(BaseSettings):
     APP_NAME: str = "TalentSync Normies API"
     APP_VERSION: str = "1.5.8"
     DEBUG: bool = False
-    LOG_LEVEL: str = "DEBUG"
+    LOG_LEVEL: str = "INFO"
+    # "json" (one object per line) or "text"
+    LOG_FORMAT: str = "json"
+    # Records waiting for the logging thread; further records are dropped
+    LOG_QUEUE_SIZE: int = 10000
+    # Per logger, errors exempt (0 = unlimited)
+    LOG_RATE_LIMIT_PER_SECOND: float = 200.0
+    LOG_RATE_LIMIT_BURST: int = 500
+    # Longer messages and extra fields are truncated
+    LOG_MAX_FIELD_CHARS: int = 4096
 
     # LLM Configuration
     GOOGLE_API_KEY: Optional[str] = None
@@ -38,6 +47,9 @@ class Settings(BaseSettings):
     ENABLE_REDIS_CACHE: bool = True
     REDIS_URL: str = "redis://localhost:6379/0"
     REDIS_CACHE_TTL_SECONDS: int = 900
+    # Cached streamed LLM responses are replayed in chunks at this pace
+    LLM_STREAM_REPLAY_CHUNK_CHARS: int = 24
+    LLM_STREAM_REPLAY_INTERVAL_MS: int = 15
 
     # Celery
     CELERY_BROKER_URL: str = "redis://localhost:6379/1"
@@ -55,10 +67,58 @@ class Settings(BaseSettings):
     ENABLE_KAFKA_EVENTS: bool = True
     KAFKA_BOOTSTRAP_SERVERS: str = "localhost:9092"
     KAFKA_EVENTS_TOPIC: str = "talentsync.backend.events"
+    KAFKA_COMPRESSION_TYPE: Optional[str] = "gzip"
+    # Events are queued in process and published in batches
+    KAFKA_EVENT_QUEUE_SIZE: int = 10000
+    KAFKA_EVENT_BATCH_SIZE: int = 500
+    KAFKA_EVENT_LINGER_MS: int = 50
+    # When the queue is full: "drop", or "block" for up to the timeout, then drop
+    KAFKA_EVENT_OVERFLOW_POLICY: str = "drop"
+    KAFKA_EVENT_BLOCK_TIMEOUT_MS: int = 100
+    KAFKA_RECONNECT_MIN_SECONDS: float = 1.0
+    KAFKA_RECONNECT_MAX_SECONDS: float = 60.0
+    # Time allowed on shutdown for publishing queued events
+    KAFKA_FLUSH_TIMEOUT_SECONDS: float = 5.0
+
+    # Resume Analysis
+    # "auto" skips the LLM text-formatting pass for documents that are already
+    # clean after deterministic normalization; "always" / "never" force it.
+    RESUME_TEXT_FORMATTING_MODE: str = "auto"
+
+    # Resume Enrichment
+    ENRICHMENT_ANALYSIS_TTL_SECONDS: int = 3600
+
+    # Request logging (debug level): share of requests whose bodies are
+    # logged, and how much of each body is kept
+    REQUEST_LOG_BODY_SAMPLE_RATE: float = 0.1
+    REQUEST_LOG_BODY_MAX_BYTES: int = 2048
+
+    # Request tracing: spans feed per-span histograms and the Server-Timing
+    # response header
+    TRACING_ENABLED: bool = True
+    TRACING_SERVER_TIMING: bool = True
+    TRACING_MAX_SPANS_PER_TRACE: int = 256
+    # OTLP/HTTP JSON collector, e.g. http://localhost:4318/v1/traces
+    # (unset = no export)
+    TRACING_OTLP_ENDPOINT: Optional[str] = None
+    TRACING_OTLP_HEADERS: Dict[str, str] = {}
+    # Share of traces exported
+    TRACING_EXPORT_SAMPLE_RATE: float = 1.0
+    # Finished traces waiting for export; further traces are dropped
+    TRACING_EXPORT_QUEUE_SIZE: int = 2048
+    TRACING_EXPORT_BATCH_SIZE: int = 64
+    TRACING_EXPORT_INTERVAL_MS: int = 1000
+    TRACING_EXPORT_TIMEOUT_SECONDS: float = 5.0
 
     # Concurrency
     MAX_SERVICE_PARALLELISM: int = 4
 
+    # Server-Sent Events
+    # Comment lines sent while a stream is idle keep proxies from closing it
+    SSE_HEARTBEAT_SECONDS: float = 15.0
+    # Events buffered per stream before the producer waits for the client
+    SSE_SEND_QUEUE_SIZE: int = 32
+
     # CORS
     CORS_ORIGINS: List[str] = ["*"]
 
@@ -66,7 +126,49 @@ class Settings(BaseSettings):
     INTERVIEW_MAX_QUESTIONS: int = 20
     INTERVIEW_DEFAULT_QUESTIONS: int = 5
     INTERVIEW_CODE_EXECUTION_TIMEOUT: int = 10  # seconds
+    # Test cases run at once per submission (0 = CPU count)
+    INTERVIEW_CODE_TEST_PARALLELISM: int = 0
+    # Deterministic execution results are reused for identical code and input
+    INTERVIEW_CODE_CACHE_ENABLED: bool = True
+    INTERVIEW_CODE_CACHE_TTL_SECONDS: int = 300
+    INTERVIEW_CODE_CACHE_MAX_ENTRIES: int = 512
     INTERVIEW_SESSION_MAX_AGE_HOURS: int = 24
+    INTERVIEW_SESSION_SWEEP_INTERVAL_SECONDS: int = 300
+    # "memory" (single process), "redis" or "postgres" (shared across workers)
+    INTERVIEW_SESSION_BACKEND: str = "memory"
+    # Requests that change a session hold its lock; shared backends lease it
+    INTERVIEW_SESSION_LOCK_TTL_SECONDS: int = 60
+    INTERVIEW_SESSION_LOCK_TIMEOUT_SECONDS: int = 30
+    # Results of answer submissions kept for retried requests
+    INTERVIEW_IDEMPOTENCY_TTL_SECONDS: int = 3600
+    # Session WebSockets: requests keep running this long after a disconnect
+    # so a reconnecting client can resume from the messages it missed
+    INTERVIEW_WS_RESUME_GRACE_SECONDS: float = 60.0
+    INTERVIEW_WS_REPLAY_BUFFER: int = 2000
+    # Messages queued per connection before requests wait for the client
+    INTERVIEW_WS_SEND_QUEUE_SIZE: int = 64
+    INTERVIEW_EVENT_FLUSH_INTERVAL_MS: int = 500
+    INTERVIEW_EVENT_FLUSH_BATCH_SIZE: int = 50
+    # Events retained per session (0 = unbounded); counts stay exact
+    INTERVIEW_EVENT_LOG_MAX_EVENTS: int = 0
+    # Personalize the next question's follow-ups from an answer while that
+    # answer is evaluated; dropped if the interview does not move on to it
+    INTERVIEW_FOLLOW_UP_PREFETCH_ENABLED: bool = True
+    # Pre-generated questions for sessions without a resume
+    INTERVIEW_QUESTION_POOL_ENABLED: bool = True
+    INTERVIEW_QUESTION_POOL_TARGET_SIZE: int = 20
+    INTERVIEW_QUESTION_POOL_MAX_AGE_HOURS: int = 72
+    # Warm code-execution workers per language (0 disables the pool for it)
+    INTERVIEW_SANDBOX_POOL_SIZES: Dict[str, int] = {
+        "python": 2,
+        "javascript": 1,
+        "typescript": 1,
+    }
+    INTERVIEW_SANDBOX_WORKER_MAX_RUNS: int = 200
+    INTERVIEW_SANDBOX_MEMORY_LIMIT_MB: int = 256
+
+    # Database (used by the postgres interview session backend)
+    DATABASE_URL: Optional[str] = None
 
 
 @lru_cache
@@ -0,0 +1,101 @@
+"""Server-Sent Events helpers shared by streaming routes.
+
+Events are produced by a separate task into a bounded queue, so a slow
+client holds the producer back instead of letting events pile up in memory.
+While the stream is idle the client gets heartbeat comments, and when it
+disconnects the producer is cancelled, which cancels whatever LLM call or
+code execution it was waiting on.
+"""
+
+import asyncio
+import json
+import time
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+from starlette.requests import Request
+
+from app.core.metrics import increment
+from app.core.settings import get_settings
+
+settings = get_settings()
+
+_HEARTBEAT = ": heartbeat\n\n"
+# How often an idle or busy stream checks whether the client is still there
+_DISCONNECT_POLL_SECONDS = 1.0
+
+# Keeps cancelled producers referenced until their cleanup has run
+_producer_tasks: Set[asyncio.Task] = set()
+
+
+def _format_event(data: Dict[str, Any]) -> str:
+    event_type = data.get("type", "message")
+    json_data = json.dumps(data)
+    return f"event: {event_type}\ndata: {json_data}\n\n"
+
+
+def _route_path(request: Request) -> str:
+    route = request.scope.get("route")
+    return getattr(route, "path", request.url.path)
+
+
+async def _produce(async_gen, queue: asyncio.Queue) -> None:
+    try:
+        async for data in async_gen:
+            if queue.full():
+                increment("sse.backpressure_waits")
+            await queue.put(_format_event(data))
+    except Exception as e:
+        await queue.put(_format_event({"type": "error", "message": str(e)}))
+    finally:
+        # Runs the generator's cleanup now rather than whenever it is
+        # garbage collected.
+        aclose = getattr(async_gen, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    await queue.put(None)
+
+
+async def sse_generator(
+    async_gen,
+    request: Optional[Request] = None,
+) -> AsyncIterator[str]:
+    """Convert async generator to SSE format.
+
+    With ``request``, the client connection is checked while events are
+    produced and the generator is cancelled as soon as the client is gone.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=settings.SSE_SEND_QUEUE_SIZE)
+    producer = asyncio.create_task(_produce(async_gen, queue))
+    _producer_tasks.add(producer)
+    producer.add_done_callback(_producer_tasks.discard)
+    heartbeat = settings.SSE_HEARTBEAT_SECONDS
+    last_sent = last_checked = time.monotonic()
+    try:
+        while True:
+            try:
+                message = await asyncio.wait_for(
+                    queue.get(), timeout=min(heartbeat, _DISCONNECT_POLL_SECONDS)
+                )
+            except asyncio.TimeoutError:
+                message = _HEARTBEAT
+
+            now = time.monotonic()
+            if request is not None and now - last_checked >= _DISCONNECT_POLL_SECONDS:
+                last_checked = now
+                if await request.is_disconnected():
+                    increment("sse.disconnects", route=_route_path(request))
+                    return
+
+            if message is None:
+                return
+            if message is _HEARTBEAT:
+                if now - last_sent < heartbeat:
+                    continue
+                increment("sse.heartbeats")
+            last_sent = now
+            yield message
+    finally:
+        # Not awaited: the response may itself be cancelled at this point.
+        if not producer.done():
+            producer.cancel()
+            increment("sse.producers_cancelled")
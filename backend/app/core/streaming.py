@@ -1,74 +1,237 @@
+"""Kafka event publishing.
+
+Producing an event only appends it to a bounded in-process queue; a
+background task drains the queue and publishes compressed batches, so
+events add next to nothing to the request that produces them. When the
+queue is full, ``KAFKA_EVENT_OVERFLOW_POLICY`` decides: "drop" the event, or
+"block" the producer for up to ``KAFKA_EVENT_BLOCK_TIMEOUT_MS`` and then drop
+it. While Kafka is unreachable, reconnects back off exponentially instead of
+being retried for every event. Queued events are flushed on shutdown.
+"""
+
+import asyncio
 import logging
+import time
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Optional
 
 from faststream.kafka import KafkaBroker
 
+from app.core.metrics import increment, observe
 from app.core.settings import get_settings
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
-broker = KafkaBroker(settings.KAFKA_BOOTSTRAP_SERVERS)
-_kafka_started = False
+broker = KafkaBroker(
+    settings.KAFKA_BOOTSTRAP_SERVERS,
+    compression_type=settings.KAFKA_COMPRESSION_TYPE,
+    linger_ms=settings.KAFKA_EVENT_LINGER_MS,
+)
+
+# Attempts to publish one batch before its events are dropped
+_PUBLISH_ATTEMPTS = 3
+
+
+class EventPublisher:
+    """Buffers events and publishes them to Kafka in batches."""
+
+    def __init__(self, broker: KafkaBroker):
+        self.broker = broker
+        self.connected = False
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._backoff = 0.0
+        self._retry_at = 0.0
+        self._closing = False
+
+    @property
+    def queued(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def connect(self, *, force: bool = False) -> bool:
+        """Connect unless a failed attempt's backoff has not yet passed."""
+        if self.connected:
+            return True
+        now = time.monotonic()
+        if not force and now < self._retry_at:
+            return False
+
+        try:
+            await self.broker.connect()
+        except Exception as error:
+            self._backoff = min(
+                max(self._backoff * 2, settings.KAFKA_RECONNECT_MIN_SECONDS),
+                settings.KAFKA_RECONNECT_MAX_SECONDS,
+            )
+            self._retry_at = now + self._backoff
+            increment("kafka.reconnects", outcome="failed")
+            logger.warning(
+                "Kafka broker unavailable, retrying in %.1fs: %s",
+                self._backoff,
+                error,
+            )
+            return False
+
+        self.connected = True
+        self._backoff = 0.0
+        increment("kafka.reconnects", outcome="connected")
+        return True
 
+    def _start(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # First use, or a new event loop (e.g. a script's asyncio.run).
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=settings.KAFKA_EVENT_QUEUE_SIZE)
+            self._flusher = None
+        if self._flusher is None or self._flusher.done():
+            self._flusher = loop.create_task(self._flush_forever())
+        return self._queue
+
+    async def publish(self, message: dict[str, Any]) -> None:
+        if self._closing:
+            increment("kafka.events.dropped", reason="shutdown")
+            return
+        queue = self._start()
+        try:
+            queue.put_nowait(message)
+            return
+        except asyncio.QueueFull:
+            pass
+
+        if settings.KAFKA_EVENT_OVERFLOW_POLICY.lower() == "block":
+            increment("kafka.events.blocked")
+            try:
+                await asyncio.wait_for(
+                    queue.put(message), settings.KAFKA_EVENT_BLOCK_TIMEOUT_MS / 1000
+                )
+                return
+            except TimeoutError:
+                pass
+        increment("kafka.events.dropped", reason="queue_full")
+
+    async def _next_batch(self, queue: asyncio.Queue) -> list[dict[str, Any]]:
+        """Wait for an event, then gather more for up to the linger time."""
+        batch = [await queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.KAFKA_EVENT_LINGER_MS / 1000
+        while len(batch) < settings.KAFKA_EVENT_BATCH_SIZE:
+            if not queue.empty():
+                batch.append(queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0 or self._closing:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except TimeoutError:
+                break
+        return batch
+
+    async def _flush_forever(self) -> None:
+        queue = self._queue
+        while True:
+            batch = await self._next_batch(queue)
+            try:
+                await self._send(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _send(self, batch: list[dict[str, Any]]) -> None:
+        for _ in range(_PUBLISH_ATTEMPTS):
+            while not await self.connect():
+                if self._closing:
+                    increment("kafka.events.dropped", len(batch), reason="unavailable")
+                    return
+                await asyncio.sleep(max(self._retry_at - time.monotonic(), 0.05))
+
+            started = time.perf_counter()
+            try:
+                await self.broker.publish_batch(
+                    *batch, topic=settings.KAFKA_EVENTS_TOPIC
+                )
+            except Exception:
+                logger.warning("Kafka batch publish failed", exc_info=True)
+                # Reconnect (with backoff) before the next attempt.
+                self.connected = False
+                continue
+
+            increment("kafka.events.published", len(batch))
+            observe("kafka.events.batch_size", len(batch))
+            observe("kafka.events.flush_ms", (time.perf_counter() - started) * 1000)
+            return
+        increment("kafka.events.dropped", len(batch), reason="publish_failed")
+
+    async def close(self) -> None:
+        """Publish what is queued (within the flush timeout), then disconnect."""
+        self._closing = True
+        queue = self._queue
+        try:
+            if queue is not None:
+                if not queue.empty():
+                    # One last attempt, so a broker that has recovered gets them.
+                    await self.connect(force=True)
+                # Also waits for a batch that is being published.
+                try:
+                    await asyncio.wait_for(
+                        queue.join(), settings.KAFKA_FLUSH_TIMEOUT_SECONDS
+                    )
+                except TimeoutError:
+                    increment("kafka.events.dropped", queue.qsize(), reason="shutdown")
+            if self._flusher is not None:
+                self._flusher.cancel()
+                self._flusher = None
+            self._queue = None
+            self._loop = None
+
+            if self.connected:
+                try:
+                    await self.broker.close()
+                except Exception:
+                    logger.debug("Kafka close failed", exc_info=True)
+        finally:
+            self.connected = False
+            self._closing = False
+
+
+publisher = EventPublisher(broker)
 
-async def connect_kafka() -> bool:
-    global _kafka_started
 
+async def connect_kafka() -> bool:
     if not settings.ENABLE_KAFKA_EVENTS:
         return False
-    if _kafka_started:
-        return True
-
-    try:
-        await broker.connect()
-        _kafka_started = True
-        return True
-    except Exception as error:
-        logger.warning("Kafka broker unavailable: %s", error)
-        _kafka_started = False
-        return False
+    return await publisher.connect()
 
 
 async def close_kafka() -> None:
-    global _kafka_started
-    if not _kafka_started:
-        return
-
-    try:
-        await broker.close()
-    except Exception:
-        logger.debug("Kafka close failed", exc_info=True)
-    finally:
-        _kafka_started = False
+    await publisher.close()
 
 
 async def publish_event(event_type: str, payload: dict[str, Any]) -> None:
+    """Queue an event for Kafka; never waits for the broker."""
     if not settings.ENABLE_KAFKA_EVENTS:
         return
-    if not await connect_kafka():
-        return
-
-    message = {
-        "event_type": event_type,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "payload": payload,
-    }
 
-    try:
-        await broker.publish(message, topic=settings.KAFKA_EVENTS_TOPIC)
-    except Exception:
-        logger.debug("Kafka publish failed", exc_info=True)
+    await publisher.publish(
+        {
+            "event_type": event_type,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "payload": payload,
+        }
+    )
 
 
 async def kafka_health() -> dict[str, Any]:
     if not settings.ENABLE_KAFKA_EVENTS:
         return {"enabled": False, "connected": False}
 
-    connected = _kafka_started or await connect_kafka()
+    connected = await connect_kafka()
     return {
         "enabled": True,
         "connected": connected,
         "topic": settings.KAFKA_EVENTS_TOPIC,
+        "queued_events": publisher.queued,
     }
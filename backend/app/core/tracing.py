@@ -0,0 +1,515 @@
+"""Request tracing: lightweight spans, Server-Timing and OTLP export.
+
+``span(name)`` times a block (``with`` or ``async with``) as part of the
+trace of the request running it. The trace id is derived from the request id
+bound in ``request_id_ctx`` (or taken from an incoming ``traceparent``), so a
+trace and the request's log records correlate. Every finished span feeds the
+``span.duration_ms`` histogram, which ``/infra/spans`` reports per span name.
+
+TracingMiddleware adds a ``Server-Timing`` header that sums the spans which
+finished before the response started. When ``TRACING_OTLP_ENDPOINT`` is set,
+finished traces are queued and posted as OTLP/HTTP JSON in batches by a
+background task; a full queue or an unreachable collector drops traces rather
+than slowing requests down.
+
+Spans outside any request (or finishing after its response) only feed the
+histogram.
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import logging
+import os
+import random
+import re
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from typing import Any, Callable, Optional, TypeVar
+
+import httpx
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logging import request_id_ctx
+from app.core.metrics import histogram, histogram_snapshot, increment, observe
+from app.core.settings import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+SPAN_HISTOGRAM = "span.duration_ms"
+
+# Server-Timing entries per response, longest first
+_SERVER_TIMING_MAX_ENTRIES = 20
+_SERVER_TIMING_INVALID = re.compile(r"[^A-Za-z0-9!#$%&'*+.^_`|~-]")
+_TRACEPARENT = re.compile(r"[0-9a-f]{2}-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}")
+
+# OTLP span kinds and status codes
+_KIND_INTERNAL = 1
+_KIND_SERVER = 2
+_STATUS_UNSET = 0
+_STATUS_ERROR = 2
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Trace:
+    """Finished spans of one request."""
+
+    def __init__(self, trace_id: str, parent_span_id: Optional[str] = None):
+        self.trace_id = trace_id
+        self.parent_span_id = parent_span_id
+        self.spans: list["Span"] = []
+        self.root: Optional["Span"] = None
+        self.finished = False
+        # Spans also finish in worker threads (asyncio.to_thread).
+        self._lock = threading.Lock()
+
+    def add(self, span: "Span") -> None:
+        with self._lock:
+            if self.finished:
+                increment("tracing.spans.dropped", reason="late")
+            elif len(self.spans) >= settings.TRACING_MAX_SPANS_PER_TRACE:
+                increment("tracing.spans.dropped", reason="trace_full")
+            else:
+                self.spans.append(span)
+
+    def finish(self) -> list["Span"]:
+        with self._lock:
+            self.finished = True
+            return list(self.spans)
+
+    def server_timing(self, total_ms: float) -> str:
+        totals: dict[str, list[float]] = {}
+        with self._lock:
+            for span in self.spans:
+                entry = totals.setdefault(span.name, [0.0, 0])
+                entry[0] += span.duration_ms
+                entry[1] += 1
+
+        parts = [f"total;dur={total_ms:.1f}"]
+        longest = sorted(totals.items(), key=lambda item: item[1][0], reverse=True)
+        for name, (duration_ms, count) in longest[:_SERVER_TIMING_MAX_ENTRIES]:
+            description = name if count == 1 else f"{name} x{count}"
+            description = description.replace("\\", "\\\\").replace('"', '\\"')
+            parts.append(
+                f"{_SERVER_TIMING_INVALID.sub('_', name)};"
+                f'dur={duration_ms:.1f};desc="{description}"'
+            )
+        return ", ".join(parts)
+
+
+_trace_ctx: ContextVar[Optional[Trace]] = ContextVar("trace", default=None)
+_span_ctx: ContextVar[Optional["Span"]] = ContextVar("span", default=None)
+
+
+class Span:
+    """One timed operation; use via ``span()``."""
+
+    __slots__ = (
+        "name",
+        "attributes",
+        "trace",
+        "span_id",
+        "parent_id",
+        "kind",
+        "start_ns",
+        "duration_ms",
+        "error",
+        "_started",
+        "_token",
+    )
+
+    def __init__(self, name: str, attributes: dict[str, Any], kind: int):
+        self.name = name
+        self.attributes = attributes
+        self.trace = _trace_ctx.get()
+        parent = _span_ctx.get()
+        if parent is not None and parent.trace is self.trace:
+            self.parent_id = parent.span_id
+        else:
+            self.parent_id = self.trace.parent_span_id if self.trace else None
+        self.span_id = os.urandom(8).hex()
+        self.kind = kind
+        self.start_ns = 0
+        self.duration_ms = 0.0
+        self.error: Optional[str] = None
+        self._started = 0.0
+        self._token = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self._started) * 1000
+
+    def __enter__(self) -> "Span":
+        self._token = _span_ctx.set(self)
+        self.start_ns = time.time_ns()
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.duration_ms = self.elapsed_ms()
+        try:
+            _span_ctx.reset(self._token)
+        except ValueError:
+            # Exited in another context (e.g. a generator closed elsewhere).
+            pass
+        if exc_type is not None:
+            if issubclass(exc_type, asyncio.CancelledError):
+                self.error = "cancelled"
+            else:
+                self.error = f"{exc_type.__name__}: {exc}"
+        histogram(SPAN_HISTOGRAM, self.duration_ms, span=self.name)
+        if self.trace is not None:
+            self.trace.add(self)
+
+    async def __aenter__(self) -> "Span":
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, traceback) -> None:
+        self.__exit__(exc_type, exc, traceback)
+
+
+class _NoopSpan:
+    """Returned by ``span()`` while tracing is disabled."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def elapsed_ms(self) -> float:
+        return 0.0
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        pass
+
+    async def __aenter__(self) -> "_NoopSpan":
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def span(name: str, **attributes: Any) -> Span | _NoopSpan:
+    """Time a block as a span of the current request's trace.
+
+    Names should be static (e.g. "cache.get"): each gets its own histogram.
+    """
+    if not settings.TRACING_ENABLED:
+        return _NOOP_SPAN
+    return Span(name, attributes, _KIND_INTERNAL)
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """Decorator running every call of a function in a span."""
+
+    def decorate(func: F) -> F:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with span(name):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def _trace_id_for(request_id: str) -> str:
+    try:
+        return uuid.UUID(request_id).hex
+    except ValueError:
+        return hashlib.sha256(request_id.encode("utf-8")).hexdigest()[:32]
+
+
+def _header(scope: Scope, name: bytes) -> Optional[str]:
+    for key, value in scope["headers"]:
+        if key.lower() == name:
+            return value.decode("latin-1")
+    return None
+
+
+def _trace_ids(scope: Scope, request_id: str) -> tuple[str, Optional[str]]:
+    """Trace id and remote parent span id for a request."""
+    traceparent = _header(scope, b"traceparent")
+    if traceparent:
+        match = _TRACEPARENT.fullmatch(traceparent.strip().lower())
+        if match and match.group(1) != "0" * 32:
+            return match.group(1), match.group(2)
+    return _trace_id_for(request_id), None
+
+
+def _route_template(scope: Scope) -> Optional[str]:
+    """Path template of the route the router matched, if any."""
+    template = getattr(scope.get("route"), "path", None)
+    if template is None:
+        return None
+    # Routes of included routers may leave out the include prefix; it is the
+    # leading segments of the request path the template does not cover.
+    path = scope["path"]
+    missing = path.count("/") - template.count("/")
+    if missing > 0 and ":path}" not in template:
+        template = "/".join(path.split("/")[: missing + 1]) + template
+    return template
+
+
+def _root_span_name(scope: Scope) -> str:
+    # Unmatched paths are not used as names so they cannot flood the
+    # histograms.
+    return f"{scope['method']} {_route_template(scope) or 'unmatched'}"
+
+
+class TracingMiddleware:
+    """Traces each HTTP request and reports its spans in ``Server-Timing``."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.TRACING_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        request_id = request_id_ctx.get()
+        trace = Trace(*_trace_ids(scope, request_id))
+        trace_token = _trace_ctx.set(trace)
+        root = Span(
+            "http.request",
+            {
+                "http.method": scope["method"],
+                "http.target": scope["path"],
+                "request.id": request_id,
+            },
+            _KIND_SERVER,
+        )
+        trace.root = root
+
+        async def send_traced(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                root.set_attribute("http.status_code", message["status"])
+                if settings.TRACING_SERVER_TIMING:
+                    timing = trace.server_timing(root.elapsed_ms())
+                    message = {
+                        **message,
+                        "headers": [
+                            *message.get("headers", []),
+                            (b"server-timing", timing.encode("latin-1")),
+                        ],
+                    }
+            await send(message)
+
+        try:
+            with root:
+                try:
+                    await self.app(scope, receive, send_traced)
+                finally:
+                    root.name = _root_span_name(scope)
+        finally:
+            _trace_ctx.reset(trace_token)
+            _finish_trace(trace)
+
+
+def _finish_trace(trace: Trace) -> None:
+    spans = trace.finish()
+    if (
+        exporter is not None
+        and spans
+        and random.random() < settings.TRACING_EXPORT_SAMPLE_RATE
+    ):
+        exporter.submit(spans)
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_span(span: Span) -> dict[str, Any]:
+    entry: dict[str, Any] = {
+        "traceId": span.trace.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": span.kind,
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.start_ns + int(span.duration_ms * 1_000_000)),
+        "attributes": [
+            {"key": key, "value": _otlp_value(value)}
+            for key, value in span.attributes.items()
+        ],
+        "status": {"code": _STATUS_UNSET},
+    }
+    if span.parent_id:
+        entry["parentSpanId"] = span.parent_id
+    if span.error:
+        entry["status"] = {"code": _STATUS_ERROR, "message": span.error}
+    return entry
+
+
+def otlp_payload(traces: list[list[Span]]) -> dict[str, Any]:
+    """An OTLP/HTTP JSON ``ExportTraceServiceRequest`` for finished traces."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        {
+                            "key": "service.name",
+                            "value": {"stringValue": settings.APP_NAME},
+                        },
+                        {
+                            "key": "service.version",
+                            "value": {"stringValue": settings.APP_VERSION},
+                        },
+                    ]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": __name__},
+                        "spans": [
+                            _otlp_span(span) for spans in traces for span in spans
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class SpanExporter:
+    """Posts finished traces to an OTLP/HTTP collector in batches."""
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _start(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=settings.TRACING_EXPORT_QUEUE_SIZE)
+            self._client = None
+            self._flusher = None
+        if self._flusher is None or self._flusher.done():
+            self._flusher = loop.create_task(self._flush_forever())
+        return self._queue
+
+    def submit(self, spans: list[Span]) -> None:
+        try:
+            self._start().put_nowait(spans)
+        except asyncio.QueueFull:
+            increment("tracing.export.dropped", reason="queue_full")
+
+    async def _next_batch(self, queue: asyncio.Queue) -> list[list[Span]]:
+        """Wait for a trace, then gather more for up to the export interval."""
+        batch = [await queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.TRACING_EXPORT_INTERVAL_MS / 1000
+        while len(batch) < settings.TRACING_EXPORT_BATCH_SIZE:
+            if not queue.empty():
+                batch.append(queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except TimeoutError:
+                break
+        return batch
+
+    async def _flush_forever(self) -> None:
+        queue = self._queue
+        while True:
+            batch = await self._next_batch(queue)
+            try:
+                await self._post(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _post(self, batch: list[list[Span]]) -> None:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=settings.TRACING_OTLP_HEADERS,
+                timeout=settings.TRACING_EXPORT_TIMEOUT_SECONDS,
+            )
+        started = time.perf_counter()
+        try:
+            response = await self._client.post(self.endpoint, json=otlp_payload(batch))
+            response.raise_for_status()
+        except Exception as error:
+            increment("tracing.export.dropped", len(batch), reason="export_failed")
+            logger.warning("Trace export to %s failed: %s", self.endpoint, error)
+            return
+        increment("tracing.export.exported", len(batch))
+        observe("tracing.export.flush_ms", (time.perf_counter() - started) * 1000)
+
+    async def close(self) -> None:
+        """Export what is queued (within the export timeout), then stop."""
+        queue = self._queue
+        if queue is not None:
+            try:
+                await asyncio.wait_for(
+                    queue.join(), settings.TRACING_EXPORT_TIMEOUT_SECONDS
+                )
+            except TimeoutError:
+                increment("tracing.export.dropped", queue.qsize(), reason="shutdown")
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._queue = None
+        self._loop = None
+
+
+exporter = (
+    SpanExporter(settings.TRACING_OTLP_ENDPOINT)
+    if settings.TRACING_ENABLED and settings.TRACING_OTLP_ENDPOINT
+    else None
+)
+
+
+async def close_tracing() -> None:
+    if exporter is not None:
+        await exporter.close()
+
+
+def span_stats() -> list[dict[str, Any]]:
+    """Duration histograms per span name, by total time spent."""
+    stats = [
+        {"span": entry["labels"].get("span", ""), **entry}
+        for entry in histogram_snapshot(SPAN_HISTOGRAM)
+    ]
+    for entry in stats:
+        del entry["name"], entry["labels"]
+    return sorted(stats, key=lambda entry: entry["sum"], reverse=True)
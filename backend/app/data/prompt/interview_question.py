@@ -53,7 +53,94 @@ Return your response in the following JSON format:
     ]
 )
 
+INTERVIEW_QUESTION_BATCH_TEMPLATE = ChatPromptTemplate.from_messages(
+    [
+        ("system", INTERVIEW_QUESTION_SYSTEM),
+        (
+            "human",
+            """Generate a set of interview questions for the following context:
+
+Role: {role}
+Topic/Focus Area: {topic}
+
+Candidate Background:
+{candidate_background}
+
+Questions already asked in this interview (avoid repeating):
+{existing_questions}
+
+Generate exactly one question for each of these slots, in the same order:
+{question_slots}
+
+Each question must:
+1. Match the difficulty level and question type of its slot
+2. Test relevant skills for the {role} position
+3. Focus on the {topic} area
+4. Be clearly different from every other question in the set and from the questions already asked
+
+Return your response in the following JSON format:
+{{
+    "questions": [
+        {{
+            "slot": 1,
+            "question": "The interview question text",
+            "expected_keywords": ["keyword1", "keyword2", "keyword3"],
+            "follow_up_questions": ["Optional follow-up 1", "Optional follow-up 2"],
+            "evaluation_criteria": "Brief description of what makes a good answer"
+        }}
+    ]
+}}
+""",
+        ),
+    ]
+)
+
+INTERVIEW_FOLLOW_UP_TEMPLATE = ChatPromptTemplate.from_messages(
+    [
+        ("system", INTERVIEW_QUESTION_SYSTEM),
+        (
+            "human",
+            """Personalize the follow-up questions for the next question of this interview.
+
+Role: {role}
+
+Question the candidate just answered:
+{previous_question}
+
+Candidate's answer:
+{answer}
+
+Next question:
+{question}
+
+Its current follow-up questions:
+{follow_up_questions}
+
+Write up to 3 follow-up questions for the next question that:
+1. Build on projects, tools or claims from the candidate's answer where they are relevant to it
+2. Otherwise keep to the intent of the current follow-up questions
+3. Do not reveal or judge how well the candidate answered
+
+Return your response in the following JSON format:
+{{
+    "follow_up_questions": ["Follow-up 1", "Follow-up 2"]
+}}
+""",
+        ),
+    ]
+)
+
 
 def get_question_generation_prompt() -> ChatPromptTemplate:
     """Get the prompt template for question generation."""
     return INTERVIEW_QUESTION_TEMPLATE
+
+
+def get_batch_question_generation_prompt() -> ChatPromptTemplate:
+    """Get the prompt template for generating several questions in one call."""
+    return INTERVIEW_QUESTION_BATCH_TEMPLATE
+
+
+def get_follow_up_personalization_prompt() -> ChatPromptTemplate:
+    """Get the prompt template for personalizing follow-up questions."""
+    return INTERVIEW_FOLLOW_UP_TEMPLATE
@@ -1,10 +1,6 @@
 from contextlib import asynccontextmanager
-import json
-import logging
-import time
 
 from fastapi import Request
-from starlette.responses import Response
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -15,9 +11,12 @@ from app.core.logging import (
     bind_request_id,
     reset_request_id,
     setup_logging,
+    stop_logging,
 )
+from app.core.request_logging import RequestLoggingMiddleware
 from app.core.settings import get_settings
 from app.core.streaming import close_kafka, connect_kafka
+from app.core.tracing import TracingMiddleware, close_tracing
 from app.routes.ats import file_based_router as ats_file_based_router
 from app.routes.ats import text_based_router as ats_text_based_router
 from app.routes.cold_mail import file_based_router as cold_mail_file_based_router
@@ -50,6 +49,9 @@ from app.routes.tailored_resume import (
 from app.routes.jd_editor import router as jd_editor_router
 from app.routes.infrastructure import router as infrastructure_router
 from app.routes.tips import router as tips_router
+from app.services.interview.realtime import close_interview_channels
+from app.services.interview.sandbox_pool import close_sandbox_pools, start_sandbox_pools
+from app.services.interview.session_manager import get_session_manager
 
 settings = get_settings()
 
@@ -60,10 +62,17 @@ async def lifespan(app: FastAPI):
     setup_logging()
     await connect_redis_cache()
     await connect_kafka()
+    await get_session_manager().start()
+    await start_sandbox_pools()
     yield
     # Shutdown
+    close_interview_channels()
+    await close_sandbox_pools()
+    await get_session_manager().close()
     await close_redis_cache()
     await close_kafka()
+    await close_tracing()
+    stop_logging()
 
 
 app = FastAPI(
@@ -74,6 +83,12 @@ app = FastAPI(
 )
 
 
+# Added before the request id middleware so they run inside it and their
+# records and traces carry the request id.
+app.add_middleware(RequestLoggingMiddleware)
+app.add_middleware(TracingMiddleware)
+
+
 @app.middleware("http")
 async def request_id_middleware(request: Request, call_next):
     request_id = build_request_id(request.headers.get("X-Request-ID"))
@@ -86,71 +101,6 @@ async def request_id_middleware(request: Request, call_next):
     return response
 
 
-@app.middleware("http")
-async def request_response_logging_middleware(request: Request, call_next):
-    logger = logging.getLogger("app.request")
-    response_logger = logging.getLogger("app.response")
-    start_time = time.perf_counter()
-
-    request_body = await request.body()
-    request_payload = _format_payload(request_body, request.headers.get("content-type"))
-
-    logger.debug(
-        "request payload",
-        extra={
-            "method": request.method,
-            "path": request.url.path,
-            "query": request.url.query,
-            "payload": request_payload,
-        },
-    )
-
-    response = await call_next(request)
-
-    response_body = b""
-    async for chunk in response.body_iterator:
-        response_body += chunk
-
-    duration_ms = (time.perf_counter() - start_time) * 1000
-    response_payload = _format_payload(
-        response_body,
-        response.headers.get("content-type"),
-    )
-
-    response_logger.debug(
-        "response payload",
-        extra={
-            "method": request.method,
-            "path": request.url.path,
-            "status": response.status_code,
-            "duration_ms": round(duration_ms, 2),
-            "payload": response_payload,
-        },
-    )
-
-    return Response(
-        content=response_body,
-        status_code=response.status_code,
-        headers=dict(response.headers),
-        media_type=response.media_type,
-        background=response.background,
-    )
-
-
-def _format_payload(payload: bytes, content_type: str | None) -> str:
-    if not payload:
-        return ""
-    if content_type and "application/json" in content_type.lower():
-        try:
-            return json.dumps(json.loads(payload), ensure_ascii=True)
-        except (json.JSONDecodeError, UnicodeDecodeError):
-            pass
-    try:
-        return payload.decode("utf-8")
-    except UnicodeDecodeError:
-        return payload.decode("utf-8", errors="replace")
-
-
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
@@ -33,6 +33,7 @@ class AnalysisResponse(BaseModel):
     items_to_enrich: list[EnrichmentItem] = Field(default_factory=list)
     questions: list[EnrichmentQuestion] = Field(default_factory=list)
     analysis_summary: str | None = None
+    analysis_id: str | None = None
 
 
 class AnswerInput(BaseModel):
@@ -53,6 +54,7 @@ class EnhanceRequest(BaseModel):
 
     resume_data: ComprehensiveAnalysisData
     answers: list[AnswerInput]
+    analysis_id: str | None = None
 
 
 class EnhancedDescription(BaseModel):
@@ -106,6 +108,7 @@ class RegenerateRequest(BaseModel):
     items: list[RegenerateItemInput]
     instruction: str = Field(max_length=2000)
     output_language: str = "en"
+    analysis_id: str | None = None
 
 
 class RegeneratedItem(BaseModel):
@@ -161,3 +164,4 @@ class RefineEnhancementsRequest(BaseModel):
 
     resume_data: ComprehensiveAnalysisData
     refinements: list[RefinementInput]
+    analysis_id: str | None = None
@@ -91,6 +91,8 @@ class InterviewSession(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
+    # Optimistic concurrency token, bumped by the session store on every save
+    version: int = 0
 
 
 class InterviewEvent(BaseModel):
@@ -129,6 +131,8 @@ class CodeExecutionRequest(BaseModel):
     code: str
     language: str
     test_input: Optional[str] = None
+    # [{"input": "...", "expected": "..."}]; when set, test_input is ignored
+    test_cases: Optional[List[Dict[str, str]]] = None
 
 
 class InterviewEventRequest(BaseModel):
@@ -166,3 +170,8 @@ class CodeExecutionResult(BaseModel):
     execution_time_ms: int
     memory_usage_mb: Optional[float] = None
     test_results: Optional[List[Dict[str, Any]]] = None
+    # Stopped for writing more than the executor's output limit
+    truncated: bool = False
+    # Served from the execution cache; execution_time_ms is the original run's
+    cached: bool = False
+    cache_latency_ms: Optional[float] = None
@@ -1,7 +1,9 @@
 from fastapi import APIRouter
 
 from app.core.cache import redis_health
+from app.core.metrics import metrics_snapshot
 from app.core.streaming import kafka_health
+from app.core.tracing import span_stats
 
 router = APIRouter(prefix="/infra", tags=["Infrastructure"])
 
@@ -22,3 +24,13 @@ async def infrastructure_health() -> dict:
         "redis": redis_status,
         "kafka": kafka_status,
     }
+
+
+@router.get("/metrics")
+async def infrastructure_metrics() -> dict:
+    return metrics_snapshot()
+
+
+@router.get("/spans")
+async def infrastructure_spans() -> dict:
+    return {"spans": span_stats()}
@@ -1,12 +1,24 @@
-"""Interview API routes with SSE streaming support."""
+"""Interview API routes with SSE and WebSocket streaming support."""
 
+import asyncio
 import json
-
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Request,
+    WebSocket,
+    WebSocketDisconnect,
+)
 from fastapi.responses import StreamingResponse
 from langchain_core.language_models import BaseChatModel
 
 from app.core.deps import get_request_llm
+from app.core.metrics import increment
+from app.core.sse import sse_generator
 from app.models.interview.enums import InterviewEventType
 from app.models.interview.schemas import (
     CodeExecutionRequest,
@@ -18,26 +30,16 @@ from app.models.interview.schemas import (
 )
 from app.models.interview.templates import get_template, list_templates
 from app.services.interview.graph import get_interview_graph
+from app.services.interview.realtime import (
+    get_interview_channel,
+    send_channel_messages,
+)
 from app.services.interview.session_manager import get_session_manager
+from app.services.interview.session_store import SessionConflictError
 
 router = APIRouter(prefix="/interview", tags=["Digital Interviewer"])
 
 
-# ============== Helper Functions ==============
-
-
-async def sse_generator(async_gen):
-    """Convert async generator to SSE format."""
-    try:
-        async for data in async_gen:
-            event_type = data.get("type", "message")
-            json_data = json.dumps(data)
-            yield f"event: {event_type}\ndata: {json_data}\n\n"
-    except Exception as e:
-        error_data = json.dumps({"type": "error", "message": str(e)})
-        yield f"event: error\ndata: {error_data}\n\n"
-
-
 # ============== Template Endpoints ==============
 
 
@@ -90,6 +92,39 @@ async def create_interview_session(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/sessions/stream")
+async def create_interview_session_streaming(
+    request: CreateInterviewRequest,
+    http_request: Request,
+    llm: BaseChatModel = Depends(get_request_llm),
+):
+    """Create an interview session and stream questions as they are generated.
+
+    The session becomes usable as soon as the first question is ready.
+
+    SSE Events:
+    - session: The session with its first question
+    - question: Each following question, in order
+    - complete: All questions have been generated
+    - error: Error message
+    """
+    graph = get_interview_graph(llm=llm)
+    async_gen = graph.create_session_streaming(
+        profile=request.profile,
+        config=request.config,
+    )
+
+    return StreamingResponse(
+        sse_generator(async_gen, http_request),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 @router.get("/sessions/{session_id}", response_model=InterviewSessionResponse)
 async def get_interview_session(session_id: str):
     """Get an interview session by ID."""
@@ -156,6 +191,7 @@ async def submit_answer(
     session_id: str,
     request: SubmitAnswerRequest,
     llm: BaseChatModel = Depends(get_request_llm),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
 ):
     """Submit an answer for evaluation (non-streaming).
 
@@ -167,6 +203,7 @@ async def submit_answer(
             session_id=session_id,
             question_id=request.question_id,
             answer=request.answer,
+            idempotency_key=idempotency_key,
         )
 
         return {
@@ -179,6 +216,8 @@ async def submit_answer(
             else None,
             "is_complete": result["is_complete"],
         }
+    except SessionConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -189,7 +228,9 @@ async def submit_answer(
 async def submit_answer_streaming(
     session_id: str,
     request: SubmitAnswerRequest,
+    http_request: Request,
     llm: BaseChatModel = Depends(get_request_llm),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
 ):
     """Submit an answer with SSE streaming evaluation.
 
@@ -211,10 +252,11 @@ async def submit_answer_streaming(
         session_id=session_id,
         question_id=request.question_id,
         answer=request.answer,
+        idempotency_key=idempotency_key,
     )
 
     return StreamingResponse(
-        sse_generator(async_gen),
+        sse_generator(async_gen, http_request),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -232,6 +274,7 @@ async def execute_code(
     session_id: str,
     request: CodeExecutionRequest,
     llm: BaseChatModel = Depends(get_request_llm),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
 ):
     """Execute code for a coding question (non-streaming).
 
@@ -245,9 +288,13 @@ async def execute_code(
             code=request.code,
             language=request.language,
             test_input=request.test_input,
+            test_cases=request.test_cases,
+            idempotency_key=idempotency_key,
         )
 
         return result.model_dump()
+    except SessionConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -258,13 +305,17 @@ async def execute_code(
 async def execute_code_streaming(
     session_id: str,
     request: CodeExecutionRequest,
+    http_request: Request,
     llm: BaseChatModel = Depends(get_request_llm),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
 ):
     """Execute code with SSE streaming evaluation.
 
     First returns execution result, then streams code review.
 
     SSE Events:
+    - output: Program output while it runs (stream, content)
+    - test_result: One test case result, as it finishes (with test_cases)
     - execution: Code execution result (success, stdout, stderr)
     - chunk: Partial code review text
     - complete: Final result with score and next question
@@ -282,10 +333,12 @@ async def execute_code_streaming(
         code=request.code,
         language=request.language,
         test_input=request.test_input,
+        test_cases=request.test_cases,
+        idempotency_key=idempotency_key,
     )
 
     return StreamingResponse(
-        sse_generator(async_gen),
+        sse_generator(async_gen, http_request),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -312,6 +365,7 @@ async def skip_question(
     session_id: str,
     question_id: str,
     llm: BaseChatModel = Depends(get_request_llm),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
 ):
     """Skip the current question.
 
@@ -322,6 +376,7 @@ async def skip_question(
         result = await graph.skip_question(
             session_id=session_id,
             question_id=question_id,
+            idempotency_key=idempotency_key,
         )
 
         return {
@@ -331,6 +386,8 @@ async def skip_question(
             else None,
             "is_complete": result["is_complete"],
         }
+    except SessionConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -377,6 +434,8 @@ async def get_interview_summary(
             "session_id": session_id,
             **summary_data,
         }
+    except SessionConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -386,6 +445,7 @@ async def get_interview_summary(
 @router.post("/sessions/{session_id}/summary/stream")
 async def generate_summary_streaming(
     session_id: str,
+    http_request: Request,
     llm: BaseChatModel = Depends(get_request_llm),
 ):
     """Generate interview summary with SSE streaming.
@@ -404,7 +464,7 @@ async def generate_summary_streaming(
     async_gen = graph.generate_summary_streaming(session_id)
 
     return StreamingResponse(
-        sse_generator(async_gen),
+        sse_generator(async_gen, http_request),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -429,6 +489,11 @@ async def record_interview_event(session_id: str, request: InterviewEventRequest
     if not session:
         raise HTTPException(status_code=404, detail=f"Session not found: {session_id}")
 
+    return await _record_event(session_id, request)
+
+
+async def _record_event(session_id: str, request: InterviewEventRequest) -> dict:
+    manager = get_session_manager()
     event = InterviewEvent(
         session_id=session_id,
         event_type=request.event_type,
@@ -480,6 +545,177 @@ async def get_interview_events(
     }
 
 
+# ============== WebSocket Endpoint ==============
+
+
+async def _ws_session_state(graph, session_id: str) -> dict:
+    session = await graph.get_session(session_id)
+    if not session:
+        raise ValueError(f"Session not found: {session_id}")
+    current_question = await graph.get_current_question(session)
+    return InterviewSessionResponse(
+        session=session,
+        current_question=current_question,
+    ).model_dump(mode="json")
+
+
+async def _ws_submit_answer(graph, session_id: str, message: dict):
+    request = SubmitAnswerRequest.model_validate(message)
+    async for event in graph.submit_answer_streaming(
+        session_id=session_id,
+        question_id=request.question_id,
+        answer=request.answer,
+        idempotency_key=message.get("idempotency_key"),
+    ):
+        yield event
+
+
+async def _ws_execute_code(graph, session_id: str, message: dict):
+    request = CodeExecutionRequest.model_validate(message)
+    arguments = dict(
+        session_id=session_id,
+        question_id=request.question_id,
+        code=request.code,
+        language=request.language,
+        test_input=request.test_input,
+        test_cases=request.test_cases,
+        idempotency_key=message.get("idempotency_key"),
+    )
+    if message.get("submit"):
+        async for event in graph.execute_code_streaming(**arguments):
+            yield event
+        return
+    result = await graph.execute_code(**arguments)
+    yield {"type": "execution", **result.model_dump(mode="json")}
+
+
+async def _ws_skip(graph, session_id: str, message: dict):
+    result = await graph.skip_question(
+        session_id=session_id,
+        question_id=str(message["question_id"]),
+        idempotency_key=message.get("idempotency_key"),
+    )
+    yield {
+        "type": "skipped",
+        "next_question": result["next_question"].model_dump(mode="json")
+        if result["next_question"]
+        else None,
+        "is_complete": result["is_complete"],
+    }
+
+
+async def _ws_event(graph, session_id: str, message: dict):
+    request = InterviewEventRequest.model_validate(message)
+    yield {"type": "event_recorded", **await _record_event(session_id, request)}
+
+
+async def _ws_get_session(graph, session_id: str, message: dict):
+    yield {"type": "session", **await _ws_session_state(graph, session_id)}
+
+
+async def _ws_summary(graph, session_id: str, message: dict):
+    async for event in graph.generate_summary_streaming(session_id):
+        yield event
+
+
+_WS_OPERATIONS = {
+    "submit_answer": _ws_submit_answer,
+    "execute_code": _ws_execute_code,
+    "skip": _ws_skip,
+    "event": _ws_event,
+    "get_session": _ws_get_session,
+    "summary": _ws_summary,
+}
+
+
+@router.websocket("/sessions/{session_id}/ws")
+async def interview_websocket(
+    websocket: WebSocket,
+    session_id: str,
+    resume_from: Optional[int] = None,
+    llm: BaseChatModel = Depends(get_request_llm),
+):
+    """Run an interview over one WebSocket instead of a request per action.
+
+    Client messages are JSON objects with a ``type`` and an ``id`` chosen by
+    the client; requests run concurrently and every message they produce
+    carries that ``id``, followed by ``done``:
+    - submit_answer: question_id, answer (streams chunk ... complete)
+    - execute_code: question_id, code, language, test_input, test_cases;
+      with ``submit: true`` it is reviewed and scored like /code/stream,
+      otherwise it only runs (execution)
+    - skip: question_id (skipped)
+    - event: event_type, metadata, for proctoring (event_recorded)
+    - get_session (session)
+    - summary (streams chunk ... complete)
+    - cancel: ``target`` is the id of a running request (cancelled)
+    submit_answer, execute_code and skip accept an ``idempotency_key``.
+
+    Every server message has a ``seq``. After a reconnect, pass the last one
+    seen as ``resume_from`` to receive what was missed; the first message is
+    ``connected`` with ``resumed`` telling whether that worked. When it did
+    not, it carries the session state and unfinished requests should be
+    resent with their idempotency keys.
+    """
+    graph = get_interview_graph(llm=llm)
+    if not await graph.get_session(session_id):
+        await websocket.close(code=4404, reason=f"Session not found: {session_id}")
+        return
+
+    await websocket.accept()
+    channel = get_interview_channel(session_id)
+    outbox, replay = channel.attach(resume_from)
+    sender = asyncio.create_task(send_channel_messages(websocket, outbox, replay))
+    resumed = replay is not None
+    increment(
+        "interview.ws.connections",
+        outcome="resumed" if resumed else "resync" if resume_from else "new",
+    )
+    try:
+        connected = {"type": "connected", "resumed": resumed}
+        if not resumed:
+            connected.update(await _ws_session_state(graph, session_id))
+        await channel.emit(connected)
+
+        while True:
+            try:
+                message = json.loads(await websocket.receive_text())
+                kind = message["type"]
+                request_id = str(message["id"])
+            except (ValueError, TypeError, KeyError):
+                await channel.emit(
+                    {
+                        "type": "error",
+                        "message": "Messages must be JSON objects with a type and an id",
+                    }
+                )
+                continue
+
+            operation = _WS_OPERATIONS.get(kind)
+            known = operation is not None or kind == "cancel"
+            increment("interview.ws.messages", type=kind if known else "unknown")
+            if kind == "cancel":
+                target = str(message.get("target"))
+                if channel.cancel(target):
+                    await channel.emit({"id": target, "type": "cancelled"})
+                continue
+            if operation is None:
+                await channel.emit(
+                    {
+                        "id": request_id,
+                        "type": "error",
+                        "message": f"Unknown message type: {kind}",
+                    }
+                )
+                continue
+            channel.start(request_id, operation(graph, session_id, message))
+    except WebSocketDisconnect:
+        pass
+    finally:
+        channel.detach(outbox)
+        sender.cancel()
+
+
 # ============== Health/Stats Endpoints ==============
 
 
@@ -489,5 +725,6 @@ async def interview_health():
     manager = get_session_manager()
     return {
         "status": "healthy",
-        "active_sessions": manager.get_session_count(),
+        "session_backend": manager.backend_name,
+        "active_sessions": await manager.get_session_count(),
     }
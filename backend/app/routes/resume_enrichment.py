@@ -1,9 +1,11 @@
 """AI-powered resume enrichment endpoints using structured resume data."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from langchain_core.language_models import BaseChatModel
 
 from app.core.deps import get_request_llm
+from app.core.sse import sse_generator
 from app.models.enrichment.schemas import (
     AnalyzeRequest,
     AnalysisResponse,
@@ -22,6 +24,8 @@ from app.services.enrichment import (
     generate_enhancements_preview,
     refine_enhancements,
     regenerate_items,
+    stream_enhancements_preview,
+    stream_refined_enhancements,
 )
 
 router = APIRouter()
@@ -55,6 +59,32 @@ async def generate_enhancements(
     )
 
 
+@router.post(
+    "/resume/enrichment/enhance/stream",
+    summary="Stream enhanced descriptions as each item is ready.",
+)
+async def stream_enhancements(
+    request: EnhanceRequest,
+    http_request: Request,
+    llm: BaseChatModel = Depends(get_request_llm),
+) -> StreamingResponse:
+    """SSE events: enhancement, item_error, complete, error."""
+    async_gen = stream_enhancements_preview(
+        resume_data=request.resume_data.model_dump(),
+        request=request,
+        llm=llm,
+    )
+    return StreamingResponse(
+        sse_generator(async_gen, http_request),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 @router.post(
     "/resume/enrichment/refine",
     response_model=EnhancementPreview,
@@ -71,6 +101,32 @@ async def refine_rejected_enhancements(
     )
 
 
+@router.post(
+    "/resume/enrichment/refine/stream",
+    summary="Stream refined enhancements as each item is ready.",
+)
+async def stream_refined(
+    request: RefineEnhancementsRequest,
+    http_request: Request,
+    llm: BaseChatModel = Depends(get_request_llm),
+) -> StreamingResponse:
+    """SSE events: enhancement, item_error, complete, error."""
+    async_gen = stream_refined_enhancements(
+        resume_data=request.resume_data.model_dump(),
+        request=request,
+        llm=llm,
+    )
+    return StreamingResponse(
+        sse_generator(async_gen, http_request),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 @router.post(
     "/resume/enrichment/apply",
     summary="Apply enhancements to resume data.",
@@ -14,6 +14,7 @@ from langgraph.prebuilt import ToolNode, tools_condition
 
 from app.agents.web_content_agent import return_markdown
 from app.core.llm import MODEL_NAME, get_llm
+from app.core.tracing import span
 from app.data.prompt.jd_evaluator import jd_evaluator_prompt_template as ATS_PROMPT
 
 
@@ -86,7 +87,8 @@ class ATSEvaluatorGraph:
     def agent(self, state: MessagesState):
         msgs = state["messages"]
         inp = [*self.system_prompt] + msgs
-        response = self.llm_with_tools.invoke(inp)
+        with span("graph.ats_evaluator.agent"):
+            response = self.llm_with_tools.invoke(inp)
         return {"messages": [response]}
 
     def build(self):
@@ -133,15 +135,16 @@ def evaluate_ats(
         llm=llm,
     )()
 
-    resp = graph.invoke(
-        {
-            "messages": [
-                HumanMessage(
-                    content=("Return JSON first (no preamble)."),
-                )
-            ]
-        }
-    )
+    with span("graph.ats_evaluator.run"):
+        resp = graph.invoke(
+            {
+                "messages": [
+                    HumanMessage(
+                        content=("Return JSON first (no preamble)."),
+                    )
+                ]
+            }
+        )
     content = resp.get("messages", [])[-1].content if resp else ""
     if not isinstance(content, str):
         content = str(content)
@@ -1,6 +1,5 @@
 """Cover letter, outreach message, and resume title generation service."""
 
-import json
 from typing import Any, Optional
 
 from langchain_core.language_models import BaseChatModel
@@ -8,6 +7,7 @@ from langchain_core.language_models import BaseChatModel
 from app.agents.web_content_agent import return_markdown
 from app.services.language import get_language_name
 from app.services.llm_helpers import llm_invoke_text_async
+from app.services.prompt_context import render_resume_context
 
 
 def _resolve_job_description(job_description: str, jd_url: Optional[str]) -> str:
@@ -38,7 +38,7 @@ IMPORTANT: Write in {output_language}.
 Job Description:
 {job_description}
 
-Candidate Resume (JSON):
+Candidate Resume:
 {resume_data}
 
 Recipient: {recipient_name} at {company_name}
@@ -76,7 +76,7 @@ Edit Instructions (FOLLOW THESE STRICTLY):
 Job Description:
 {job_description}
 
-Candidate Resume (JSON):
+Candidate Resume:
 {resume_data}
 
 Recipient: {recipient_name} at {company_name}
@@ -104,7 +104,7 @@ IMPORTANT: Write in {output_language}.
 Job Description:
 {job_description}
 
-Candidate Resume (JSON):
+Candidate Resume:
 {resume_data}
 
 Guidelines:
@@ -154,7 +154,7 @@ async def generate_cover_letter(
 
     prompt = COVER_LETTER_PROMPT.format(
         job_description=resolved_jd,
-        resume_data=json.dumps(resume_data, indent=2, ensure_ascii=True),
+        resume_data=render_resume_context(resume_data, label="cover_letter_generate"),
         output_language=output_language,
         recipient_name=recipient_name or "Hiring Manager",
         company_name=company_name or "the company",
@@ -195,7 +195,7 @@ async def edit_cover_letter(
         previous_cover_letter=previous_cover_letter,
         edit_instructions=edit_instructions,
         job_description=resolved_jd,
-        resume_data=json.dumps(resume_data, indent=2, ensure_ascii=True),
+        resume_data=render_resume_context(resume_data, label="cover_letter_edit"),
         output_language=output_language,
         recipient_name=recipient_name or "Hiring Manager",
         company_name=company_name or "the company",
@@ -224,7 +224,7 @@ async def generate_outreach_message(
 
     prompt = OUTREACH_MESSAGE_PROMPT.format(
         job_description=job_description,
-        resume_data=json.dumps(resume_data, indent=2, ensure_ascii=True),
+        resume_data=render_resume_context(resume_data, label="cover_letter_outreach"),
         output_language=output_language,
     )
 
@@ -1,11 +1,18 @@
 """AI-powered resume enrichment endpoints service helpers."""
 
-import asyncio
 import copy
+import hashlib
 import json
 import logging
 import re
-
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, Awaitable
+from uuid import uuid4
+
+from app.core.cache import build_cache_key, get_cached_json, set_cached_json
+from app.core.concurrency import as_completed_limited, gather_limited
+from app.core.settings import get_settings
 from app.data.prompt.enrichment import (
     ANALYZE_RESUME_PROMPT,
     ENHANCE_DESCRIPTION_PROMPT,
@@ -32,6 +39,7 @@ from app.models.enrichment.schemas import (
 )
 from app.services.language import get_language_name
 from app.services.llm_helpers import llm_complete_json_async
+from app.services.prompt_context import compact_json, render_resume_context
 
 _WORK_ITEM_PATTERN = re.compile(r"^experience-(\d+)$")
 _PROJECT_ITEM_PATTERN = re.compile(r"^project-(\d+)$")
@@ -223,6 +231,98 @@ def _map_enrichment_item_id(item_id: str) -> tuple[str, int | None]:
 
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_ANALYSIS_CACHE_NAMESPACE = "enrichment_analysis"
+_LOCAL_ANALYSIS_LIMIT = 256
+
+# Process-local copy of stored analyses so the flow still works without Redis.
+_local_analyses: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+
+def _fingerprint_enrichment_payload(enrich_payload: dict) -> str:
+    serialized = json.dumps(enrich_payload, ensure_ascii=True, sort_keys=True)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+async def _store_analysis(fingerprint: str, analysis_result: dict) -> str:
+    """Persist an analysis result and return the ID clients pass to later steps."""
+    analysis_id = uuid4().hex
+    ttl = settings.ENRICHMENT_ANALYSIS_TTL_SECONDS
+    record = {"fingerprint": fingerprint, "result": analysis_result}
+
+    _local_analyses[analysis_id] = (time.monotonic() + ttl, record)
+    while len(_local_analyses) > _LOCAL_ANALYSIS_LIMIT:
+        _local_analyses.popitem(last=False)
+
+    await set_cached_json(
+        build_cache_key(_ANALYSIS_CACHE_NAMESPACE, analysis_id),
+        record,
+        ttl_seconds=ttl,
+    )
+    return analysis_id
+
+
+async def _load_analysis(
+    analysis_id: str | None,
+    fingerprint: str | None = None,
+) -> dict | None:
+    """Return a stored analysis result, or None if missing, expired or stale.
+
+    When ``fingerprint`` is given the stored analysis must have been computed
+    from the same resume content, otherwise callers re-run the analysis.
+    """
+    if not analysis_id:
+        return None
+
+    record: dict | None = None
+    local = _local_analyses.get(analysis_id)
+    if local is not None:
+        expires_at, local_record = local
+        if expires_at > time.monotonic():
+            record = local_record
+        else:
+            _local_analyses.pop(analysis_id, None)
+
+    if record is None:
+        record = await get_cached_json(
+            build_cache_key(_ANALYSIS_CACHE_NAMESPACE, analysis_id)
+        )
+
+    if not record:
+        logger.info("Enrichment analysis %s not found or expired", analysis_id)
+        return None
+
+    if fingerprint is not None and record.get("fingerprint") != fingerprint:
+        logger.info("Enrichment analysis %s is stale for this resume", analysis_id)
+        return None
+
+    result = record.get("result")
+    return result if isinstance(result, dict) else None
+
+
+def _analysis_items_by_id(analysis_result: dict | None) -> dict[str, dict]:
+    if not analysis_result:
+        return {}
+    return {
+        item.get("item_id", ""): item
+        for item in analysis_result.get("items_to_enrich", [])
+        if isinstance(item, dict)
+    }
+
+
+async def _run_analysis(
+    enrich_payload: dict,
+    output_language: str,
+    *,
+    llm,
+) -> dict:
+    resume_json = compact_json(enrich_payload, label="enrichment_analysis")
+    prompt = ANALYZE_RESUME_PROMPT.format(
+        resume_json=resume_json,
+        output_language=output_language,
+    )
+    return await llm_complete_json_async(llm=llm, prompt=prompt, max_tokens=8192)
 
 
 async def analyze_resume_enrichment(
@@ -232,15 +332,12 @@ async def analyze_resume_enrichment(
     language: str = "en",
 ) -> AnalysisResponse:
     enrich_payload = _build_enrichment_payload(resume_data)
-    resume_json = json.dumps(enrich_payload, indent=2, ensure_ascii=True)
     output_language = get_language_name(language)
-    prompt = ANALYZE_RESUME_PROMPT.format(
-        resume_json=resume_json,
-        output_language=output_language,
+    result = await _run_analysis(enrich_payload, output_language, llm=llm)
+    analysis_id = await _store_analysis(
+        _fingerprint_enrichment_payload(enrich_payload), result
     )
 
-    result = await llm_complete_json_async(llm=llm, prompt=prompt, max_tokens=8192)
-
     items_to_enrich = [
         EnrichmentItem(
             item_id=item.get("item_id", f"item_{i}"),
@@ -267,29 +364,51 @@ async def analyze_resume_enrichment(
         items_to_enrich=items_to_enrich,
         questions=questions,
         analysis_summary=result.get("analysis_summary"),
+        analysis_id=analysis_id,
     )
 
 
-async def generate_enhancements_preview(
+async def _generate_additional_bullets(
+    *,
+    llm,
+    prompt: str,
+    item_id: str,
+    item_type: str,
+    title: str,
+    original_description: list[str],
+) -> EnhancedDescription:
+    result = await llm_complete_json_async(llm=llm, prompt=prompt)
+    additional_bullets = result.get("additional_bullets", [])
+    if not additional_bullets:
+        additional_bullets = result.get("enhanced_description", [])
+
+    return EnhancedDescription(
+        item_id=item_id,
+        item_type=item_type,
+        title=title,
+        original_description=original_description,
+        enhanced_description=additional_bullets,
+    )
+
+
+async def _build_enhancement_jobs(
     resume_data: dict,
     request: EnhanceRequest,
     *,
     llm,
-    language: str = "en",
-) -> EnhancementPreview:
+    language: str,
+) -> list[tuple[str, Awaitable[EnhancedDescription]]]:
     enrich_payload = _build_enrichment_payload(resume_data)
-    resume_json = json.dumps(enrich_payload, indent=2, ensure_ascii=True)
     output_language = get_language_name(language)
-    analysis_prompt = ANALYZE_RESUME_PROMPT.format(
-        resume_json=resume_json,
-        output_language=output_language,
-    )
 
-    analysis_result = await llm_complete_json_async(
-        llm=llm,
-        prompt=analysis_prompt,
-        max_tokens=8192,
+    # Reuse the analysis from the previous step; only re-analyze when the
+    # client has no analysis ID or the resume changed since it was produced.
+    analysis_result = await _load_analysis(
+        request.analysis_id,
+        _fingerprint_enrichment_payload(enrich_payload),
     )
+    if analysis_result is None:
+        analysis_result = await _run_analysis(enrich_payload, output_language, llm=llm)
 
     question_to_item: dict[str, str] = {}
     question_details: dict[str, dict] = {}
@@ -310,9 +429,9 @@ async def generate_enhancements_preview(
             answers_by_item.setdefault(item_id, []).append(answer)
 
     # Build full resume context string (condensed for the LLM)
-    resume_context = json.dumps(resume_data, indent=1, ensure_ascii=False)
+    resume_context = render_resume_context(resume_data, label="enrichment_enhance")
 
-    enhancements: list[EnhancedDescription] = []
+    jobs: list[tuple[str, Awaitable[EnhancedDescription]]] = []
 
     for item_id, answers in answers_by_item.items():
         item = item_details.get(item_id, {})
@@ -368,41 +487,47 @@ async def generate_enhancements_preview(
             output_language=output_language,
         )
 
-        try:
-            result = await llm_complete_json_async(llm=llm, prompt=prompt)
-            additional_bullets = result.get("additional_bullets", [])
-            if not additional_bullets:
-                additional_bullets = result.get("enhanced_description", [])
-
-            enhancements.append(
-                EnhancedDescription(
+        jobs.append(
+            (
+                item_id,
+                _generate_additional_bullets(
+                    llm=llm,
+                    prompt=prompt,
                     item_id=item_id,
                     item_type=item.get("item_type", "experience"),
                     title=item.get("title", ""),
                     original_description=current_desc,
-                    enhanced_description=additional_bullets,
-                )
+                ),
             )
-        except Exception as error:
-            logger.warning("Failed to enhance item %s: %s", item_id, error)
+        )
 
-    return EnhancementPreview(enhancements=enhancements)
+    return jobs
 
 
-async def refine_enhancements(
+async def _build_refinement_jobs(
     resume_data: dict,
     request: RefineEnhancementsRequest,
     *,
     llm,
-    language: str = "en",
-) -> EnhancementPreview:
-    """Re-generate rejected enhancements using user feedback."""
+    language: str,
+) -> list[tuple[str, Awaitable[EnhancedDescription]]]:
     output_language = get_language_name(language)
-    resume_context = json.dumps(resume_data, indent=1, ensure_ascii=False)
+    resume_context = render_resume_context(resume_data, label="enrichment_refine")
+    analysis_items = _analysis_items_by_id(
+        await _load_analysis(
+            request.analysis_id,
+            _fingerprint_enrichment_payload(_build_enrichment_payload(resume_data)),
+        )
+    )
 
-    enhancements: list[EnhancedDescription] = []
+    jobs: list[tuple[str, Awaitable[EnhancedDescription]]] = []
 
     for refinement in request.refinements:
+        subtitle = (
+            refinement.subtitle
+            or analysis_items.get(refinement.item_id, {}).get("subtitle")
+            or ""
+        )
         current_desc_text = (
             "\n".join(f"- {d}" for d in refinement.original_description)
             if refinement.original_description
@@ -418,7 +543,7 @@ async def refine_enhancements(
         prompt = REFINE_ENHANCEMENT_PROMPT.format(
             item_type=refinement.item_type,
             title=refinement.title,
-            subtitle=refinement.subtitle or "",
+            subtitle=subtitle,
             current_description=current_desc_text,
             rejected_bullets=rejected_bullets_text,
             user_feedback=refinement.user_feedback,
@@ -426,27 +551,125 @@ async def refine_enhancements(
             output_language=output_language,
         )
 
-        try:
-            result = await llm_complete_json_async(llm=llm, prompt=prompt)
-            additional_bullets = result.get("additional_bullets", [])
-            if not additional_bullets:
-                additional_bullets = result.get("enhanced_description", [])
-
-            enhancements.append(
-                EnhancedDescription(
+        jobs.append(
+            (
+                refinement.item_id,
+                _generate_additional_bullets(
+                    llm=llm,
+                    prompt=prompt,
                     item_id=refinement.item_id,
                     item_type=refinement.item_type,
                     title=refinement.title,
                     original_description=refinement.original_description,
-                    enhanced_description=additional_bullets,
-                )
+                ),
             )
-        except Exception as error:
-            logger.warning("Failed to refine item %s: %s", refinement.item_id, error)
+        )
+
+    return jobs
+
+
+async def _collect_enhancements(
+    jobs: list[tuple[str, Awaitable[EnhancedDescription]]],
+    *,
+    action: str,
+) -> EnhancementPreview:
+    results = await gather_limited(job for _, job in jobs)
+
+    enhancements: list[EnhancedDescription] = []
+    for (item_id, _), result in zip(jobs, results):
+        if isinstance(result, Exception):
+            logger.warning("Failed to %s item %s: %s", action, item_id, result)
+            continue
+        enhancements.append(result)
 
     return EnhancementPreview(enhancements=enhancements)
 
 
+async def _stream_enhancements(
+    jobs: list[tuple[str, Awaitable[EnhancedDescription]]],
+    *,
+    action: str,
+) -> AsyncIterator[dict]:
+    completed = 0
+    async for index, result in as_completed_limited(job for _, job in jobs):
+        item_id = jobs[index][0]
+        if isinstance(result, Exception):
+            logger.warning("Failed to %s item %s: %s", action, item_id, result)
+            yield {
+                "type": "item_error",
+                "index": index,
+                "item_id": item_id,
+                "message": f"Failed to {action} this item. Please try again.",
+            }
+            continue
+
+        completed += 1
+        yield {
+            "type": "enhancement",
+            "index": index,
+            "enhancement": result.model_dump(),
+        }
+
+    yield {"type": "complete", "total": len(jobs), "completed": completed}
+
+
+async def generate_enhancements_preview(
+    resume_data: dict,
+    request: EnhanceRequest,
+    *,
+    llm,
+    language: str = "en",
+) -> EnhancementPreview:
+    jobs = await _build_enhancement_jobs(
+        resume_data, request, llm=llm, language=language
+    )
+    return await _collect_enhancements(jobs, action="enhance")
+
+
+async def stream_enhancements_preview(
+    resume_data: dict,
+    request: EnhanceRequest,
+    *,
+    llm,
+    language: str = "en",
+) -> AsyncIterator[dict]:
+    """Yield each enhanced description as soon as its LLM call finishes."""
+    jobs = await _build_enhancement_jobs(
+        resume_data, request, llm=llm, language=language
+    )
+    async for event in _stream_enhancements(jobs, action="enhance"):
+        yield event
+
+
+async def refine_enhancements(
+    resume_data: dict,
+    request: RefineEnhancementsRequest,
+    *,
+    llm,
+    language: str = "en",
+) -> EnhancementPreview:
+    """Re-generate rejected enhancements using user feedback."""
+    jobs = await _build_refinement_jobs(
+        resume_data, request, llm=llm, language=language
+    )
+    return await _collect_enhancements(jobs, action="refine")
+
+
+async def stream_refined_enhancements(
+    resume_data: dict,
+    request: RefineEnhancementsRequest,
+    *,
+    llm,
+    language: str = "en",
+) -> AsyncIterator[dict]:
+    """Yield each refined enhancement as soon as its LLM call finishes."""
+    jobs = await _build_refinement_jobs(
+        resume_data, request, llm=llm, language=language
+    )
+    async for event in _stream_enhancements(jobs, action="refine"):
+        yield event
+
+
 def apply_enhancements_to_resume(
     resume_data: dict,
     request: ApplyEnhancementsRequest,
@@ -592,9 +815,18 @@ async def regenerate_items(
     llm,
 ) -> RegenerateResponse:
     output_language = get_language_name(request.output_language)
+    analysis_items = _analysis_items_by_id(await _load_analysis(request.analysis_id))
+    items = [
+        item.model_copy(
+            update={"subtitle": analysis_items[item.item_id].get("subtitle")}
+        )
+        if item.subtitle is None and item.item_id in analysis_items
+        else item
+        for item in request.items
+    ]
 
     tasks = []
-    for item in request.items:
+    for item in items:
         if item.item_type == "skills":
             tasks.append(
                 _regenerate_skills(item, request.instruction, output_language, llm=llm)
@@ -606,12 +838,12 @@ async def regenerate_items(
                 )
             )
 
-    results = await _gather_results(tasks)
+    results = await gather_limited(tasks)
 
     regenerated_items: list[RegeneratedItem] = []
     errors: list[RegenerateItemError] = []
 
-    for item, result in zip(request.items, results):
+    for item, result in zip(items, results):
         if isinstance(result, Exception):
             logger.error("Failed to regenerate item: %s", item.item_id, exc_info=result)
             errors.append(
@@ -1127,7 +1359,3 @@ async def _regenerate_skills(
         new_content=result.get("new_skills", []),
         diff_summary=result.get("change_summary", ""),
     )
-
-
-async def _gather_results(tasks):
-    return list(await asyncio.gather(*tasks, return_exceptions=True))
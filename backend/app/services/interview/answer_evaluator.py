@@ -17,7 +17,7 @@ from app.models.interview.schemas import (
     EvaluationResult,
     InterviewQuestion,
 )
-from app.services.llm_helpers import chain_invoke_text_async
+from app.services.llm_helpers import chain_invoke_text_async, llm_stream_text_async
 
 
 class AnswerEvaluator:
@@ -99,11 +99,12 @@ class AnswerEvaluator:
         )
 
         try:
-            async for chunk in self.llm.astream(prompt_text):
-                if hasattr(chunk, "content") and chunk.content:
-                    yield chunk.content
-                elif isinstance(chunk, str):
-                    yield chunk
+            async for chunk in llm_stream_text_async(
+                self.llm,
+                prompt_text,
+                cache_namespace="interview_answer_evaluation_stream",
+            ):
+                yield chunk
         except Exception as e:
             yield f"\n\nError during evaluation: {str(e)}"
 
@@ -134,11 +135,12 @@ class AnswerEvaluator:
         )
 
         try:
-            async for chunk in self.llm.astream(prompt_text):
-                if hasattr(chunk, "content") and chunk.content:
-                    yield chunk.content
-                elif isinstance(chunk, str):
-                    yield chunk
+            async for chunk in llm_stream_text_async(
+                self.llm,
+                prompt_text,
+                cache_namespace="interview_code_review_stream",
+            ):
+                yield chunk
         except Exception as e:
             yield f"\n\nError during code review: {str(e)}"
 
@@ -1,35 +1,114 @@
 """Sandboxed code execution service for coding interview questions."""
 
 import asyncio
+import codecs
+import math
 import os
+import signal
 import tempfile
-from typing import Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Literal, Optional
 
+from app.core.concurrency import as_completed_limited
+from app.core.metrics import increment, observe
+from app.core.settings import get_settings
 from app.models.interview.schemas import CodeExecutionResult
+from app.services.interview.execution_cache import (
+    execution_cache_key,
+    get_execution_cache,
+    is_cacheable,
+    is_deterministic,
+    runtime_version,
+)
+from app.services.interview.sandbox_pool import SandboxPool, get_sandbox_pool
+
+settings = get_settings()
+
+_READ_CHUNK_BYTES = 65536
+
+TestMode = Literal["harness", "parallel"]
+# Receives (stream name, decoded text) as a program writes output
+OutputCallback = Callable[[str, str], None]
+
+
+def _limited_command(
+    cmd: List[str], cpu_seconds: int, memory_mb: Optional[int]
+) -> List[str]:
+    """Wrap a cold-run command in a shell that sets resource limits and execs it.
+
+    The limits are not set through ``preexec_fn``, which can deadlock the
+    child when the server has threads (logging listeners, to_thread work).
+    """
+    # Soft limit first: a hard limit below the current soft one is rejected.
+    limits = [f"ulimit -S -t {cpu_seconds}", f"ulimit -H -t {cpu_seconds + 1}"]
+    if memory_mb:
+        limits.append(f"ulimit -v {memory_mb * 1024}")
+    script = " && ".join([*limits, 'exec "$@"'])
+    return ["/bin/sh", "-c", script, "sh", *cmd]
+
+
+class _OutputCapture:
+    """Captures stdout/stderr up to a byte cap, forwarding text as it arrives."""
+
+    def __init__(self, max_bytes: int, on_output: Optional[OutputCallback] = None):
+        self.max_bytes = max_bytes
+        self.captured = 0
+        self.truncated = False
+        self._on_output = on_output
+        self._buffers = {"stdout": bytearray(), "stderr": bytearray()}
+        self._decoders = {
+            stream: codecs.getincrementaldecoder("utf-8")(errors="replace")
+            for stream in self._buffers
+        }
+
+    def feed(self, stream: str, chunk: bytes) -> bool:
+        """Record a chunk; False once the cap is reached."""
+        room = self.max_bytes - self.captured
+        accepted = chunk[:room]
+        self._buffers[stream].extend(accepted)
+        self.captured += len(accepted)
+        if accepted and self._on_output:
+            text = self._decoders[stream].decode(accepted)
+            if text:
+                self._on_output(stream, text)
+        if len(chunk) > room:
+            self.truncated = True
+        return not self.truncated
+
+    def text(self, stream: str) -> str:
+        return self._buffers[stream].decode("utf-8", errors="replace")
 
 
 class CodeExecutor:
     """Sandboxed code execution service for interview coding questions."""
 
+    # "runtime": executable whose version goes into result cache keys.
+    # "limit_memory": cap the address space of cold runs; V8 reserves far
+    # more virtual memory than it uses, so Node runtimes only get a CPU limit.
     SUPPORTED_LANGUAGES: Dict[str, Dict] = {
         "python": {
             "extension": ".py",
             "cmd": ["python3"],
             "timeout": 10,
+            "runtime": "python3",
+            "limit_memory": True,
         },
         "javascript": {
             "extension": ".js",
             "cmd": ["node"],
             "timeout": 10,
+            "runtime": "node",
         },
         "typescript": {
             "extension": ".ts",
             "cmd": ["npx", "ts-node"],
             "timeout": 15,
+            "runtime": "node",
         },
     }
 
     MAX_OUTPUT_LENGTH = 10000
+    # Runs writing more than this are killed; results keep MAX_OUTPUT_LENGTH
+    MAX_OUTPUT_BYTES = 1024 * 1024
     MAX_CODE_LENGTH = 50000
 
     async def execute(
@@ -48,6 +127,135 @@ class CodeExecutor:
         Returns:
             CodeExecutionResult with stdout, stderr, and execution info
         """
+        return await self._execute(code, language, test_input)
+
+    async def execute_streaming(
+        self,
+        code: str,
+        language: str,
+        test_input: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Execute code, streaming its output while it runs.
+
+        Yields:
+            {"type": "output", "stream": "stdout" | "stderr", "content": ...}
+            for each piece of output (up to MAX_OUTPUT_LENGTH characters per
+            stream), then {"type": "result", "result": CodeExecutionResult}
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        forwarded = {"stdout": 0, "stderr": 0}
+
+        def on_output(stream: str, text: str) -> None:
+            room = self.MAX_OUTPUT_LENGTH - forwarded[stream]
+            if room > 0 and text:
+                forwarded[stream] += min(len(text), room)
+                queue.put_nowait((stream, text[:room]))
+
+        task = asyncio.create_task(
+            self._execute(code, language, test_input, on_output=on_output)
+        )
+        task.add_done_callback(lambda _: queue.put_nowait(None))
+        try:
+            while (item := await queue.get()) is not None:
+                stream, text = item
+                yield {"type": "output", "stream": stream, "content": text}
+            yield {"type": "result", "result": task.result()}
+        finally:
+            if not task.done():
+                task.cancel()
+
+    async def _execute(
+        self,
+        code: str,
+        language: str,
+        test_input: Optional[str],
+        on_output: Optional[OutputCallback] = None,
+    ) -> CodeExecutionResult:
+        error = self._validate(code, language, allow_input=bool(test_input))
+        if error:
+            return error
+
+        cache_key = await self._cache_key(code, language, test_input)
+        if cache_key:
+            cached = await self._cached_result(cache_key, language)
+            if cached is not None:
+                if on_output:
+                    for stream in ("stdout", "stderr"):
+                        if getattr(cached, stream):
+                            on_output(stream, getattr(cached, stream))
+                return cached
+
+        result = await self._execute_uncached(code, language, test_input, on_output)
+        await self._store_result(cache_key, code, result)
+        return result
+
+    async def _execute_uncached(
+        self,
+        code: str,
+        language: str,
+        test_input: Optional[str],
+        on_output: Optional[OutputCallback] = None,
+    ) -> CodeExecutionResult:
+        config = self.SUPPORTED_LANGUAGES[language]
+
+        pool = get_sandbox_pool(language)
+        if pool is not None:
+            result = await self._execute_warm(
+                pool, code, language, config, test_input, on_output
+            )
+            if result is not None:
+                return result
+
+        return await self._execute_cold(code, language, config, test_input, on_output)
+
+    async def _cache_key(
+        self,
+        code: str,
+        language: str,
+        test_input: Optional[str],
+    ) -> Optional[str]:
+        """Result cache key, or None when this run must not be cached."""
+        if get_execution_cache() is None or not is_deterministic(code):
+            return None
+        version = await runtime_version(self.SUPPORTED_LANGUAGES[language]["runtime"])
+        return execution_cache_key(language, version, code, test_input)
+
+    async def _cached_result(
+        self, cache_key: str, language: str
+    ) -> Optional[CodeExecutionResult]:
+        start_time = asyncio.get_event_loop().time()
+        cached = await get_execution_cache().get(cache_key)
+        if cached is None:
+            increment("interview.code_execution.cache", outcome="miss")
+            return None
+
+        latency_ms = (asyncio.get_event_loop().time() - start_time) * 1000
+        increment("interview.code_execution.cache", outcome="hit")
+        observe(
+            "interview.code_execution.cache_hit_latency_ms",
+            latency_ms,
+            language=language,
+        )
+        cached.cached = True
+        cached.cache_latency_ms = round(latency_ms, 3)
+        return cached
+
+    async def _store_result(
+        self,
+        cache_key: Optional[str],
+        code: str,
+        result: CodeExecutionResult,
+    ) -> None:
+        if cache_key and is_cacheable(code, result):
+            await get_execution_cache().set(cache_key, result)
+
+    def _validate(
+        self,
+        code: str,
+        language: str,
+        allow_input: bool,
+    ) -> Optional[CodeExecutionResult]:
+        """Return a failed result if the code must not run, None otherwise."""
         # Validate language
         if language not in self.SUPPORTED_LANGUAGES:
             return CodeExecutionResult(
@@ -67,9 +275,7 @@ class CodeExecutor:
             )
 
         # Basic security checks
-        security_check = self._security_check(
-            code, language, allow_input=bool(test_input)
-        )
+        security_check = self._security_check(code, language, allow_input=allow_input)
         if security_check:
             return CodeExecutionResult(
                 success=False,
@@ -78,8 +284,132 @@ class CodeExecutor:
                 execution_time_ms=0,
             )
 
-        config = self.SUPPORTED_LANGUAGES[language]
+        return None
+
+    def _warm_request(
+        self,
+        code: str,
+        config: Dict,
+        inputs: List[str],
+        parallelism: int = 1,
+        stream_output: bool = False,
+    ) -> Dict[str, Any]:
+        """Build a sandbox worker request running ``code`` on each input."""
+        timeout = config["timeout"]
+        return {
+            "code": code,
+            "tests": [{"input": test_input} for test_input in inputs],
+            "timeout": timeout,
+            "parallelism": parallelism,
+            "stream_output": stream_output,
+            "max_output": self.MAX_OUTPUT_BYTES,
+            "limits": {
+                "cpu_seconds": math.ceil(timeout),
+                "memory_mb": settings.INTERVIEW_SANDBOX_MEMORY_LIMIT_MB,
+            },
+        }
+
+    def _warm_result(
+        self, response: Dict[str, Any], timeout: int
+    ) -> CodeExecutionResult:
+        """Convert a sandbox worker response into an execution result."""
+        if response["timed_out"]:
+            return CodeExecutionResult(
+                success=False,
+                stdout="",
+                stderr=f"Execution timed out after {timeout} seconds",
+                execution_time_ms=int(timeout * 1000),
+            )
+
+        return self._output_result(
+            exit_code=response["exit_code"],
+            stdout=response["stdout"],
+            stderr=response["stderr"],
+            truncated=response["truncated"],
+            execution_time_ms=response["elapsed_ms"],
+        )
+
+    def _output_result(
+        self,
+        exit_code: Optional[int],
+        stdout: str,
+        stderr: str,
+        truncated: bool,
+        execution_time_ms: int,
+    ) -> CodeExecutionResult:
+        """Build the result of a finished run, cutting output to the limit.
+
+        The output-limit notice is added after the cut so a flood of stderr
+        cannot push it out.
+        """
+        stderr = stderr[: self.MAX_OUTPUT_LENGTH]
+        if truncated:
+            stderr = f"{stderr}\nOutput limit exceeded; execution stopped".lstrip()
+
+        return CodeExecutionResult(
+            success=exit_code == 0 and not truncated,
+            stdout=stdout[: self.MAX_OUTPUT_LENGTH],
+            stderr=stderr,
+            execution_time_ms=execution_time_ms,
+            truncated=truncated,
+        )
 
+    async def _execute_warm(
+        self,
+        pool: SandboxPool,
+        code: str,
+        language: str,
+        config: Dict,
+        test_input: Optional[str],
+        on_output: Optional[OutputCallback] = None,
+    ) -> Optional[CodeExecutionResult]:
+        """Execute on a warm pooled worker; None if no worker could run it.
+
+        A worker that fails after forwarding output gives a failed result
+        instead: rerunning cold would stream that output a second time.
+        """
+        start_time = asyncio.get_event_loop().time()
+        request = self._warm_request(
+            code, config, [test_input or ""], stream_output=on_output is not None
+        )
+        response = None
+        streamed = False
+        async for message in pool.stream(request, timeout=config["timeout"]):
+            if "data" in message:
+                on_output(message["stream"], message["data"])
+                streamed = True
+            else:
+                response = message
+        if response is None:
+            if not streamed:
+                return None
+            return CodeExecutionResult(
+                success=False,
+                stdout="",
+                stderr="Execution error: sandbox worker stopped during the run",
+                execution_time_ms=int(
+                    (asyncio.get_event_loop().time() - start_time) * 1000
+                ),
+            )
+
+        observe(
+            "interview.code_execution.latency_ms",
+            (asyncio.get_event_loop().time() - start_time) * 1000,
+            language=language,
+            mode="warm",
+        )
+        return self._warm_result(response, config["timeout"])
+
+    async def _execute_cold(
+        self,
+        code: str,
+        language: str,
+        config: Dict,
+        test_input: Optional[str],
+        on_output: Optional[OutputCallback] = None,
+    ) -> CodeExecutionResult:
+        """Execute in a freshly started interpreter process."""
+        timeout = config["timeout"]
         try:
             # Create temporary file for the code
             with tempfile.NamedTemporaryFile(
@@ -93,10 +423,15 @@ class CodeExecutor:
             try:
                 start_time = asyncio.get_event_loop().time()
 
-                # Build command
-                cmd = config["cmd"] + [temp_file]
+                # Build command with CPU (and, where safe, memory) limits
+                cmd = _limited_command(
+                    config["cmd"] + [temp_file],
+                    math.ceil(timeout),
+                    settings.INTERVIEW_SANDBOX_MEMORY_LIMIT_MB
+                    if config.get("limit_memory")
+                    else None,
+                )
 
-                # Create subprocess
                 process = await asyncio.create_subprocess_exec(
                     *cmd,
                     stdout=asyncio.subprocess.PIPE,
@@ -104,35 +439,54 @@ class CodeExecutor:
                     stdin=asyncio.subprocess.PIPE if test_input else None,
                 )
 
+                capture = _OutputCapture(self.MAX_OUTPUT_BYTES, on_output)
                 try:
                     # Run with timeout
-                    stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                        process.communicate(
-                            input=test_input.encode() if test_input else None
-                        ),
-                        timeout=config["timeout"],
+                    await asyncio.wait_for(
+                        self._communicate(process, test_input, capture),
+                        timeout=timeout,
                     )
+                except asyncio.CancelledError:
+                    # The client went away; do not leave the program running.
+                    process.kill()
+                    await process.wait()
+                    increment("interview.code_execution.cancelled", mode="cold")
+                    raise
                 except asyncio.TimeoutError:
                     process.kill()
                     await process.wait()
                     return CodeExecutionResult(
                         success=False,
                         stdout="",
-                        stderr=f"Execution timed out after {config['timeout']} seconds",
-                        execution_time_ms=int(config["timeout"] * 1000),
+                        stderr=f"Execution timed out after {timeout} seconds",
+                        execution_time_ms=int(timeout * 1000),
                     )
 
                 execution_time = int(
                     (asyncio.get_event_loop().time() - start_time) * 1000
                 )
 
-                stdout = stdout_bytes.decode("utf-8", errors="replace")
-                stderr = stderr_bytes.decode("utf-8", errors="replace")
+                observe(
+                    "interview.code_execution.latency_ms",
+                    execution_time,
+                    language=language,
+                    mode="cold",
+                )
 
-                return CodeExecutionResult(
-                    success=process.returncode == 0,
-                    stdout=stdout[: self.MAX_OUTPUT_LENGTH],
-                    stderr=stderr[: self.MAX_OUTPUT_LENGTH],
+                # The CPU limit ends runaway loops with SIGXCPU
+                if process.returncode == -signal.SIGXCPU:
+                    return CodeExecutionResult(
+                        success=False,
+                        stdout="",
+                        stderr=f"Execution timed out after {timeout} seconds",
+                        execution_time_ms=execution_time,
+                    )
+
+                return self._output_result(
+                    exit_code=process.returncode,
+                    stdout=capture.text("stdout"),
+                    stderr=capture.text("stderr"),
+                    truncated=capture.truncated,
                     execution_time_ms=execution_time,
                 )
 
@@ -151,6 +505,35 @@ class CodeExecutor:
                 execution_time_ms=0,
             )
 
+    async def _communicate(
+        self,
+        process: asyncio.subprocess.Process,
+        test_input: Optional[str],
+        capture: _OutputCapture,
+    ) -> None:
+        """Feed input and read output incrementally, killing at the byte cap."""
+
+        async def read(stream: asyncio.StreamReader, name: str) -> None:
+            while chunk := await stream.read(_READ_CHUNK_BYTES):
+                if not capture.feed(name, chunk):
+                    process.kill()
+                    return
+
+        async def write() -> None:
+            if not test_input:
+                return
+            try:
+                process.stdin.write(test_input.encode())
+                await process.stdin.drain()
+                process.stdin.close()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+        await asyncio.gather(
+            write(), read(process.stdout, "stdout"), read(process.stderr, "stderr")
+        )
+        await process.wait()
+
     def _security_check(
         self,
         code: str,
@@ -218,11 +601,120 @@ class CodeExecutor:
         """Get list of supported programming languages."""
         return list(self.SUPPORTED_LANGUAGES.keys())
 
+    def _test_parallelism(self, test_count: int) -> int:
+        limit = settings.INTERVIEW_CODE_TEST_PARALLELISM or os.cpu_count() or 1
+        return max(1, min(limit, test_count))
+
+    def _test_result(
+        self,
+        index: int,
+        test: Dict,
+        result: CodeExecutionResult,
+    ) -> Dict[str, Any]:
+        passed = (
+            result.success and result.stdout.strip() == test.get("expected", "").strip()
+        )
+        return {
+            "test_number": index + 1,
+            "passed": passed,
+            "input": test.get("input", ""),
+            "expected": test.get("expected", ""),
+            "actual": result.stdout.strip(),
+            "error": result.stderr if not result.success else None,
+            "execution_time_ms": result.execution_time_ms,
+        }
+
+    async def stream_tests(
+        self,
+        code: str,
+        language: str,
+        test_cases: List[Dict],
+        mode: TestMode = "harness",
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Run code against test cases, yielding each result as it finishes.
+
+        In ``harness`` mode the code is loaded once by a warm sandbox worker
+        and every test input runs there with its own timeout. In ``parallel``
+        mode each test is a separate execution. Both run up to
+        ``INTERVIEW_CODE_TEST_PARALLELISM`` (default: CPU count) tests at a
+        time, and tests the harness could not run fall back to ``parallel``.
+
+        Args:
+            code: The code to execute
+            language: Programming language
+            test_cases: List of {"input": "...", "expected": "..."}
+            mode: "harness" or "parallel"
+
+        Yields:
+            Per-test result dicts, in completion order
+        """
+        if not test_cases:
+            return
+
+        error = self._validate(
+            code,
+            language,
+            allow_input=any(test.get("input") for test in test_cases),
+        )
+        if error:
+            for index, test in enumerate(test_cases):
+                yield self._test_result(index, test, error)
+            return
+
+        parallelism = self._test_parallelism(len(test_cases))
+        remaining = set(range(len(test_cases)))
+
+        cache_keys = [
+            await self._cache_key(code, language, test.get("input"))
+            for test in test_cases
+        ]
+        for index, cache_key in enumerate(cache_keys):
+            cached = cache_key and await self._cached_result(cache_key, language)
+            if cached:
+                remaining.discard(index)
+                yield self._test_result(index, test_cases[index], cached)
+
+        pool = get_sandbox_pool(language) if mode == "harness" else None
+        if pool is not None and remaining:
+            config = self.SUPPORTED_LANGUAGES[language]
+            harnessed = sorted(remaining)
+            request = self._warm_request(
+                code,
+                config,
+                [test_cases[index].get("input") or "" for index in harnessed],
+                self._test_parallelism(len(harnessed)),
+            )
+            async for response in pool.stream(request, timeout=config["timeout"]):
+                index = harnessed[response["index"]]
+                remaining.discard(index)
+                result = self._warm_result(response, config["timeout"])
+                await self._store_result(cache_keys[index], code, result)
+                yield self._test_result(index, test_cases[index], result)
+
+        pending = sorted(remaining)
+        async for position, result in as_completed_limited(
+            (
+                self.execute(code, language, test_cases[index].get("input"))
+                for index in pending
+            ),
+            limit=parallelism,
+        ):
+            if isinstance(result, Exception):
+                result = CodeExecutionResult(
+                    success=False,
+                    stdout="",
+                    stderr=f"Execution error: {str(result)}",
+                    execution_time_ms=0,
+                )
+            index = pending[position]
+            yield self._test_result(index, test_cases[index], result)
+
     async def run_with_tests(
         self,
         code: str,
         language: str,
         test_cases: List[Dict],
+        mode: TestMode = "harness",
     ) -> CodeExecutionResult:
         """Run code with multiple test cases.
 
@@ -230,43 +722,28 @@ class CodeExecutor:
             code: The code to execute
             language: Programming language
             test_cases: List of {"input": "...", "expected": "..."}
+            mode: "harness" or "parallel" (see ``stream_tests``)
 
         Returns:
             CodeExecutionResult with test results
         """
-        all_passed = True
-        test_results = []
-        total_time = 0
-
-        for i, test in enumerate(test_cases):
-            result = await self.execute(
-                code=code,
-                language=language,
-                test_input=test.get("input"),
-            )
-
-            total_time += result.execution_time_ms
-
-            passed = (
-                result.success
-                and result.stdout.strip() == test.get("expected", "").strip()
-            )
-            all_passed = all_passed and passed
-
-            test_results.append(
-                {
-                    "test_number": i + 1,
-                    "passed": passed,
-                    "input": test.get("input", ""),
-                    "expected": test.get("expected", ""),
-                    "actual": result.stdout.strip(),
-                    "error": result.stderr if not result.success else None,
-                }
-            )
-
-        # Combine results
+        test_results = [
+            test_result
+            async for test_result in self.stream_tests(code, language, test_cases, mode)
+        ]
+        return self.summarize_tests(test_results)
+
+    def summarize_tests(
+        self, test_results: List[Dict[str, Any]]
+    ) -> CodeExecutionResult:
+        """Combine per-test results (from ``stream_tests``) into one result."""
+        test_results = sorted(
+            test_results, key=lambda test_result: test_result["test_number"]
+        )
+        all_passed = all(t["passed"] for t in test_results)
         passed_count = sum(1 for t in test_results if t["passed"])
-        summary = f"Passed {passed_count}/{len(test_cases)} test cases"
+        total_time = sum(t["execution_time_ms"] for t in test_results)
+        summary = f"Passed {passed_count}/{len(test_results)} test cases"
 
         return CodeExecutionResult(
             success=all_passed,
@@ -0,0 +1,74 @@
+"""Compact append-only event log for interview sessions."""
+
+from collections import Counter, deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+from app.models.interview.enums import InterviewEventType
+from app.models.interview.schemas import InterviewEvent
+
+
+class _LoggedEvent:
+    """Slim stand-in for :class:`InterviewEvent` while it sits in the log."""
+
+    __slots__ = ("id", "event_type", "timestamp", "metadata")
+
+    def __init__(
+        self,
+        id: str,
+        event_type: InterviewEventType,
+        timestamp: datetime,
+        metadata: Optional[Dict[str, Any]],
+    ):
+        self.id = id
+        self.event_type = event_type
+        self.timestamp = timestamp
+        # Most events carry no metadata; don't keep an empty dict per event.
+        self.metadata = metadata or None
+
+
+class InterviewEventLog:
+    """Append-only events of one session with per-type counters.
+
+    Counters are updated on append so counting is O(1) and stays exact even
+    when ``max_events`` caps the log as a ring buffer and old events are
+    dropped.
+    """
+
+    __slots__ = ("session_id", "_entries", "_counts")
+
+    def __init__(self, session_id: str, max_events: Optional[int] = None):
+        self.session_id = session_id
+        self._entries: Deque[_LoggedEvent] = deque(maxlen=max_events or None)
+        self._counts: Counter = Counter()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def append(self, event: InterviewEvent) -> None:
+        self._entries.append(
+            _LoggedEvent(event.id, event.event_type, event.timestamp, event.metadata)
+        )
+        self._counts[event.event_type] += 1
+
+    def count(self, event_type: Optional[InterviewEventType] = None) -> int:
+        """Number of events recorded, including any dropped by the cap."""
+        if event_type is None:
+            return sum(self._counts.values())
+        return self._counts[event_type]
+
+    def events(
+        self, event_type: Optional[InterviewEventType] = None
+    ) -> List[InterviewEvent]:
+        """Materialize retained events, optionally of one type, oldest first."""
+        return [
+            InterviewEvent(
+                id=entry.id,
+                session_id=self.session_id,
+                event_type=entry.event_type,
+                timestamp=entry.timestamp,
+                metadata=entry.metadata or {},
+            )
+            for entry in self._entries
+            if event_type is None or entry.event_type == event_type
+        ]
@@ -0,0 +1,162 @@
+"""Short-lived cache of interview code execution results.
+
+Candidates often re-run unchanged code, and the streaming and non-streaming
+endpoints can run the same submission twice. Results are keyed by language,
+runtime version, a hash of the normalized code and the test input, and kept
+in a process-local LRU with Redis behind it so every worker shares hits.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from app.core.cache import build_cache_key, get_cached_json, set_cached_json
+from app.core.settings import get_settings
+from app.models.interview.schemas import CodeExecutionResult
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Versioned with the code normalization, so entries keyed differently are not reused
+_CACHE_NAMESPACE = "interview_code_execution:v2"
+_VERSION_TIMEOUT_SECONDS = 5
+
+# Output of code using these can change between identical runs.
+_NONDETERMINISTIC_PATTERN = re.compile(
+    r"\b(random|time|datetime|uuid|secrets|Math\.random|Date|performance"
+    r"|process\.hrtime|crypto)\b"
+)
+# Results produced by the executor itself rather than by the program.
+_UNCACHEABLE_STDERR = ("Execution timed out", "Execution error:")
+
+_runtime_versions: Dict[str, str] = {}
+
+
+def normalize_code(code: str) -> str:
+    """Drop differences that cannot change behaviour: line endings and
+    whitespace at the end of the file.
+
+    Trailing whitespace on other lines is kept; inside a string literal it
+    is part of the output.
+    """
+    return code.replace("\r\n", "\n").rstrip()
+
+
+def is_deterministic(code: str) -> bool:
+    return _NONDETERMINISTIC_PATTERN.search(code) is None
+
+
+def is_cacheable(code: str, result: CodeExecutionResult) -> bool:
+    """Only cache runs whose outcome depends on nothing but code and input."""
+    if result.stderr.startswith(_UNCACHEABLE_STDERR):
+        return False
+    if result.truncated:
+        return False
+    return is_deterministic(code)
+
+
+async def runtime_version(runtime: str) -> str:
+    """Version string of a language runtime, looked up once per process."""
+    version = _runtime_versions.get(runtime)
+    if version is not None:
+        return version
+
+    try:
+        process = await asyncio.create_subprocess_exec(
+            runtime,
+            "--version",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        output, _ = await asyncio.wait_for(
+            process.communicate(), timeout=_VERSION_TIMEOUT_SECONDS
+        )
+        version = output.decode("utf-8", errors="replace").strip() or "unknown"
+    except (OSError, asyncio.TimeoutError):
+        version = "unknown"
+
+    _runtime_versions[runtime] = version
+    return version
+
+
+def execution_cache_key(
+    language: str,
+    version: str,
+    code: str,
+    test_input: Optional[str],
+) -> str:
+    code_hash = hashlib.sha256(normalize_code(code).encode("utf-8")).hexdigest()
+    payload = json.dumps(
+        [language, version, code_hash, test_input or ""], ensure_ascii=True
+    )
+    return build_cache_key(_CACHE_NAMESPACE, payload)
+
+
+class ExecutionCache:
+    """LRU of recent execution results in front of the shared Redis cache."""
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+    async def get(self, key: str) -> Optional[CodeExecutionResult]:
+        record: Optional[dict] = None
+        local = self._entries.get(key)
+        if local is not None:
+            expires_at, local_record = local
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                record = local_record
+            else:
+                self._entries.pop(key, None)
+
+        if record is None:
+            record = await get_cached_json(key)
+            if record is not None:
+                self._remember(key, record)
+
+        if record is None:
+            return None
+        try:
+            return CodeExecutionResult.model_validate(record)
+        except ValueError:
+            return None
+
+    async def get_many(self, keys: List[str]) -> List[Optional[CodeExecutionResult]]:
+        return list(await asyncio.gather(*(self.get(key) for key in keys)))
+
+    async def set(self, key: str, result: CodeExecutionResult) -> None:
+        record = result.model_dump(
+            mode="json", include={"success", "stdout", "stderr", "execution_time_ms"}
+        )
+        self._remember(key, record)
+        await set_cached_json(key, record, ttl_seconds=self.ttl_seconds)
+
+    def _remember(self, key: str, record: dict) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, record)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+# Global execution cache instance
+_execution_cache: Optional[ExecutionCache] = None
+
+
+def get_execution_cache() -> Optional[ExecutionCache]:
+    """Get the shared execution cache, or None when caching is disabled."""
+    global _execution_cache
+    if not settings.INTERVIEW_CODE_CACHE_ENABLED:
+        return None
+    if _execution_cache is None:
+        _execution_cache = ExecutionCache(
+            max_entries=settings.INTERVIEW_CODE_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.INTERVIEW_CODE_CACHE_TTL_SECONDS,
+        )
+    return _execution_cache
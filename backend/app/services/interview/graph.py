@@ -1,24 +1,47 @@
 """LangGraph-based interview orchestrator."""
 
+import asyncio
+import logging
 from datetime import datetime
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional, Set, Tuple
 
 from langchain_core.language_models import BaseChatModel
 
+from app.core.metrics import increment
+from app.core.settings import get_settings
 from app.models.interview.enums import InterviewStatus
 from app.models.interview.schemas import (
     CandidateProfile,
     CodeExecutionResult,
+    EvaluationResult,
     InterviewConfig,
     InterviewQuestion,
     InterviewSession,
 )
 from app.services.interview.answer_evaluator import AnswerEvaluator
 from app.services.interview.code_executor import CodeExecutor
+from app.services.interview.idempotency import (
+    IdempotentOperations,
+    build_idempotency_key,
+    get_idempotent_operations,
+)
 from app.services.interview.question_generator import QuestionGenerator
 from app.services.interview.session_manager import SessionManager, get_session_manager
 from app.services.interview.summary_generator import SummaryGenerator
 
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Keeps references to detached background tasks until they finish
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def _candidate_id(profile: CandidateProfile) -> Optional[str]:
+    """Stable candidate identity for question pool exclusion."""
+    if profile.email:
+        return profile.email.strip().lower()
+    return None
+
 
 class InterviewGraph:
     """Orchestrates the interview flow using various services.
@@ -29,6 +52,10 @@ class InterviewGraph:
     - Answer evaluation (with streaming)
     - Code execution
     - Summary generation
+
+    Operations that evaluate an answer and advance the session run under the
+    session's lock and are idempotent: a retried request attaches to the
+    running operation or gets its stored result.
     """
 
     def __init__(
@@ -39,12 +66,14 @@ class InterviewGraph:
         code_executor: Optional[CodeExecutor] = None,
         summary_generator: Optional[SummaryGenerator] = None,
         llm: Optional[BaseChatModel] = None,
+        idempotency: Optional[IdempotentOperations] = None,
     ):
         self.session_manager = session_manager or get_session_manager()
         self.question_generator = question_generator or QuestionGenerator(llm=llm)
         self.answer_evaluator = answer_evaluator or AnswerEvaluator(llm=llm)
         self.code_executor = code_executor or CodeExecutor()
         self.summary_generator = summary_generator or SummaryGenerator(llm=llm)
+        self.idempotency = idempotency or get_idempotent_operations()
 
     async def create_session(
         self,
@@ -74,6 +103,7 @@ class InterviewGraph:
             template_id=config.template_id,
             topic=config.topic,
             resume_data=profile.resume_data,
+            candidate_id=_candidate_id(profile),
         )
 
         session.questions = questions
@@ -84,6 +114,240 @@ class InterviewGraph:
 
         return session
 
+    async def create_session_streaming(
+        self,
+        profile: CandidateProfile,
+        config: InterviewConfig,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Create a session and stream its questions as they are generated.
+
+        The session is saved and yielded as soon as the first question is
+        ready, so the candidate can start while the rest are generated.
+        Generation runs in a background task and finishes even if the
+        client disconnects.
+        """
+        session = await self.session_manager.create(profile=profile, config=config)
+
+        queue: asyncio.Queue = asyncio.Queue()
+        task = asyncio.create_task(self._generate_questions_into(session, queue))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            yield item
+
+    async def _generate_questions_into(
+        self,
+        session: InterviewSession,
+        queue: asyncio.Queue,
+    ) -> None:
+        config = session.config
+        count = 0
+        try:
+            async for question in self.question_generator.stream_questions(
+                role=config.role,
+                num_questions=config.num_questions,
+                difficulty_distribution=config.difficulty_distribution,
+                template_id=config.template_id,
+                topic=config.topic,
+                resume_data=session.profile.resume_data,
+                candidate_id=_candidate_id(session.profile),
+            ):
+                session = await self._append_question(session, question)
+                count += 1
+                if count == 1:
+                    await queue.put(
+                        {
+                            "type": "session",
+                            "session": session.model_dump(mode="json"),
+                            "current_question": question.model_dump(mode="json"),
+                        }
+                    )
+                else:
+                    await queue.put(
+                        {
+                            "type": "question",
+                            "question": question.model_dump(mode="json"),
+                        }
+                    )
+            await queue.put({"type": "complete", "num_questions": count})
+        except Exception as error:
+            logger.exception("Question generation failed for %s", session.session_id)
+            # Shorten the interview to what exists so it can still complete.
+            await self._truncate_questions(session.session_id, count)
+            await queue.put({"type": "error", "message": str(error)})
+        finally:
+            await queue.put(None)
+
+    async def _append_question(
+        self,
+        session: InterviewSession,
+        question: InterviewQuestion,
+    ) -> InterviewSession:
+        """Append a generated question to the latest copy of the session.
+
+        Holds the session lock, like answer submissions, so a submission
+        being evaluated meanwhile does not find its session changed on save.
+        """
+        async with self.session_manager.lock(session.session_id):
+            latest = await self.session_manager.get(session.session_id)
+            if latest is None:
+                raise ValueError(f"Session not found: {session.session_id}")
+            session = latest
+            if len(session.questions) <= question.index:
+                session.questions.append(question)
+            if question.index == 0:
+                session.status = InterviewStatus.IN_PROGRESS
+                session.started_at = datetime.utcnow()
+            await self.session_manager.save(session)
+            return session
+
+    async def _truncate_questions(self, session_id: str, count: int) -> None:
+        try:
+            async with self.session_manager.lock(session_id):
+                session = await self.session_manager.get(session_id)
+                if session is None:
+                    return
+                session.config.num_questions = len(session.questions)
+                if not session.questions:
+                    session.status = InterviewStatus.CANCELLED
+                await self.session_manager.save(session)
+        except Exception:
+            logger.warning("Could not truncate questions for %s", session_id)
+
+    def _is_complete(self, session: InterviewSession) -> bool:
+        """All planned questions are answered.
+
+        Compared against the configured count, not ``len(questions)``, so a
+        session whose questions are still streaming in is not completed early.
+        """
+        answered = session.current_question_index
+        return answered >= max(len(session.questions), session.config.num_questions)
+
+    def _update_summary_later(
+        self, session: InterviewSession, is_complete: bool
+    ) -> None:
+        """Digest the latest answer in the background.
+
+        Once the interview is complete the summary is precomputed as well,
+        so the summary request usually finds it ready.
+        """
+        task = asyncio.create_task(self._update_summary(session, is_complete))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+    async def _update_summary(
+        self, session: InterviewSession, is_complete: bool
+    ) -> None:
+        try:
+            if is_complete:
+                # The summary accounts for interview events too.
+                session = (
+                    await self.session_manager.get(
+                        session.session_id, include_events=True
+                    )
+                    or session
+                )
+            await self.summary_generator.update_digest(session, precompute=is_complete)
+        except Exception:
+            logger.warning(
+                "Summary digest update failed for %s",
+                session.session_id,
+                exc_info=True,
+            )
+
+    def _prefetch_follow_ups(
+        self, session: InterviewSession, question: InterviewQuestion, answer: str
+    ) -> Optional[Tuple[str, asyncio.Task]]:
+        """Start personalizing the next question's follow-ups from ``answer``.
+
+        Runs while the answer is evaluated, so the candidate does not wait
+        for another LLM call between questions. The result is speculative:
+        it is only used if the interview then moves on to that question.
+
+        Returns:
+            The id of the question being personalized and the task doing it
+        """
+        if not settings.INTERVIEW_FOLLOW_UP_PREFETCH_ENABLED:
+            return None
+        if not self.question_generator.llm:
+            return None
+        next_index = session.current_question_index + 1
+        if next_index >= len(session.questions):
+            # Not generated yet, or this is the last question.
+            return None
+
+        next_question = session.questions[next_index]
+        task = asyncio.create_task(
+            self.question_generator.personalize_follow_ups(
+                next_question, question, answer, role=session.config.role
+            )
+        )
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+        return next_question.id, task
+
+    def _discard_follow_ups(self, prefetch: Optional[Tuple[str, asyncio.Task]]) -> None:
+        if prefetch is None:
+            return
+        prefetch[1].cancel()
+        increment("interview.follow_up_prefetch", outcome="discarded")
+
+    def _take_follow_ups(
+        self,
+        session: InterviewSession,
+        next_question: Optional[InterviewQuestion],
+        prefetch: Optional[Tuple[str, asyncio.Task]],
+    ) -> None:
+        """Apply prefetched follow-ups if the interview went where expected.
+
+        Call before the session is saved, so ready follow-ups are saved with
+        it; ones still being generated are saved once they arrive.
+        """
+        if prefetch is None:
+            return
+        question_id, task = prefetch
+        if next_question is None or next_question.id != question_id:
+            self._discard_follow_ups(prefetch)
+            return
+        if not task.done():
+            increment("interview.follow_up_prefetch", outcome="pending")
+            later = asyncio.create_task(
+                self._save_follow_ups(session.session_id, question_id, task)
+            )
+            _background_tasks.add(later)
+            later.add_done_callback(_background_tasks.discard)
+            return
+        follow_ups = task.result()
+        if follow_ups:
+            next_question.follow_up_questions = follow_ups
+        increment(
+            "interview.follow_up_prefetch", outcome="ready" if follow_ups else "empty"
+        )
+
+    async def _save_follow_ups(
+        self, session_id: str, question_id: str, task: asyncio.Task
+    ) -> None:
+        try:
+            follow_ups = await task
+            if not follow_ups:
+                return
+            async with self.session_manager.lock(session_id):
+                session = await self.session_manager.get(session_id)
+                question = await self.get_current_question(session) if session else None
+                if question is None or question.id != question_id:
+                    # Answered or skipped before the follow-ups were ready.
+                    return
+                question.follow_up_questions = follow_ups
+                await self.session_manager.save(session)
+        except Exception:
+            logger.warning(
+                "Could not save follow-ups for %s", session_id, exc_info=True
+            )
+
     async def get_session(self, session_id: str) -> Optional[InterviewSession]:
         """Get an interview session by ID."""
         return await self.session_manager.get(session_id)
@@ -96,11 +360,15 @@ class InterviewGraph:
             return session.questions[session.current_question_index]
         return None
 
+    def _session_lock(self, session_id: str):
+        return lambda: self.session_manager.lock(session_id)
+
     async def submit_answer(
         self,
         session_id: str,
         question_id: str,
         answer: str,
+        idempotency_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Submit an answer and get evaluation result.
 
@@ -108,10 +376,49 @@ class InterviewGraph:
             session_id: The session ID
             question_id: The question ID being answered
             answer: The candidate's answer
+            idempotency_key: Client key identifying this submission; without
+                one, a resubmission of the same answer counts as a retry
 
         Returns:
             Dict with evaluation result and next question info
         """
+
+        async def work() -> Dict[str, Any]:
+            result = await self._submit_answer(session_id, question_id, answer)
+            next_question = result["next_question"]
+            return {
+                "evaluation": result["evaluation"].model_dump(mode="json"),
+                "next_question": (
+                    next_question.model_dump(mode="json") if next_question else None
+                ),
+                "is_complete": result["is_complete"],
+            }
+
+        result = await self.idempotency.run(
+            build_idempotency_key(
+                "submit_answer", session_id, question_id, idempotency_key, answer
+            ),
+            work,
+            lock=self._session_lock(session_id),
+            operation="submit_answer",
+        )
+        return {
+            "evaluation": EvaluationResult.model_validate(result["evaluation"]),
+            "next_question": (
+                InterviewQuestion.model_validate(result["next_question"])
+                if result["next_question"]
+                else None
+            ),
+            "is_complete": result["is_complete"],
+            "session": await self.session_manager.get(session_id),
+        }
+
+    async def _submit_answer(
+        self,
+        session_id: str,
+        question_id: str,
+        answer: str,
+    ) -> Dict[str, Any]:
         session = await self.session_manager.get(session_id)
         if not session:
             raise ValueError(f"Session not found: {session_id}")
@@ -133,12 +440,17 @@ class InterviewGraph:
         if not question:
             raise ValueError(f"Question not found: {question_id}")
 
-        # Evaluate the answer
-        evaluation = await self.answer_evaluator.evaluate(
-            question=question,
-            answer=answer,
-            role=session.config.role,
-        )
+        prefetch = self._prefetch_follow_ups(session, question, answer)
+        try:
+            # Evaluate the answer
+            evaluation = await self.answer_evaluator.evaluate(
+                question=question,
+                answer=answer,
+                role=session.config.role,
+            )
+        except BaseException:
+            self._discard_follow_ups(prefetch)
+            raise
 
         # Update the question
         question.answer = answer
@@ -151,14 +463,16 @@ class InterviewGraph:
         # Move to next question
         session.current_question_index += 1
 
-        await self.session_manager.save(session)
-
         # Get next question or None if complete
         next_question = await self.get_current_question(session)
-        is_complete = next_question is None
+        is_complete = self._is_complete(session)
+        self._take_follow_ups(session, next_question, prefetch)
+
+        await self.session_manager.save(session)
 
         if is_complete:
             await self.session_manager.complete_interview(session_id)
+        self._update_summary_later(session, is_complete)
 
         return {
             "evaluation": evaluation,
@@ -172,11 +486,29 @@ class InterviewGraph:
         session_id: str,
         question_id: str,
         answer: str,
+        idempotency_key: Optional[str] = None,
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """Submit an answer and stream the evaluation.
 
-        Yields chunks for SSE streaming.
+        Yields chunks for SSE streaming. A retried submission replays the
+        first one's events instead of evaluating again.
         """
+        async for event in self.idempotency.stream(
+            build_idempotency_key(
+                "submit_answer_stream", session_id, question_id, idempotency_key, answer
+            ),
+            lambda: self._submit_answer_streaming(session_id, question_id, answer),
+            lock=self._session_lock(session_id),
+            operation="submit_answer",
+        ):
+            yield event
+
+    async def _submit_answer_streaming(
+        self,
+        session_id: str,
+        question_id: str,
+        answer: str,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
         session = await self.session_manager.get(session_id)
         if not session:
             yield {"type": "error", "message": f"Session not found: {session_id}"}
@@ -199,15 +531,21 @@ class InterviewGraph:
             yield {"type": "error", "message": f"Question not found: {question_id}"}
             return
 
-        # Stream the evaluation
-        full_response = ""
-        async for chunk in self.answer_evaluator.evaluate_streaming(
-            question=question,
-            answer=answer,
-            role=session.config.role,
-        ):
-            full_response += chunk
-            yield {"type": "chunk", "content": chunk}
+        prefetch = self._prefetch_follow_ups(session, question, answer)
+        try:
+            # Stream the evaluation
+            full_response = ""
+            async for chunk in self.answer_evaluator.evaluate_streaming(
+                question=question,
+                answer=answer,
+                role=session.config.role,
+            ):
+                full_response += chunk
+                yield {"type": "chunk", "content": chunk}
+        except BaseException:
+            # Includes the client going away mid-stream.
+            self._discard_follow_ups(prefetch)
+            raise
 
         # Parse the final response
         parsed = self.answer_evaluator.parse_full_streaming_response(full_response)
@@ -223,14 +561,16 @@ class InterviewGraph:
         # Move to next question
         session.current_question_index += 1
 
-        await self.session_manager.save(session)
-
         # Get next question or None if complete
         next_question = await self.get_current_question(session)
-        is_complete = next_question is None
+        is_complete = self._is_complete(session)
+        self._take_follow_ups(session, next_question, prefetch)
+
+        await self.session_manager.save(session)
 
         if is_complete:
             await self.session_manager.complete_interview(session_id)
+        self._update_summary_later(session, is_complete)
 
         # Yield completion event
         yield {
@@ -247,6 +587,8 @@ class InterviewGraph:
         code: str,
         language: str,
         test_input: Optional[str] = None,
+        test_cases: Optional[List[Dict[str, str]]] = None,
+        idempotency_key: Optional[str] = None,
     ) -> CodeExecutionResult:
         """Execute code for a coding question.
 
@@ -256,10 +598,44 @@ class InterviewGraph:
             code: The code to execute
             language: Programming language
             test_input: Optional test input
+            test_cases: Optional test cases to run instead of test_input
+            idempotency_key: Client key identifying this run. Running code
+                does not advance the interview, so identical runs without a
+                key are executed again rather than treated as retries.
 
         Returns:
             CodeExecutionResult with execution output
         """
+
+        async def work() -> Dict[str, Any]:
+            result = await self._execute_code(
+                session_id, question_id, code, language, test_input, test_cases
+            )
+            return result.model_dump(mode="json")
+
+        if idempotency_key is None:
+            async with self.session_manager.lock(session_id):
+                return CodeExecutionResult.model_validate(await work())
+
+        result = await self.idempotency.run(
+            build_idempotency_key(
+                "execute_code", session_id, question_id, idempotency_key
+            ),
+            work,
+            lock=self._session_lock(session_id),
+            operation="execute_code",
+        )
+        return CodeExecutionResult.model_validate(result)
+
+    async def _execute_code(
+        self,
+        session_id: str,
+        question_id: str,
+        code: str,
+        language: str,
+        test_input: Optional[str],
+        test_cases: Optional[List[Dict[str, str]]],
+    ) -> CodeExecutionResult:
         session = await self.session_manager.get(session_id)
         if not session:
             raise ValueError(f"Session not found: {session_id}")
@@ -270,11 +646,18 @@ class InterviewGraph:
             raise ValueError(f"Question not found: {question_id}")
 
         # Execute the code
-        result = await self.code_executor.execute(
-            code=code,
-            language=language,
-            test_input=test_input,
-        )
+        if test_cases:
+            result = await self.code_executor.run_with_tests(
+                code=code,
+                language=language,
+                test_cases=test_cases,
+            )
+        else:
+            result = await self.code_executor.execute(
+                code=code,
+                language=language,
+                test_input=test_input,
+            )
 
         # Store the code submission
         question.code_submission = code
@@ -291,11 +674,41 @@ class InterviewGraph:
         code: str,
         language: str,
         test_input: Optional[str] = None,
+        test_cases: Optional[List[Dict[str, str]]] = None,
+        idempotency_key: Optional[str] = None,
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """Execute code and stream the evaluation.
 
-        Yields execution result then streams code review.
+        Yields program output as it is produced (or, when test cases are
+        given, each test case result as it finishes), then the execution
+        result, then streams code review. This submits the code as the
+        answer, so a retried submission replays the first one's events.
         """
+        async for event in self.idempotency.stream(
+            build_idempotency_key(
+                "execute_code_stream",
+                session_id,
+                question_id,
+                idempotency_key,
+                [code, language, test_input, test_cases],
+            ),
+            lambda: self._execute_code_streaming(
+                session_id, question_id, code, language, test_input, test_cases
+            ),
+            lock=self._session_lock(session_id),
+            operation="execute_code_stream",
+        ):
+            yield event
+
+    async def _execute_code_streaming(
+        self,
+        session_id: str,
+        question_id: str,
+        code: str,
+        language: str,
+        test_input: Optional[str],
+        test_cases: Optional[List[Dict[str, str]]],
+    ) -> AsyncGenerator[Dict[str, Any], None]:
         session = await self.session_manager.get(session_id)
         if not session:
             yield {"type": "error", "message": f"Session not found: {session_id}"}
@@ -318,11 +731,27 @@ class InterviewGraph:
             return
 
         # Execute the code
-        result = await self.code_executor.execute(
-            code=code,
-            language=language,
-            test_input=test_input,
-        )
+        if test_cases:
+            test_results = []
+            async for test_result in self.code_executor.stream_tests(
+                code=code,
+                language=language,
+                test_cases=test_cases,
+            ):
+                test_results.append(test_result)
+                yield {"type": "test_result", **test_result}
+            result = self.code_executor.summarize_tests(test_results)
+        else:
+            result = None
+            async for event in self.code_executor.execute_streaming(
+                code=code,
+                language=language,
+                test_input=test_input,
+            ):
+                if event["type"] == "output":
+                    yield event
+                else:
+                    result = event["result"]
 
         # Yield execution result
         yield {
@@ -331,6 +760,7 @@ class InterviewGraph:
             "stdout": result.stdout,
             "stderr": result.stderr,
             "execution_time_ms": result.execution_time_ms,
+            "test_results": result.test_results,
         }
 
         # Stream code review
@@ -358,10 +788,11 @@ class InterviewGraph:
         await self.session_manager.save(session)
 
         next_question = await self.get_current_question(session)
-        is_complete = next_question is None
+        is_complete = self._is_complete(session)
 
         if is_complete:
             await self.session_manager.complete_interview(session_id)
+        self._update_summary_later(session, is_complete)
 
         yield {
             "type": "complete",
@@ -382,34 +813,56 @@ class InterviewGraph:
         Returns:
             Dict with summary data
         """
-        session = await self.session_manager.get(session_id)
+        session = await self.session_manager.get(session_id, include_events=True)
         if not session:
             raise ValueError(f"Session not found: {session_id}")
 
         summary_data = await self.summary_generator.generate_summary(session)
 
-        # Update session with summary
-        session.final_score = summary_data.get("final_score", 0)
-        session.summary = summary_data.get("summary", "")
-        session.strengths = summary_data.get("strengths", [])
-        session.weaknesses = summary_data.get("weaknesses", [])
-        session.recommendations = summary_data.get("recommendations", [])
-        session.hiring_recommendation = summary_data.get(
-            "hiring_recommendation", "maybe"
+        await self._save_summary(
+            session_id,
+            summary_data,
+            final_score=summary_data.get("final_score", 0),
+            summary=summary_data.get("summary", ""),
         )
-        session.status = InterviewStatus.COMPLETED
-        session.completed_at = datetime.utcnow()
-
-        await self.session_manager.save(session)
 
         return summary_data
 
+    async def _save_summary(
+        self,
+        session_id: str,
+        summary_data: Dict[str, Any],
+        final_score: int,
+        summary: str,
+    ) -> InterviewSession:
+        """Store a finished summary on the latest copy of the session.
+
+        The summary takes seconds to generate, and background writers may
+        save the session meanwhile, so it is applied under the session lock.
+        """
+        async with self.session_manager.lock(session_id):
+            session = await self.session_manager.get(session_id)
+            if session is None:
+                raise ValueError(f"Session not found: {session_id}")
+            session.final_score = final_score
+            session.summary = summary
+            session.strengths = summary_data.get("strengths", [])
+            session.weaknesses = summary_data.get("weaknesses", [])
+            session.recommendations = summary_data.get("recommendations", [])
+            session.hiring_recommendation = summary_data.get(
+                "hiring_recommendation", "maybe"
+            )
+            session.status = InterviewStatus.COMPLETED
+            session.completed_at = datetime.utcnow()
+            await self.session_manager.save(session)
+            return session
+
     async def generate_summary_streaming(
         self,
         session_id: str,
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """Generate summary with streaming for SSE."""
-        session = await self.session_manager.get(session_id)
+        session = await self.session_manager.get(session_id, include_events=True)
         if not session:
             yield {"type": "error", "message": f"Session not found: {session_id}"}
             return
@@ -427,18 +880,9 @@ class InterviewGraph:
         max_score = len(session.questions) * 5
         final_score = round((total_score / max_score) * 100) if max_score > 0 else 0
 
-        session.final_score = final_score
-        session.summary = full_response
-        session.strengths = summary_data.get("strengths", [])
-        session.weaknesses = summary_data.get("weaknesses", [])
-        session.recommendations = summary_data.get("recommendations", [])
-        session.hiring_recommendation = summary_data.get(
-            "hiring_recommendation", "maybe"
+        session = await self._save_summary(
+            session_id, summary_data, final_score=final_score, summary=full_response
         )
-        session.status = InterviewStatus.COMPLETED
-        session.completed_at = datetime.utcnow()
-
-        await self.session_manager.save(session)
 
         yield {
             "type": "complete",
@@ -451,16 +895,52 @@ class InterviewGraph:
         self,
         session_id: str,
         question_id: str,
+        idempotency_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Skip the current question.
 
         Args:
             session_id: The session ID
             question_id: The question ID to skip
+            idempotency_key: Client key identifying this request; without
+                one, any repeated skip of the question counts as a retry
 
         Returns:
             Dict with next question info
         """
+
+        async def work() -> Dict[str, Any]:
+            result = await self._skip_question(session_id, question_id)
+            next_question = result["next_question"]
+            return {
+                **result,
+                "next_question": (
+                    next_question.model_dump(mode="json") if next_question else None
+                ),
+            }
+
+        result = await self.idempotency.run(
+            build_idempotency_key(
+                "skip_question", session_id, question_id, idempotency_key
+            ),
+            work,
+            lock=self._session_lock(session_id),
+            operation="skip_question",
+        )
+        return {
+            **result,
+            "next_question": (
+                InterviewQuestion.model_validate(result["next_question"])
+                if result["next_question"]
+                else None
+            ),
+        }
+
+    async def _skip_question(
+        self,
+        session_id: str,
+        question_id: str,
+    ) -> Dict[str, Any]:
         session = await self.session_manager.get(session_id)
         if not session:
             raise ValueError(f"Session not found: {session_id}")
@@ -479,10 +959,11 @@ class InterviewGraph:
         await self.session_manager.save(session)
 
         next_question = await self.get_current_question(session)
-        is_complete = next_question is None
+        is_complete = self._is_complete(session)
 
         if is_complete:
             await self.session_manager.complete_interview(session_id)
+        self._update_summary_later(session, is_complete)
 
         return {
             "skipped": True,
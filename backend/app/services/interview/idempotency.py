@@ -0,0 +1,248 @@
+"""Idempotent interview operations.
+
+Submitting an answer, code or a skip runs an evaluation and then advances the
+session, so a double click or a network retry must not run it twice. Each
+operation is keyed by the client's ``Idempotency-Key`` when one is sent and
+by the request payload otherwise:
+
+- a retry while the first request is still running attaches to it and gets
+  the same result (for streams: every event so far, then the rest live);
+- a retry after it finished gets the stored result without new work.
+
+Results are kept in Redis through the shared cache helpers, with a
+process-local copy when Redis is unavailable. Failures are not stored, so a
+retry after an error runs the operation again.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+)
+
+from app.core.broadcast import StreamBroadcast
+from app.core.cache import build_cache_key, get_cached_json, set_cached_json
+from app.core.metrics import increment
+from app.core.settings import get_settings
+
+settings = get_settings()
+
+_IDEMPOTENCY_NAMESPACE = "interview_idempotency"
+_LOCAL_RESULTS = 2048
+
+LockFactory = Callable[[], AsyncContextManager[None]]
+
+
+def build_idempotency_key(
+    operation: str,
+    session_id: str,
+    question_id: str,
+    client_key: Optional[str] = None,
+    payload: Any = None,
+) -> str:
+    """Key for one operation on one question, scoped to the session."""
+    if client_key:
+        identity = f"client:{client_key}"
+    else:
+        serialized = json.dumps(payload, sort_keys=True, default=str)
+        identity = "payload:" + hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+    return build_cache_key(
+        _IDEMPOTENCY_NAMESPACE,
+        json.dumps([operation, session_id, question_id, identity]),
+    )
+
+
+def _compact(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Merge consecutive text chunks; replays need not repeat the pacing."""
+    compacted: List[Dict[str, Any]] = []
+    for event in events:
+        previous = compacted[-1] if compacted else None
+        if (
+            previous is not None
+            and event.get("type") == "chunk"
+            and previous.get("type") == "chunk"
+        ):
+            compacted[-1] = {
+                **previous,
+                "content": previous["content"] + event["content"],
+            }
+        else:
+            compacted.append(event)
+    return compacted
+
+
+class IdempotentOperations:
+    """Runs each keyed operation once and shares its result with retries."""
+
+    def __init__(self):
+        self._local: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._running: Dict[str, asyncio.Task] = {}
+        self._streaming: Dict[str, StreamBroadcast] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def _ttl_seconds(self) -> int:
+        return settings.INTERVIEW_IDEMPOTENCY_TTL_SECONDS
+
+    async def _load(self, key: str) -> Optional[dict]:
+        record = await get_cached_json(key)
+        if record is not None:
+            return record
+        local = self._local.get(key)
+        if local is None:
+            return None
+        expires_at, record = local
+        if expires_at <= time.monotonic():
+            self._local.pop(key, None)
+            return None
+        return record
+
+    async def _store(self, key: str, record: dict) -> None:
+        self._local[key] = (time.monotonic() + self._ttl_seconds, record)
+        self._local.move_to_end(key)
+        while len(self._local) > _LOCAL_RESULTS:
+            self._local.popitem(last=False)
+        await set_cached_json(key, record, ttl_seconds=self._ttl_seconds)
+
+    def _track(self, task: asyncio.Task) -> None:
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        # Callers may all have gone; retrieve the outcome so it is not logged.
+        task.add_done_callback(lambda done: done.cancelled() or done.exception())
+
+    async def run(
+        self,
+        key: str,
+        work: Callable[[], Awaitable[Dict[str, Any]]],
+        *,
+        lock: LockFactory,
+        operation: str,
+    ) -> Dict[str, Any]:
+        """Run ``work`` under ``lock`` unless this key already ran or is running.
+
+        The work runs in its own task, so it still completes (and its result
+        is stored for the retry) if the caller that started it goes away.
+        """
+        stored = await self._load(key)
+        if stored is not None and "result" in stored:
+            increment("interview.idempotency", outcome="replayed", operation=operation)
+            return stored["result"]
+
+        task = self._running.get(key)
+        if task is None:
+            increment("interview.idempotency", outcome="executed", operation=operation)
+            task = asyncio.create_task(self._run_once(key, work, lock))
+            self._running[key] = task
+            self._track(task)
+            task.add_done_callback(lambda _: self._running.pop(key, None))
+        else:
+            increment("interview.idempotency", outcome="attached", operation=operation)
+        return await asyncio.shield(task)
+
+    async def _run_once(
+        self,
+        key: str,
+        work: Callable[[], Awaitable[Dict[str, Any]]],
+        lock: LockFactory,
+    ) -> Dict[str, Any]:
+        async with lock():
+            # Another process may have finished it while we waited.
+            stored = await self._load(key)
+            if stored is not None and "result" in stored:
+                return stored["result"]
+            result = await work()
+            await self._store(key, {"result": result})
+            return result
+
+    async def stream(
+        self,
+        key: str,
+        work: Callable[[], AsyncIterator[Dict[str, Any]]],
+        *,
+        lock: LockFactory,
+        operation: str,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream ``work``'s events once per key, sharing them with retries.
+
+        Only streams that end with a ``complete`` event are stored. If every
+        listener leaves before the end, the work is cancelled.
+        """
+        stored = await self._load(key)
+        if stored is not None and "events" in stored:
+            increment("interview.idempotency", outcome="replayed", operation=operation)
+            for event in stored["events"]:
+                yield event
+            return
+
+        broadcast = self._streaming.get(key)
+        if broadcast is None or broadcast.abandoned:
+            increment("interview.idempotency", outcome="executed", operation=operation)
+            broadcast = StreamBroadcast()
+            self._streaming[key] = broadcast
+            broadcast.task = asyncio.create_task(
+                self._stream_once(key, work, lock, broadcast)
+            )
+            self._track(broadcast.task)
+            broadcast.task.add_done_callback(lambda _: self._forget(key, broadcast))
+        else:
+            increment("interview.idempotency", outcome="attached", operation=operation)
+
+        async for event in broadcast.listen():
+            yield event
+
+    def _forget(self, key: str, broadcast: StreamBroadcast) -> None:
+        if self._streaming.get(key) is broadcast:
+            del self._streaming[key]
+
+    async def _stream_once(
+        self,
+        key: str,
+        work: Callable[[], AsyncIterator[Dict[str, Any]]],
+        lock: LockFactory,
+        broadcast: StreamBroadcast,
+    ) -> None:
+        events: List[Dict[str, Any]] = []
+        try:
+            async with lock():
+                stored = await self._load(key)
+                if stored is not None and "events" in stored:
+                    for event in stored["events"]:
+                        await broadcast.publish(event)
+                else:
+                    async for event in work():
+                        events.append(event)
+                        await broadcast.publish(event)
+                    if events and events[-1].get("type") == "complete":
+                        await self._store(key, {"events": _compact(events)})
+        except asyncio.CancelledError:
+            self._forget(key, broadcast)
+            await broadcast.finish(RuntimeError("Request was cancelled"))
+            raise
+        except Exception as error:
+            self._forget(key, broadcast)
+            await broadcast.finish(error)
+            return
+        await broadcast.finish()
+
+
+# Global idempotent operations registry
+_idempotent_operations: Optional[IdempotentOperations] = None
+
+
+def get_idempotent_operations() -> IdempotentOperations:
+    """Get or create the shared idempotent operations registry."""
+    global _idempotent_operations
+    if _idempotent_operations is None:
+        _idempotent_operations = IdempotentOperations()
+    return _idempotent_operations
@@ -1,25 +1,68 @@
 """Question generator service for interviews."""
 
 import json
+import logging
 import random
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from langchain_core.language_models import BaseChatModel
 
+from app.core.concurrency import as_completed_limited, gather_limited
 from app.core.llm import get_llm
-from app.data.prompt.interview_question import get_question_generation_prompt
+from app.data.prompt.interview_question import (
+    get_batch_question_generation_prompt,
+    get_follow_up_personalization_prompt,
+    get_question_generation_prompt,
+)
 from app.models.interview.enums import DifficultyLevel, QuestionSource
 from app.models.interview.schemas import InterviewQuestion
 from app.models.interview.templates import QuestionTemplate, get_template
+from app.services.interview.question_pool import (
+    QuestionPool,
+    QuestionPoolKey,
+    get_question_pool,
+    question_fingerprint,
+)
+from app.services.interview.question_similarity import NearDuplicateIndex
 from app.services.llm_helpers import chain_invoke_text_async
+from app.services.prompt_context import render_resume_context
+
+logger = logging.getLogger(__name__)
+
+_QUESTION_TYPES = ["technical", "behavioral", "role_based"]
+
+_FALLBACK_QUESTIONS = [
+    "Can you describe your experience with {topic} in your previous roles?",
+    "What challenges have you faced when working on {topic} and how did you overcome them?",
+    "How would you approach solving a complex problem related to {topic}?",
+    "Tell me about a project where you demonstrated skills relevant to {role}.",
+    "What is your approach to learning new technologies or concepts in {topic}?",
+]
+
+
+_FOLLOW_UPS = 3
+_FOLLOW_UP_ANSWER_CHARS = 2000
+
+
+def _question_type(idx: int) -> str:
+    return _QUESTION_TYPES[idx % len(_QUESTION_TYPES)]
 
 
 class QuestionGenerator:
     """Generates interview questions using LLM and templates."""
 
-    def __init__(self, llm: Optional[BaseChatModel] = None):
+    def __init__(
+        self,
+        llm: Optional[BaseChatModel] = None,
+        question_pool: Optional[QuestionPool] = None,
+    ):
         self.llm = llm or get_llm()
         self.prompt = get_question_generation_prompt()
+        self.batch_prompt = get_batch_question_generation_prompt()
+        self.follow_up_prompt = get_follow_up_personalization_prompt()
+        self.question_pool = (
+            question_pool if question_pool is not None else get_question_pool()
+        )
 
     async def generate_questions(
         self,
@@ -29,9 +72,15 @@ class QuestionGenerator:
         template_id: Optional[str] = None,
         topic: Optional[str] = None,
         resume_data: Optional[Dict[str, Any]] = None,
+        candidate_id: Optional[str] = None,
     ) -> List[InterviewQuestion]:
         """Generate a list of interview questions based on configuration.
 
+        Template questions are used first, then (for sessions without a
+        resume) the pre-generated question pool. The remaining questions come
+        from a single batched LLM call; any it misses are generated
+        concurrently.
+
         Args:
             role: The job role for the interview
             num_questions: Total number of questions to generate
@@ -39,88 +88,335 @@ class QuestionGenerator:
             template_id: Optional template ID to use predefined questions
             topic: Optional topic focus
             resume_data: Optional candidate resume data for personalization
+            candidate_id: Optional stable candidate identity, used so pooled
+                questions are not repeated for the same candidate
 
         Returns:
             List of InterviewQuestion objects
         """
-        questions: List[InterviewQuestion] = []
-        existing_question_texts: List[str] = []
+        template = get_template(template_id) if template_id else None
+        difficulties = self._plan_difficulties(num_questions, difficulty_distribution)
+        question_topic = self._resolve_topic(topic, template)
+
+        questions: Dict[int, InterviewQuestion] = {}
+        llm_slots = self._fill_template_questions(template, difficulties, questions)
+        template_indexes = set(questions)
+        if not resume_data:
+            llm_slots = await self._fill_pool_questions(
+                llm_slots, role, question_topic, template_id, candidate_id, questions
+            )
+
+        if llm_slots:
+            existing = [q.question for q in questions.values()]
+            generated = await self._generate_llm_batch(
+                llm_slots, role, question_topic, resume_data, existing
+            )
 
-        # Get template if specified
+            missing = [slot for slot in llm_slots if slot[0] not in generated]
+            if missing:
+                existing += [q.question for q in generated.values()]
+                results = await gather_limited(
+                    self._generate_llm_question(
+                        idx=idx,
+                        role=role,
+                        difficulty=difficulty,
+                        topic=question_topic,
+                        resume_data=resume_data,
+                        existing_questions=existing,
+                    )
+                    for idx, difficulty in missing
+                )
+                for (idx, difficulty), result in zip(missing, results):
+                    if not isinstance(result, InterviewQuestion):
+                        result = self._get_fallback_question(
+                            idx, role, difficulty, question_topic
+                        )
+                    generated[idx] = result
+
+            questions.update(generated)
+
+        seen = self._build_duplicate_index(template)
+        duplicates = [
+            questions[idx]
+            for idx in range(len(difficulties))
+            if idx not in template_indexes
+            and not seen.add_if_unique(questions[idx].question)
+        ]
+        if duplicates:
+            duplicate_indexes = {q.index for q in duplicates}
+            accepted = [
+                q.question
+                for q in questions.values()
+                if q.index not in duplicate_indexes
+            ]
+            replacements = await gather_limited(
+                self._regenerate_unique(
+                    question, seen, role, question_topic, resume_data, accepted
+                )
+                for question in duplicates
+            )
+            for question, replacement in zip(duplicates, replacements):
+                if not isinstance(replacement, InterviewQuestion):
+                    replacement = self._fallback_unique(question, seen, role)
+                questions[question.index] = replacement
+
+        return [questions[idx] for idx in range(len(difficulties))]
+
+    async def stream_questions(
+        self,
+        role: str,
+        num_questions: int,
+        difficulty_distribution: Dict[str, int],
+        template_id: Optional[str] = None,
+        topic: Optional[str] = None,
+        resume_data: Optional[Dict[str, Any]] = None,
+        candidate_id: Optional[str] = None,
+    ) -> AsyncIterator[InterviewQuestion]:
+        """Yield questions in order, each as soon as it is ready.
+
+        Every LLM question is its own concurrent call, so the first one is
+        available after a single round trip instead of after the whole set.
+        Takes the same arguments as ``generate_questions``.
+        """
         template = get_template(template_id) if template_id else None
+        difficulties = self._plan_difficulties(num_questions, difficulty_distribution)
+        question_topic = self._resolve_topic(topic, template)
+
+        ready: Dict[int, InterviewQuestion] = {}
+        llm_slots = self._fill_template_questions(template, difficulties, ready)
+        template_indexes = set(ready)
+        if not resume_data:
+            llm_slots = await self._fill_pool_questions(
+                llm_slots, role, question_topic, template_id, candidate_id, ready
+            )
 
-        # Build question list based on difficulty distribution
-        question_specs: List[Dict[str, Any]] = []
-        total_requested = 0
+        seen = self._build_duplicate_index(template)
+        for idx in sorted(set(ready) - template_indexes):
+            # Pooled questions that clash are generated like any other slot.
+            if not seen.add_if_unique(ready[idx].question):
+                llm_slots.append((idx, ready.pop(idx).difficulty))
+        llm_slots.sort()
+        existing = [q.question for q in ready.values()]
+
+        next_idx = 0
+
+        def take_ready() -> List[InterviewQuestion]:
+            nonlocal next_idx
+            released: List[InterviewQuestion] = []
+            while next_idx in ready:
+                released.append(ready.pop(next_idx))
+                next_idx += 1
+            return released
+
+        for question in take_ready():
+            yield question
+
+        jobs = [
+            self._generate_llm_question(
+                idx=idx,
+                role=role,
+                difficulty=difficulty,
+                topic=question_topic,
+                resume_data=resume_data,
+                existing_questions=existing,
+            )
+            for idx, difficulty in llm_slots
+        ]
+        async for position, result in as_completed_limited(jobs):
+            idx, difficulty = llm_slots[position]
+            if not isinstance(result, InterviewQuestion):
+                result = self._get_fallback_question(
+                    idx, role, difficulty, question_topic
+                )
+            if not seen.add_if_unique(result.question):
+                result = await self._regenerate_unique(
+                    result, seen, role, question_topic, resume_data, existing
+                )
+            ready[idx] = result
+            for question in take_ready():
+                yield question
+
+    def _plan_difficulties(
+        self,
+        num_questions: int,
+        difficulty_distribution: Dict[str, int],
+    ) -> List[DifficultyLevel]:
+        """Expand the difficulty distribution into one entry per question."""
+        difficulties: List[DifficultyLevel] = []
         for difficulty_str, count in difficulty_distribution.items():
             try:
                 difficulty = DifficultyLevel(difficulty_str)
             except ValueError:
                 difficulty = DifficultyLevel.MEDIUM
-            for _ in range(count):
-                question_specs.append({"difficulty": difficulty})
-                total_requested += 1
+            difficulties.extend([difficulty] * count)
 
         # Pad or trim to match num_questions
-        if total_requested < num_questions:
-            remaining = num_questions - total_requested
-            fallback_difficulties = [
-                DifficultyLevel.MEDIUM,
-                DifficultyLevel.EASY,
-                DifficultyLevel.HARD,
-            ]
-            for i in range(remaining):
-                question_specs.append(
-                    {
-                        "difficulty": fallback_difficulties[
-                            i % len(fallback_difficulties)
-                        ]
-                    }
-                )
+        fallback_difficulties = [
+            DifficultyLevel.MEDIUM,
+            DifficultyLevel.EASY,
+            DifficultyLevel.HARD,
+        ]
+        for i in range(num_questions - len(difficulties)):
+            difficulties.append(fallback_difficulties[i % len(fallback_difficulties)])
 
-        # Limit to num_questions
-        question_specs = question_specs[:num_questions]
+        return difficulties[:num_questions]
 
-        # Generate each question
-        for idx, spec in enumerate(question_specs):
-            difficulty = spec["difficulty"]
+    def _resolve_topic(self, topic: Optional[str], template: Optional[Any]) -> str:
+        if topic:
+            return topic
+        if template and template.topics:
+            return template.topics[0]
+        return "General"
 
-            # Try to use template question first
-            template_question = self._get_template_question(
-                template, difficulty, existing_question_texts
+    def _fill_template_questions(
+        self,
+        template: Optional[Any],
+        difficulties: List[DifficultyLevel],
+        questions: Dict[int, InterviewQuestion],
+    ) -> List[Tuple[int, DifficultyLevel]]:
+        """Place template questions into ``questions`` by index.
+
+        Returns:
+            ``(index, difficulty)`` slots that still need an LLM question
+        """
+        used: List[str] = []
+        llm_slots: List[Tuple[int, DifficultyLevel]] = []
+
+        for idx, difficulty in enumerate(difficulties):
+            template_question = self._get_template_question(template, difficulty, used)
+            if not template_question:
+                llm_slots.append((idx, difficulty))
+                continue
+
+            questions[idx] = InterviewQuestion(
+                index=idx,
+                question=template_question.question,
+                difficulty=difficulty,
+                source=template_question.source,
+                topic=template_question.topic,
+                expected_keywords=template_question.expected_keywords,
+                follow_up_questions=template_question.follow_up_questions,
+                code_challenge=template_question.code_challenge,
             )
+            used.append(template_question.question)
+
+        return llm_slots
+
+    async def _fill_pool_questions(
+        self,
+        llm_slots: List[Tuple[int, DifficultyLevel]],
+        role: str,
+        topic: str,
+        template_id: Optional[str],
+        candidate_id: Optional[str],
+        questions: Dict[int, InterviewQuestion],
+    ) -> List[Tuple[int, DifficultyLevel]]:
+        """Place pooled questions into ``questions`` and schedule pool refills.
+
+        Returns:
+            Slots the pool could not cover
+        """
+        if self.question_pool is None or not llm_slots:
+            return llm_slots
+
+        exclude = {question_fingerprint(q.question) for q in questions.values()}
+        indexes_by_difficulty: Dict[DifficultyLevel, List[int]] = {}
+        for idx, difficulty in llm_slots:
+            indexes_by_difficulty.setdefault(difficulty, []).append(idx)
 
-            if template_question:
-                question = InterviewQuestion(
-                    index=idx,
-                    question=template_question.question,
-                    difficulty=difficulty,
-                    source=template_question.source,
-                    topic=template_question.topic,
-                    expected_keywords=template_question.expected_keywords,
-                    follow_up_questions=template_question.follow_up_questions,
-                    code_challenge=template_question.code_challenge,
+        remaining: List[Tuple[int, DifficultyLevel]] = []
+        for difficulty, indexes in indexes_by_difficulty.items():
+            key = QuestionPoolKey.build(role, topic, difficulty, template_id)
+            try:
+                drawn = await self.question_pool.draw(
+                    key, len(indexes), candidate_id=candidate_id, exclude=exclude
                 )
-            else:
-                # Generate with LLM
-                question = await self._generate_llm_question(
-                    idx=idx,
-                    role=role,
-                    difficulty=difficulty,
-                    topic=topic
-                    or (
-                        template.topics[0]
-                        if template and template.topics
-                        else "General"
-                    ),
-                    resume_data=resume_data,
-                    existing_questions=existing_question_texts,
+            except Exception as error:
+                logger.warning("Question pool draw failed: %s", error)
+                drawn = []
+
+            for idx, question in zip(indexes, drawn):
+                question.index = idx
+                questions[idx] = question
+                exclude.add(question_fingerprint(question.question))
+            remaining.extend((idx, difficulty) for idx in indexes[len(drawn) :])
+
+            self.question_pool.schedule_refill(
+                key,
+                self._pool_refill(role, topic, difficulty),
+                shortfall=len(indexes) - len(drawn),
+            )
+
+        return sorted(remaining)
+
+    def _pool_refill(self, role: str, topic: str, difficulty: DifficultyLevel):
+        async def refill(count: int, existing: List[str]) -> List[InterviewQuestion]:
+            # The pool is shared, so fill it with the server-default model
+            # rather than a user's own LLM configuration.
+            llm = get_llm()
+            if count == 1:
+                # Too few slots for a batched call
+                question = await self._try_llm_question(
+                    0, role, difficulty, topic, None, existing, llm=llm
                 )
+                return [question] if question is not None else []
+            slots = [(idx, difficulty) for idx in range(count)]
+            generated = await self._generate_llm_batch(
+                slots, role, topic, None, existing, llm=llm
+            )
+            return list(generated.values())
+
+        return refill
 
-            questions.append(question)
-            existing_question_texts.append(question.question)
+    def _build_duplicate_index(self, template: Optional[Any]) -> NearDuplicateIndex:
+        """Start a near-duplicate index seeded with the template question bank."""
+        seen = NearDuplicateIndex()
+        if template and template.question_bank:
+            for template_question in template.question_bank:
+                seen.add(template_question.question)
+        return seen
+
+    async def _regenerate_unique(
+        self,
+        question: InterviewQuestion,
+        seen: NearDuplicateIndex,
+        role: str,
+        topic: str,
+        resume_data: Optional[Dict[str, Any]],
+        existing_questions: List[str],
+    ) -> InterviewQuestion:
+        """Replace a near-duplicate with one fresh LLM question or a fallback."""
+        if self.llm:
+            retry = await self._generate_llm_question(
+                idx=question.index,
+                role=role,
+                difficulty=question.difficulty,
+                topic=topic,
+                resume_data=resume_data,
+                existing_questions=existing_questions + [question.question],
+            )
+            if seen.add_if_unique(retry.question):
+                return retry
+        return self._fallback_unique(question, seen, role)
 
-        return questions
+    def _fallback_unique(
+        self,
+        question: InterviewQuestion,
+        seen: NearDuplicateIndex,
+        role: str,
+    ) -> InterviewQuestion:
+        """Swap a near-duplicate for a fallback question not yet used."""
+        for offset in range(len(_FALLBACK_QUESTIONS)):
+            candidate = self._get_fallback_question(
+                question.index + offset,
+                role,
+                question.difficulty,
+                question.topic or "General",
+            )
+            if seen.add_if_unique(candidate.question):
+                candidate.index = question.index
+                return candidate
+        return question
 
     def _get_template_question(
         self,
@@ -144,6 +440,98 @@ class QuestionGenerator:
 
         return random.choice(matching)
 
+    def _format_candidate_background(
+        self, resume_data: Optional[Dict[str, Any]]
+    ) -> str:
+        if not resume_data:
+            return "No resume provided"
+        return render_resume_context(resume_data)[:2000]
+
+    def _build_llm_question(
+        self,
+        idx: int,
+        difficulty: DifficultyLevel,
+        topic: str,
+        parsed: Dict[str, Any],
+    ) -> InterviewQuestion:
+        question_type = _question_type(idx)
+        return InterviewQuestion(
+            index=idx,
+            question=parsed.get(
+                "question", f"Tell me about your experience with {topic}"
+            ),
+            difficulty=difficulty,
+            source=QuestionSource(question_type)
+            if question_type in [e.value for e in QuestionSource]
+            else QuestionSource.ROLE_BASED,
+            topic=topic,
+            expected_keywords=parsed.get("expected_keywords", []),
+            follow_up_questions=parsed.get("follow_up_questions", []),
+        )
+
+    async def _generate_llm_batch(
+        self,
+        llm_slots: List[Tuple[int, DifficultyLevel]],
+        role: str,
+        topic: str,
+        resume_data: Optional[Dict[str, Any]],
+        existing_questions: List[str],
+        llm: Optional[BaseChatModel] = None,
+    ) -> Dict[int, InterviewQuestion]:
+        """Generate questions for several slots in one structured LLM call.
+
+        ``llm`` overrides the generator's model (used for pool refills).
+
+        Returns:
+            Questions keyed by index; slots the response did not cover are
+            left out so the caller can generate them individually.
+        """
+        llm = llm or self.llm
+        if not llm or len(llm_slots) < 2:
+            return {}
+
+        question_slots = "\n".join(
+            f"{number}. Difficulty: {difficulty.value}; "
+            f"Question Type: {_question_type(idx)}"
+            for number, (idx, difficulty) in enumerate(llm_slots, 1)
+        )
+        existing_str = (
+            "\n".join(f"- {q}" for q in existing_questions)
+            if existing_questions
+            else "None"
+        )
+
+        try:
+            content = await chain_invoke_text_async(
+                self.batch_prompt | llm,
+                {
+                    "role": role,
+                    "topic": topic,
+                    "candidate_background": self._format_candidate_background(
+                        resume_data
+                    ),
+                    "existing_questions": existing_str,
+                    "question_slots": question_slots,
+                },
+                cache_namespace="interview_question_batch_generation",
+            )
+        except Exception as error:
+            logger.warning("Batched question generation failed: %s", error)
+            return {}
+
+        generated: Dict[int, InterviewQuestion] = {}
+        for position, item in enumerate(self._parse_batch_response(content)):
+            slot_number = item.get("slot", position + 1)
+            if not isinstance(slot_number, int) or not 1 <= slot_number <= len(
+                llm_slots
+            ):
+                continue
+            idx, difficulty = llm_slots[slot_number - 1]
+            if idx in generated or not str(item.get("question", "")).strip():
+                continue
+            generated[idx] = self._build_llm_question(idx, difficulty, topic, item)
+        return generated
+
     async def _generate_llm_question(
         self,
         idx: int,
@@ -153,15 +541,32 @@ class QuestionGenerator:
         resume_data: Optional[Dict[str, Any]],
         existing_questions: List[str],
     ) -> InterviewQuestion:
-        """Generate a question using the LLM."""
+        """Generate a question using the LLM, or a fallback question."""
+        question = await self._try_llm_question(
+            idx, role, difficulty, topic, resume_data, existing_questions
+        )
+        return question or self._get_fallback_question(idx, role, difficulty, topic)
+
+    async def _try_llm_question(
+        self,
+        idx: int,
+        role: str,
+        difficulty: DifficultyLevel,
+        topic: str,
+        resume_data: Optional[Dict[str, Any]],
+        existing_questions: List[str],
+        llm: Optional[BaseChatModel] = None,
+    ) -> Optional[InterviewQuestion]:
+        """Generate a question using the LLM; None when that fails.
+
+        ``llm`` overrides the generator's model (used for pool refills).
+        """
+        llm = llm or self.llm
         # Determine question type based on index and difficulty
-        question_types = ["technical", "behavioral", "role_based"]
-        question_type = question_types[idx % len(question_types)]
+        question_type = _question_type(idx)
 
         # Format candidate background
-        candidate_background = "No resume provided"
-        if resume_data:
-            candidate_background = json.dumps(resume_data, indent=2)[:2000]
+        candidate_background = self._format_candidate_background(resume_data)
 
         # Format existing questions
         existing_str = (
@@ -171,8 +576,8 @@ class QuestionGenerator:
         )
 
         # Create chain and invoke
-        if self.llm:
-            chain = self.prompt | self.llm
+        if llm:
+            chain = self.prompt | llm
 
             try:
                 content = await chain_invoke_text_async(
@@ -184,31 +589,36 @@ class QuestionGenerator:
                         "question_type": question_type,
                         "candidate_background": candidate_background,
                         "existing_questions": existing_str,
-                        "additional_context": "",
+                        # Slots generated concurrently share the rest of the
+                        # payload, so the position keeps their cache keys apart.
+                        "additional_context": (
+                            f"This is question {idx + 1} of the interview."
+                        ),
                     },
                     cache_namespace="interview_question_generation",
                 )
 
                 parsed = self._parse_question_response(content)
 
-                return InterviewQuestion(
-                    index=idx,
-                    question=parsed.get(
-                        "question", f"Tell me about your experience with {topic}"
-                    ),
-                    difficulty=difficulty,
-                    source=QuestionSource(question_type)
-                    if question_type in [e.value for e in QuestionSource]
-                    else QuestionSource.ROLE_BASED,
-                    topic=topic,
-                    expected_keywords=parsed.get("expected_keywords", []),
-                    follow_up_questions=parsed.get("follow_up_questions", []),
-                )
-            except Exception as e:
-                # Fallback question on error
-                return self._get_fallback_question(idx, role, difficulty, topic)
+                return self._build_llm_question(idx, difficulty, topic, parsed)
+            except Exception:
+                return None
+
+        return None
+
+    def _parse_batch_response(self, content: str) -> List[Dict[str, Any]]:
+        """Parse a batched LLM response into a list of question dicts."""
+        start = content.find("{")
+        end = content.rfind("}") + 1
+        if start == -1 or end <= start:
+            return []
+        try:
+            parsed = json.loads(content[start:end])
+        except json.JSONDecodeError:
+            return []
 
-        return self._get_fallback_question(idx, role, difficulty, topic)
+        items = parsed.get("questions", []) if isinstance(parsed, dict) else []
+        return [item for item in items if isinstance(item, dict)]
 
     def _parse_question_response(self, content: str) -> Dict[str, Any]:
         """Parse the LLM response to extract question data."""
@@ -233,17 +643,11 @@ class QuestionGenerator:
         topic: str,
     ) -> InterviewQuestion:
         """Get a fallback question if LLM generation fails."""
-        fallback_questions = [
-            f"Can you describe your experience with {topic} in your previous roles?",
-            f"What challenges have you faced when working on {topic} and how did you overcome them?",
-            f"How would you approach solving a complex problem related to {topic}?",
-            f"Tell me about a project where you demonstrated skills relevant to {role}.",
-            f"What is your approach to learning new technologies or concepts in {topic}?",
-        ]
+        fallback = _FALLBACK_QUESTIONS[idx % len(_FALLBACK_QUESTIONS)]
 
         return InterviewQuestion(
             index=idx,
-            question=fallback_questions[idx % len(fallback_questions)],
+            question=fallback.format(role=role, topic=topic),
             difficulty=difficulty,
             source=QuestionSource.BEHAVIORAL,
             topic=topic,
@@ -268,3 +672,46 @@ class QuestionGenerator:
             resume_data=resume_data,
             existing_questions=existing_questions,
         )
+
+    async def personalize_follow_ups(
+        self,
+        question: InterviewQuestion,
+        previous_question: InterviewQuestion,
+        answer: str,
+        role: str,
+    ) -> List[str]:
+        """Rewrite a question's follow-ups to build on the previous answer.
+
+        Returns:
+            The personalized follow-ups, or an empty list if none could be
+            generated
+        """
+        if not self.llm:
+            return []
+
+        follow_ups = (
+            "\n".join(f"- {f}" for f in question.follow_up_questions)
+            if question.follow_up_questions
+            else "None"
+        )
+        try:
+            content = await chain_invoke_text_async(
+                self.follow_up_prompt | self.llm,
+                {
+                    "role": role,
+                    "previous_question": previous_question.question,
+                    "answer": answer[:_FOLLOW_UP_ANSWER_CHARS],
+                    "question": question.question,
+                    "follow_up_questions": follow_ups,
+                },
+                cache_namespace="interview_follow_up_generation",
+            )
+        except Exception as error:
+            logger.warning("Follow-up personalization failed: %s", error)
+            return []
+
+        parsed = self._parse_question_response(content).get("follow_up_questions")
+        if not isinstance(parsed, list):
+            return []
+        personalized = [str(item).strip() for item in parsed if str(item).strip()]
+        return personalized[:_FOLLOW_UPS]
@@ -0,0 +1,283 @@
+"""Pre-generated interview question pool for non-personalized sessions."""
+
+import asyncio
+import hashlib
+import logging
+import random
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+from app.core.cache import build_cache_key, get_cached_json, set_cached_json
+from app.core.metrics import increment
+from app.core.settings import get_settings
+from app.models.interview.enums import DifficultyLevel
+from app.models.interview.schemas import InterviewQuestion, generate_uuid
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_POOL_NAMESPACE = "interview_question_pool"
+_SEEN_NAMESPACE = "interview_question_pool_seen"
+# How long a candidate is kept from seeing the same pooled question again
+_SEEN_TTL_SECONDS = 30 * 24 * 3600
+_SEEN_LIMIT = 500
+_LOCAL_SEEN_CANDIDATES = 1024
+
+
+def _normalize(value: Optional[str]) -> str:
+    return " ".join((value or "").lower().split())
+
+
+def question_fingerprint(text: str) -> str:
+    """Stable short hash of a question's normalized text."""
+    return hashlib.sha256(_normalize(text).encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class QuestionPoolKey:
+    """Identifies one pool: normalized role, topic, difficulty and template."""
+
+    role: str
+    topic: str
+    difficulty: DifficultyLevel
+    template_id: str = ""
+
+    @classmethod
+    def build(
+        cls,
+        role: str,
+        topic: str,
+        difficulty: DifficultyLevel,
+        template_id: Optional[str] = None,
+    ) -> "QuestionPoolKey":
+        return cls(_normalize(role), _normalize(topic), difficulty, template_id or "")
+
+    @property
+    def cache_key(self) -> str:
+        payload = "|".join(
+            (self.role, self.topic, self.difficulty.value, self.template_id)
+        )
+        return build_cache_key(_POOL_NAMESPACE, payload)
+
+
+RefillFn = Callable[[int, List[str]], Awaitable[List[InterviewQuestion]]]
+
+
+class QuestionPool:
+    """Background-filled pool of reusable LLM questions.
+
+    Pools live in Redis through the shared cache helpers, with a process-local
+    copy when Redis is unavailable. Entries older than
+    ``INTERVIEW_QUESTION_POOL_MAX_AGE_HOURS`` are dropped on read, and each
+    candidate's drawn questions are remembered so they are not served to the
+    same candidate twice.
+    """
+
+    def __init__(self):
+        self._local_pools: Dict[str, List[dict]] = {}
+        self._local_seen: OrderedDict[str, List[str]] = OrderedDict()
+        self._refilling: Set[str] = set()
+        self._refill_tasks: Set[asyncio.Task] = set()
+
+    @property
+    def _max_age_seconds(self) -> int:
+        return settings.INTERVIEW_QUESTION_POOL_MAX_AGE_HOURS * 3600
+
+    async def _load_entries(self, key: QuestionPoolKey) -> List[dict]:
+        record = await get_cached_json(key.cache_key)
+        entries = record.get("entries") if record else None
+        if not isinstance(entries, list):
+            entries = self._local_pools.get(key.cache_key, [])
+
+        cutoff = time.time() - self._max_age_seconds
+        return [
+            entry
+            for entry in entries
+            if isinstance(entry, dict) and entry.get("created_at", 0) >= cutoff
+        ]
+
+    async def _store_entries(self, key: QuestionPoolKey, entries: List[dict]) -> None:
+        entries = entries[-settings.INTERVIEW_QUESTION_POOL_TARGET_SIZE :]
+        self._local_pools[key.cache_key] = entries
+        await set_cached_json(
+            key.cache_key,
+            {"entries": entries},
+            ttl_seconds=self._max_age_seconds,
+        )
+
+    async def _load_seen(self, candidate_id: Optional[str]) -> List[str]:
+        if not candidate_id:
+            return []
+        record = await get_cached_json(build_cache_key(_SEEN_NAMESPACE, candidate_id))
+        seen = record.get("seen") if record else None
+        if isinstance(seen, list):
+            return seen
+        return list(self._local_seen.get(candidate_id, []))
+
+    async def _store_seen(self, candidate_id: str, seen: List[str]) -> None:
+        seen = seen[-_SEEN_LIMIT:]
+        self._local_seen[candidate_id] = seen
+        self._local_seen.move_to_end(candidate_id)
+        while len(self._local_seen) > _LOCAL_SEEN_CANDIDATES:
+            self._local_seen.popitem(last=False)
+        await set_cached_json(
+            build_cache_key(_SEEN_NAMESPACE, candidate_id),
+            {"seen": seen},
+            ttl_seconds=_SEEN_TTL_SECONDS,
+        )
+
+    async def draw(
+        self,
+        key: QuestionPoolKey,
+        count: int,
+        *,
+        candidate_id: Optional[str] = None,
+        exclude: Optional[Set[str]] = None,
+    ) -> List[InterviewQuestion]:
+        """Take up to ``count`` fresh questions the candidate has not seen.
+
+        Args:
+            key: Pool to draw from
+            count: Number of questions wanted
+            candidate_id: Stable candidate identity for exclusion, if known
+            exclude: Fingerprints of questions already in the session
+
+        Returns:
+            Copies of pooled questions with new IDs (may be fewer than count)
+        """
+        if count <= 0:
+            return []
+
+        entries = await self._load_entries(key)
+        seen = await self._load_seen(candidate_id)
+        blocked = set(seen) | (exclude or set())
+
+        eligible = [
+            entry for entry in entries if entry.get("fingerprint") not in blocked
+        ]
+        drawn = random.sample(eligible, min(count, len(eligible)))
+
+        questions = [
+            InterviewQuestion.model_validate(
+                {**entry["question"], "id": generate_uuid()}
+            )
+            for entry in drawn
+        ]
+
+        increment(
+            "interview.question_pool.draws",
+            len(questions),
+            outcome="hit",
+            difficulty=key.difficulty.value,
+        )
+        increment(
+            "interview.question_pool.draws",
+            count - len(questions),
+            outcome="miss",
+            difficulty=key.difficulty.value,
+        )
+
+        if candidate_id and drawn:
+            await self._store_seen(
+                candidate_id, seen + [entry["fingerprint"] for entry in drawn]
+            )
+        return questions
+
+    async def add(
+        self, key: QuestionPoolKey, questions: List[InterviewQuestion]
+    ) -> int:
+        """Add newly generated questions, skipping ones already pooled.
+
+        Returns:
+            Number of questions added
+        """
+        entries = await self._load_entries(key)
+        known = {entry.get("fingerprint") for entry in entries}
+        now = time.time()
+
+        added = 0
+        for question in questions:
+            fingerprint = question_fingerprint(question.question)
+            if fingerprint in known:
+                continue
+            known.add(fingerprint)
+            entries.append(
+                {
+                    "fingerprint": fingerprint,
+                    "created_at": now,
+                    "question": question.model_dump(
+                        mode="json",
+                        include={
+                            "question",
+                            "difficulty",
+                            "source",
+                            "topic",
+                            "expected_keywords",
+                            "follow_up_questions",
+                            "code_challenge",
+                        },
+                    )
+                    | {"index": 0},
+                }
+            )
+            added += 1
+
+        if added:
+            await self._store_entries(key, entries)
+        return added
+
+    def schedule_refill(
+        self, key: QuestionPoolKey, refill: RefillFn, *, shortfall: int = 0
+    ) -> None:
+        """Top the pool up to its target size in the background.
+
+        ``refill(count, existing_texts)`` generates up to ``count`` questions.
+        ``shortfall`` is how many questions a draw lacked because the
+        candidate had seen the rest; that many are generated even when the
+        pool is full, replacing its oldest entries. At most one refill per
+        pool runs in this process at a time.
+        """
+        if key.cache_key in self._refilling:
+            return
+        self._refilling.add(key.cache_key)
+        task = asyncio.create_task(self._refill(key, refill, shortfall))
+        self._refill_tasks.add(task)
+        task.add_done_callback(self._refill_tasks.discard)
+
+    async def _refill(
+        self, key: QuestionPoolKey, refill: RefillFn, shortfall: int = 0
+    ) -> None:
+        try:
+            entries = await self._load_entries(key)
+            target = settings.INTERVIEW_QUESTION_POOL_TARGET_SIZE
+            missing = min(max(target - len(entries), shortfall), target)
+            if missing <= 0:
+                return
+            existing = [entry["question"]["question"] for entry in entries]
+            generated = await refill(missing, existing)
+            added = await self.add(key, generated)
+            increment(
+                "interview.question_pool.refilled",
+                added,
+                difficulty=key.difficulty.value,
+            )
+        except Exception as error:
+            logger.warning("Question pool refill failed: %s", error)
+        finally:
+            self._refilling.discard(key.cache_key)
+
+
+# Global question pool instance
+_question_pool: Optional[QuestionPool] = None
+
+
+def get_question_pool() -> Optional[QuestionPool]:
+    """Get the shared question pool, or None when pooling is disabled."""
+    global _question_pool
+    if not settings.INTERVIEW_QUESTION_POOL_ENABLED:
+        return None
+    if _question_pool is None:
+        _question_pool = QuestionPool()
+    return _question_pool
@@ -0,0 +1,116 @@
+"""Local near-duplicate detection for interview questions (MinHash)."""
+
+import re
+import zlib
+from typing import FrozenSet, Iterable, List, Tuple
+
+# Words that carry no topic on their own in interview questions.
+_STOPWORDS = frozenset(
+    """
+    a an the of in on to and or for with your you how what is are do does did
+    can would could should tell me about describe explain between time
+    situation where when which that this it its had have has been be was were
+    we i my our as at by from into within some any give example walk through
+    """.split()
+)
+_SUFFIXES = ("ing", "ed", "es", "s", "e")
+
+_NUM_PERMUTATIONS = 64
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Fixed (a, b) pairs so signatures are comparable across processes.
+_PERMUTATIONS: List[Tuple[int, int]] = [
+    (
+        (zlib.crc32(f"a{seed}".encode()) * 2654435761 + 1) % _MERSENNE_PRIME,
+        zlib.crc32(f"b{seed}".encode()) % _MERSENNE_PRIME,
+    )
+    for seed in range(_NUM_PERMUTATIONS)
+]
+
+# Content words per shingle
+_SHINGLE_WORDS = 3
+
+# Estimated Jaccard similarity of shingle sets above which two questions
+# count as the same. Rephrasings ("What is / Explain the difference between
+# a process and a thread") score 0.65 and up; questions differing in one
+# topic word ("optimize" / "debug a slow Python web application") about 0.5.
+NEAR_DUPLICATE_THRESHOLD = 0.6
+
+
+def _stem(word: str) -> str:
+    if word.endswith("ss"):
+        # "process", not a plural
+        return word
+    for suffix in _SUFFIXES:
+        if len(word) > 4 and word.endswith(suffix):
+            return word[: -len(suffix)]
+    return word
+
+
+def question_shingles(text: str) -> FrozenSet[str]:
+    """Three-word shingles of a question's content words, lightly stemmed.
+
+    Shingles rather than single words, so questions that share a subject but
+    ask different things ("hash map handles collisions" / "resizing") are
+    kept apart. Questions with fewer content words are one shingle.
+    """
+    words = [
+        _stem(word)
+        for word in re.findall(r"[a-z0-9+#]+", text.lower())
+        if word not in _STOPWORDS
+    ]
+    if len(words) <= _SHINGLE_WORDS:
+        return frozenset([" ".join(words)]) if words else frozenset()
+    return frozenset(
+        " ".join(words[index : index + _SHINGLE_WORDS])
+        for index in range(len(words) - _SHINGLE_WORDS + 1)
+    )
+
+
+def minhash_signature(shingles: Iterable[str]) -> Tuple[int, ...]:
+    """MinHash signature of a shingle set."""
+    hashes = [zlib.crc32(shingle.encode("utf-8")) for shingle in shingles]
+    if not hashes:
+        return (_MAX_HASH,) * _NUM_PERMUTATIONS
+    return tuple(
+        min((a * value + b) % _MERSENNE_PRIME for value in hashes)
+        for a, b in _PERMUTATIONS
+    )
+
+
+def estimated_similarity(first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+    """Estimate Jaccard similarity from two MinHash signatures."""
+    matches = sum(1 for a, b in zip(first, second) if a == b)
+    return matches / _NUM_PERMUTATIONS
+
+
+class NearDuplicateIndex:
+    """Signatures of accepted questions, checked before accepting another.
+
+    Interviews have at most a few dozen questions plus a template bank, so a
+    linear scan over signatures is cheaper than maintaining LSH buckets.
+    """
+
+    __slots__ = ("_signatures", "threshold")
+
+    def __init__(self, threshold: float = NEAR_DUPLICATE_THRESHOLD):
+        self._signatures: List[Tuple[int, ...]] = []
+        self.threshold = threshold
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def add(self, text: str) -> None:
+        self._signatures.append(minhash_signature(question_shingles(text)))
+
+    def add_if_unique(self, text: str) -> bool:
+        """Add ``text`` unless it is a near-duplicate; return whether added."""
+        signature = minhash_signature(question_shingles(text))
+        if any(
+            estimated_similarity(signature, existing) >= self.threshold
+            for existing in self._signatures
+        ):
+            return False
+        self._signatures.append(signature)
+        return True
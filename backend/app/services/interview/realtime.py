@@ -0,0 +1,190 @@
+"""Resumable WebSocket channels for interview sessions.
+
+A channel carries every interaction of one session over a single WebSocket:
+client requests are tagged with an ``id`` and run concurrently, and every
+message sent back gets a sequence number (``seq``) and is kept in a bounded
+replay buffer. When the connection drops, running operations carry on for
+``INTERVIEW_WS_RESUME_GRACE_SECONDS``; a client that reconnects with the last
+``seq`` it saw receives everything it missed. After the grace period the
+channel's operations are cancelled and the channel is dropped.
+
+Channels live in the process that accepted the socket. A client reconnecting
+to another process (or too late) is told it was not resumed, and can resend
+its requests with their idempotency keys to get the stored results.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+from starlette.websockets import WebSocket, WebSocketDisconnect
+
+from app.core.metrics import increment, observe
+from app.core.settings import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Close code sent to a connection superseded by a newer one for the session
+REPLACED_CLOSE_CODE = 4000
+
+
+class InterviewChannel:
+    """Server side of one session's WebSocket, surviving reconnects."""
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self.seq = 0
+        self._buffer: Deque[Dict[str, Any]] = deque(
+            maxlen=settings.INTERVIEW_WS_REPLAY_BUFFER
+        )
+        self._outbox: Optional[asyncio.Queue] = None
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._expiry: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def connected(self) -> bool:
+        return self._outbox is not None
+
+    def _can_resume(self, resume_from: int) -> bool:
+        if resume_from > self.seq:
+            # Sequence numbers from another process or an expired channel.
+            return False
+        return not self._buffer or self._buffer[0]["seq"] <= resume_from + 1
+
+    def attach(
+        self, resume_from: Optional[int] = None
+    ) -> Tuple[asyncio.Queue, Optional[List[Dict[str, Any]]]]:
+        """Send future messages to a new connection.
+
+        Returns:
+            The connection's outbox, and the messages it missed since
+            ``resume_from`` (None when they cannot be replayed)
+        """
+        if self._expiry is not None:
+            self._expiry.cancel()
+            self._expiry = None
+        if self._outbox is not None:
+            # Tell the previous connection's sender to close its socket.
+            self._drain(self._outbox)
+            self._outbox.put_nowait(None)
+
+        replay = None
+        if resume_from is not None and self._can_resume(resume_from):
+            replay = [
+                message for message in self._buffer if message["seq"] > resume_from
+            ]
+        self._outbox = asyncio.Queue(maxsize=settings.INTERVIEW_WS_SEND_QUEUE_SIZE)
+        return self._outbox, replay
+
+    def detach(self, outbox: asyncio.Queue) -> None:
+        """Stop sending to a closed connection and start the grace period."""
+        if outbox is not self._outbox:
+            return
+        self._outbox = None
+        # Unblocks operations waiting for room; the buffer keeps everything.
+        self._drain(outbox)
+        self._expiry = asyncio.get_running_loop().call_later(
+            settings.INTERVIEW_WS_RESUME_GRACE_SECONDS, self._expire
+        )
+
+    @staticmethod
+    def _drain(outbox: asyncio.Queue) -> None:
+        while not outbox.empty():
+            outbox.get_nowait()
+
+    def _expire(self) -> None:
+        self._expiry = None
+        if self.connected:
+            return
+        self.close()
+        if _channels.get(self.session_id) is self:
+            del _channels[self.session_id]
+        increment("interview.ws.channels_expired")
+
+    async def emit(self, message: Dict[str, Any]) -> None:
+        """Number, buffer and send one message.
+
+        Waits while the connected client is behind, so producers slow down
+        to the pace of the socket.
+        """
+        self.seq += 1
+        message = {"seq": self.seq, **message}
+        self._buffer.append(message)
+        if self._outbox is not None:
+            await self._outbox.put(message)
+
+    def start(self, request_id: str, events: AsyncIterator[Dict[str, Any]]) -> None:
+        """Run one client request, emitting its events tagged with its id."""
+        if request_id in self._tasks:
+            # Resent after a reconnect; its output is already on the way.
+            return
+        task = asyncio.create_task(self._run(request_id, events))
+        self._tasks[request_id] = task
+
+    async def _run(self, request_id: str, events: AsyncIterator[Dict[str, Any]]):
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            async for event in events:
+                await self.emit({"id": request_id, **event})
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            await self.emit({"id": request_id, "type": "error", "message": str(error)})
+        finally:
+            self._tasks.pop(request_id, None)
+            observe("interview.ws.request_ms", (loop.time() - started) * 1000)
+        await self.emit({"id": request_id, "type": "done"})
+
+    def cancel(self, request_id: str) -> bool:
+        task = self._tasks.get(request_id)
+        if task is None:
+            return False
+        task.cancel()
+        return True
+
+    def close(self) -> None:
+        """Cancel every running request."""
+        for task in list(self._tasks.values()):
+            task.cancel()
+        self._tasks.clear()
+
+
+async def send_channel_messages(
+    websocket: WebSocket,
+    outbox: asyncio.Queue,
+    replay: Optional[List[Dict[str, Any]]] = None,
+) -> None:
+    """Write a connection's missed and then live messages to its socket."""
+    try:
+        for message in replay or []:
+            await websocket.send_json(message)
+        while (message := await outbox.get()) is not None:
+            await websocket.send_json(message)
+        await websocket.close(
+            code=REPLACED_CLOSE_CODE, reason="Replaced by a newer connection"
+        )
+    except (WebSocketDisconnect, RuntimeError):
+        # The socket closed under us; the receive loop detaches the channel.
+        pass
+
+
+# Channels of sessions with a connected (or recently connected) client
+_channels: Dict[str, InterviewChannel] = {}
+
+
+def get_interview_channel(session_id: str) -> InterviewChannel:
+    """Get the session's channel, creating it on first connection."""
+    channel = _channels.get(session_id)
+    if channel is None:
+        channel = _channels[session_id] = InterviewChannel(session_id)
+    return channel
+
+
+def close_interview_channels() -> None:
+    """Cancel every channel's requests; called on shutdown."""
+    for channel in list(_channels.values()):
+        channel.close()
+    _channels.clear()
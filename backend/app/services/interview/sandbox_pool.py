@@ -0,0 +1,314 @@
+"""Warm worker pools for interview code execution.
+
+Starting an interpreter per submission dominates the latency of short
+programs (and ``npx ts-node`` alone can take seconds). Each pool keeps a few
+long-lived language workers (see ``sandbox_workers/``) that receive code and
+input as JSON lines over a pipe and run it in a fresh, resource-limited child.
+Workers are recycled after ``INTERVIEW_SANDBOX_WORKER_MAX_RUNS`` runs or when
+they crash; callers fall back to a cold subprocess whenever no warm worker can
+serve the request.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import signal
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional, Set
+
+from app.core.metrics import increment, observe
+from app.core.settings import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_WORKER_DIR = Path(__file__).resolve().parent / "sandbox_workers"
+
+WORKER_COMMANDS: Dict[str, List[str]] = {
+    "python": ["python3", "-I", str(_WORKER_DIR / "python_worker.py")],
+    "javascript": ["node", str(_WORKER_DIR / "node_worker.js"), "javascript"],
+    "typescript": ["node", str(_WORKER_DIR / "node_worker.js"), "typescript"],
+}
+
+_STARTUP_TIMEOUT_SECONDS = 10
+# Extra time on top of the run timeout for the worker to report back
+_RESPONSE_GRACE_SECONDS = 2
+_ACQUIRE_POLL_SECONDS = 1
+# Responses carry the output cap plus JSON escaping (up to 6 bytes per byte)
+_STREAM_LIMIT = 16 * 1024 * 1024
+
+
+class SandboxWorkerError(RuntimeError):
+    """A warm worker failed to start or stopped responding."""
+
+
+class SandboxWorker:
+    """One long-lived language worker process."""
+
+    def __init__(self, language: str, command: List[str]):
+        self.language = language
+        self.command = command
+        self.runs = 0
+        self._process: Optional[asyncio.subprocess.Process] = None
+
+    @property
+    def alive(self) -> bool:
+        return self._process is not None and self._process.returncode is None
+
+    async def start(self) -> None:
+        try:
+            self._process = await asyncio.create_subprocess_exec(
+                *self.command,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                limit=_STREAM_LIMIT,
+                # Own process group, so closing the worker also ends any
+                # program it is still running.
+                start_new_session=True,
+            )
+            line = await asyncio.wait_for(
+                self._process.stdout.readline(), timeout=_STARTUP_TIMEOUT_SECONDS
+            )
+            message = json.loads(line) if line else {}
+        except (OSError, ValueError, asyncio.TimeoutError) as error:
+            await self.close()
+            raise SandboxWorkerError(
+                f"{self.language} worker failed to start: {error}"
+            ) from error
+
+        if not message.get("ready"):
+            await self.close()
+            raise SandboxWorkerError(
+                f"{self.language} worker failed to start: "
+                f"{message.get('error', 'no ready message')}"
+            )
+
+    async def stream(self, request: dict, timeout: float) -> AsyncIterator[dict]:
+        """Send one request and yield its messages until the worker is done.
+
+        ``timeout`` is the per-input timeout; every input reports within it.
+        """
+        if not self.alive:
+            raise SandboxWorkerError(f"{self.language} worker is not running")
+
+        self.runs += len(request.get("tests") or [{}])
+        try:
+            self._process.stdin.write((json.dumps(request) + "\n").encode("utf-8"))
+            await self._process.stdin.drain()
+        except (OSError, ValueError) as error:
+            raise SandboxWorkerError(
+                f"{self.language} worker stopped responding: {error}"
+            ) from error
+
+        while True:
+            try:
+                line = await asyncio.wait_for(
+                    self._process.stdout.readline(),
+                    timeout=timeout + _RESPONSE_GRACE_SECONDS,
+                )
+            except (OSError, ValueError, asyncio.TimeoutError) as error:
+                raise SandboxWorkerError(
+                    f"{self.language} worker stopped responding: {error}"
+                ) from error
+
+            if not line:
+                raise SandboxWorkerError(f"{self.language} worker exited")
+            response = json.loads(line)
+            if response.get("done"):
+                return
+            if "error" in response:
+                raise SandboxWorkerError(response["error"])
+            yield response
+
+    async def close(self) -> None:
+        process, self._process = self._process, None
+        if process is None or process.returncode is not None:
+            return
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        await process.wait()
+
+
+class SandboxPool:
+    """Fixed-size pool of warm workers for one language."""
+
+    def __init__(
+        self,
+        language: str,
+        size: int,
+        max_runs: Optional[int] = None,
+        command: Optional[List[str]] = None,
+    ):
+        self.language = language
+        self.size = size
+        self.max_runs = max_runs or settings.INTERVIEW_SANDBOX_WORKER_MAX_RUNS
+        self.command = command or WORKER_COMMANDS[language]
+        self._idle: asyncio.Queue[SandboxWorker] = asyncio.Queue()
+        self._workers: Set[SandboxWorker] = set()
+        self._starting = 0
+        self._closed = False
+        self._replace_tasks: Set[asyncio.Task] = set()
+
+    @property
+    def available(self) -> bool:
+        """Whether a worker is idle, busy or on its way up."""
+        return not self._closed and (bool(self._workers) or self._starting > 0)
+
+    async def start(self) -> None:
+        await asyncio.gather(*(self._spawn() for _ in range(self.size)))
+        if not self._workers:
+            logger.warning(
+                "No warm %s workers available; using cold execution", self.language
+            )
+
+    async def _spawn(self) -> None:
+        self._starting += 1
+        worker = SandboxWorker(self.language, self.command)
+        try:
+            await worker.start()
+        except SandboxWorkerError as error:
+            logger.warning("%s", error)
+            return
+        finally:
+            self._starting -= 1
+
+        if self._closed:
+            await worker.close()
+            return
+        self._workers.add(worker)
+        self._idle.put_nowait(worker)
+        increment("interview.sandbox.workers_started", language=self.language)
+
+    def _replace(self, worker: SandboxWorker) -> None:
+        self._workers.discard(worker)
+        if self._closed:
+            return
+        # Count the replacement as starting right away so waiting callers
+        # keep queueing instead of falling back to a cold run.
+        self._starting += 1
+        task = asyncio.create_task(self._recycle(worker))
+        self._replace_tasks.add(task)
+        task.add_done_callback(self._replace_tasks.discard)
+
+    async def _recycle(self, worker: SandboxWorker) -> None:
+        try:
+            await worker.close()
+        finally:
+            self._starting -= 1
+        await self._spawn()
+
+    async def _acquire(self) -> Optional[SandboxWorker]:
+        while True:
+            try:
+                worker = await asyncio.wait_for(
+                    self._idle.get(), timeout=_ACQUIRE_POLL_SECONDS
+                )
+            except asyncio.TimeoutError:
+                # Every worker died and none could be restarted.
+                if not self.available:
+                    return None
+                continue
+            if worker.alive:
+                return worker
+            increment(
+                "interview.sandbox.recycled", language=self.language, reason="crash"
+            )
+            self._replace(worker)
+
+    async def stream(self, request: dict, timeout: float) -> AsyncIterator[dict]:
+        """Run a request on a warm worker, yielding its messages as they arrive.
+
+        Messages are live output chunks (``{"index", "stream", "data"}``, only
+        when the request sets ``stream_output``) and one result per input.
+
+        Yields nothing further if no warm worker could serve the request or
+        the worker failed partway; the caller runs whatever inputs did not
+        report on the cold path.
+        """
+        if not self.available:
+            return
+
+        loop = asyncio.get_running_loop()
+        queued_at = loop.time()
+        worker = await self._acquire()
+        if worker is None:
+            return
+        observe(
+            "interview.sandbox.queue_wait_ms",
+            (loop.time() - queued_at) * 1000,
+            language=self.language,
+        )
+
+        finished = False
+        try:
+            async for response in worker.stream(request, timeout):
+                yield response
+            finished = True
+        except SandboxWorkerError as error:
+            logger.warning("Recycling crashed %s worker: %s", self.language, error)
+            increment(
+                "interview.sandbox.recycled", language=self.language, reason="crash"
+            )
+        except (asyncio.CancelledError, GeneratorExit):
+            # The caller gave up mid-run; killing the worker stops the program.
+            increment(
+                "interview.sandbox.recycled", language=self.language, reason="cancelled"
+            )
+            raise
+        finally:
+            if not finished:
+                # The worker may still owe responses; never hand it out again.
+                self._replace(worker)
+            elif worker.runs >= self.max_runs:
+                increment(
+                    "interview.sandbox.recycled",
+                    language=self.language,
+                    reason="max_runs",
+                )
+                self._replace(worker)
+            else:
+                self._idle.put_nowait(worker)
+
+    async def close(self) -> None:
+        self._closed = True
+        for task in list(self._replace_tasks):
+            task.cancel()
+        await asyncio.gather(
+            *(worker.close() for worker in self._workers), return_exceptions=True
+        )
+        self._workers.clear()
+
+
+# Global sandbox pools, started with the application
+_sandbox_pools: Dict[str, SandboxPool] = {}
+
+
+async def start_sandbox_pools(sizes: Optional[Dict[str, int]] = None) -> None:
+    """Start warm worker pools for every language with a non-zero size."""
+    sizes = settings.INTERVIEW_SANDBOX_POOL_SIZES if sizes is None else sizes
+    pools = [
+        SandboxPool(language, size)
+        for language, size in sizes.items()
+        if size > 0 and language in WORKER_COMMANDS
+    ]
+    await asyncio.gather(*(pool.start() for pool in pools))
+    for pool in pools:
+        _sandbox_pools[pool.language] = pool
+
+
+async def close_sandbox_pools() -> None:
+    pools = list(_sandbox_pools.values())
+    _sandbox_pools.clear()
+    await asyncio.gather(*(pool.close() for pool in pools))
+
+
+def get_sandbox_pool(language: str) -> Optional[SandboxPool]:
+    """Get the started pool for ``language``, if it has any workers."""
+    pool = _sandbox_pools.get(language)
+    if pool is None or not pool.available:
+        return None
+    return pool
@@ -0,0 +1,167 @@
+// Warm JavaScript / TypeScript sandbox worker.
+//
+// Started once by the code executor's worker pool and kept alive between
+// runs. Requests and responses are JSON lines on stdin/stdout. A request
+// carries the candidate's code and one or more test inputs; the code is
+// transpiled (for TypeScript, with the compiler kept loaded) and written once,
+// then every input runs in a fresh child process, up to `parallelism` at a
+// time with its own timeout. One response line is written per input as soon
+// as it finishes, followed by {"done": true}. With `stream_output` set,
+// output is also forwarded live as {"index", "stream", "data"} lines.
+
+const { spawn } = require("child_process");
+const fs = require("fs");
+const os = require("os");
+const path = require("path");
+const readline = require("readline");
+const { StringDecoder } = require("string_decoder");
+
+const language = process.argv[2] || "javascript";
+
+function send(message) {
+  process.stdout.write(JSON.stringify(message) + "\n");
+}
+
+function loadTypeScript() {
+  const searchPaths = [
+    process.cwd(),
+    path.join(path.dirname(process.execPath), "..", "lib", "node_modules"),
+  ];
+  try {
+    return require(require.resolve("typescript", { paths: searchPaths }));
+  } catch (error) {
+    return null;
+  }
+}
+
+const ts = language === "typescript" ? loadTypeScript() : null;
+if (language === "typescript" && !ts) {
+  send({ ready: false, error: "typescript package not found" });
+  process.exit(1);
+}
+
+const workdir = fs.mkdtempSync(path.join(os.tmpdir(), "sandbox-"));
+let runs = 0;
+
+function runOne(index, file, input, request) {
+  const limits = request.limits || {};
+  const maxOutput = request.max_output || 10000;
+  const args = [];
+  if (limits.memory_mb) {
+    args.push(`--max-old-space-size=${limits.memory_mb}`);
+  }
+  args.push(file);
+
+  return new Promise((resolve) => {
+    const started = process.hrtime.bigint();
+    const child = spawn(process.execPath, args, {
+      stdio: ["pipe", "pipe", "pipe"],
+    });
+    const output = { stdout: [], stderr: [] };
+    let captured = 0;
+    let timedOut = false;
+    let truncated = false;
+
+    const timer = setTimeout(() => {
+      timedOut = true;
+      child.kill("SIGKILL");
+    }, (request.timeout || 10) * 1000);
+
+    for (const stream of ["stdout", "stderr"]) {
+      const decoder = new StringDecoder("utf8");
+      child[stream].on("data", (chunk) => {
+        const room = maxOutput - captured;
+        if (room > 0) {
+          const accepted = chunk.subarray(0, room);
+          output[stream].push(accepted);
+          if (request.stream_output) {
+            const data = decoder.write(accepted);
+            if (data) {
+              send({ index, stream, data });
+            }
+          }
+        }
+        captured += Math.min(chunk.length, Math.max(room, 0));
+        if (chunk.length > room && !truncated) {
+          truncated = true;
+          child.kill("SIGKILL");
+        }
+      });
+    }
+    child.stdin.on("error", () => {});
+    child.stdin.end(input);
+
+    child.on("close", (status) => {
+      clearTimeout(timer);
+      resolve({
+        index,
+        stdout: Buffer.concat(output.stdout).toString("utf8"),
+        stderr: Buffer.concat(output.stderr).toString("utf8"),
+        exit_code: status === null ? -1 : status,
+        timed_out: timedOut,
+        truncated,
+        elapsed_ms: Math.round(
+          Number(process.hrtime.bigint() - started) / 1e6
+        ),
+      });
+    });
+  });
+}
+
+async function run(request) {
+  let source = request.code;
+  if (ts) {
+    source = ts.transpileModule(source, {
+      compilerOptions: {
+        module: ts.ModuleKind.CommonJS,
+        target: ts.ScriptTarget.ES2020,
+      },
+    }).outputText;
+  }
+
+  runs += 1;
+  const file = path.join(workdir, `solution-${runs}.js`);
+  fs.writeFileSync(file, source);
+
+  const inputs = (request.tests || [{}]).map((test) => test.input || "");
+  const parallelism = Math.max(1, request.parallelism || 1);
+  let next = 0;
+
+  async function lane() {
+    while (next < inputs.length) {
+      const index = next++;
+      send(await runOne(index, file, inputs[index], request));
+    }
+  }
+
+  try {
+    await Promise.all(
+      Array.from({ length: Math.min(parallelism, inputs.length) }, lane)
+    );
+  } finally {
+    fs.rmSync(file, { force: true });
+  }
+}
+
+// Requests are handled one at a time; the pool never sends a second request
+// before the first one's "done" line.
+let queue = Promise.resolve();
+const lines = readline.createInterface({ input: process.stdin });
+lines.on("line", (line) => {
+  if (!line.trim()) {
+    return;
+  }
+  queue = queue.then(async () => {
+    try {
+      await run(JSON.parse(line));
+    } catch (error) {
+      send({ error: String(error) });
+    }
+    send({ done: true });
+  });
+});
+lines.on("close", () => {
+  queue.then(() => fs.rmSync(workdir, { recursive: true, force: true }));
+});
+
+send({ ready: true });
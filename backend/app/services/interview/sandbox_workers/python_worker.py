@@ -0,0 +1,267 @@
+"""Warm Python sandbox worker.
+
+Started once by the code executor's worker pool and kept alive between runs.
+Requests and responses are JSON lines on stdin/stdout. A request carries the
+candidate's code and one or more test inputs; the code is compiled once and
+every input runs in a fresh ``fork()`` of this process, so candidate code
+never sees state left behind by another run and interpreter startup is paid
+only once per worker. Up to ``parallelism`` inputs run at the same time, each
+with its own timeout, and one response line is written per input as soon as
+it finishes, followed by ``{"done": true}``. With ``stream_output`` set,
+output is also forwarded live as ``{"index", "stream", "data"}`` lines.
+"""
+
+import codecs
+import json
+import linecache
+import os
+import resource
+import select
+import signal
+import sys
+import tempfile
+import time
+import traceback
+
+_READ_CHUNK = 65536
+_FILENAME = "solution.py"
+# How often to poll for children that closed their pipes but have not exited
+_REAP_POLL_SECONDS = 0.001
+
+
+def _apply_limits(limits):
+    cpu_seconds = limits.get("cpu_seconds")
+    if cpu_seconds:
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds + 1))
+    memory_mb = limits.get("memory_mb")
+    if memory_mb:
+        memory = memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (memory, memory))
+    # Candidate code has no business writing files.
+    resource.setrlimit(resource.RLIMIT_FSIZE, (0, 0))
+
+
+def _run_child(compiled, stdin_fd, out_w, err_w, limits):
+    exit_code = 1
+    try:
+        os.dup2(stdin_fd, 0)
+        os.dup2(out_w, 1)
+        os.dup2(err_w, 2)
+        sys.stdin = open(0, "r", closefd=False)
+        sys.stdout = open(1, "w", closefd=False)
+        sys.stderr = open(2, "w", closefd=False)
+        _apply_limits(limits)
+
+        namespace = {"__name__": "__main__", "__builtins__": __builtins__}
+        exec(compiled, namespace)
+        exit_code = 0
+    except SystemExit as error:
+        if error.code is None:
+            exit_code = 0
+        elif isinstance(error.code, int):
+            exit_code = error.code
+        else:
+            print(error.code, file=sys.stderr)
+            exit_code = 1
+    except BaseException as error:
+        # Drop this worker's own frame so tracebacks match a cold run.
+        traceback.print_exception(error.__class__, error, error.__traceback__.tb_next)
+        exit_code = 1
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(exit_code)
+
+
+class _Child:
+    """One forked run: its pipes, captured output and deadline."""
+
+    def __init__(self, index, pid, out_r, err_r, timeout, max_output):
+        self.index = index
+        self.pid = pid
+        self.out_r = out_r
+        self.err_r = err_r
+        self.started = time.monotonic()
+        self.deadline = self.started + timeout
+        self.max_output = max_output
+        self.buffers = {out_r: bytearray(), err_r: bytearray()}
+        self.decoders = {
+            fd: codecs.getincrementaldecoder("utf-8")(errors="replace")
+            for fd in self.buffers
+        }
+        self.open_fds = [out_r, err_r]
+        self.captured = 0
+        self.timed_out = False
+        self.truncated = False
+        self.status = None
+
+    def read(self, fd):
+        """Read available output; return the newly captured text."""
+        chunk = os.read(fd, _READ_CHUNK)
+        if not chunk:
+            self.open_fds.remove(fd)
+            os.close(fd)
+            return ""
+        room = self.max_output - self.captured
+        accepted = chunk[:room]
+        self.buffers[fd].extend(accepted)
+        self.captured += len(accepted)
+        if len(chunk) > room:
+            self.truncated = True
+        return self.decoders[fd].decode(accepted)
+
+    def stream_name(self, fd):
+        return "stdout" if fd == self.out_r else "stderr"
+
+    def reap(self, block=False):
+        """Collect the exit status; True once the child has exited."""
+        if self.status is None:
+            pid, status = os.waitpid(self.pid, 0 if block else os.WNOHANG)
+            if pid:
+                self.status = status
+        return self.status is not None
+
+    def finish(self):
+        for fd in self.open_fds:
+            os.close(fd)
+        self.open_fds = []
+        if self.status is None and (self.timed_out or self.truncated):
+            try:
+                os.kill(self.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+        self.reap(block=True)
+
+        status = self.status
+        if os.WIFEXITED(status):
+            exit_code = os.WEXITSTATUS(status)
+        else:
+            exit_code = -os.WTERMSIG(status)
+            # The CPU rlimit (SIGXCPU) is a timeout as well.
+            if os.WTERMSIG(status) == signal.SIGXCPU:
+                self.timed_out = True
+
+        return {
+            "index": self.index,
+            "stdout": self.buffers[self.out_r].decode("utf-8", errors="replace"),
+            "stderr": self.buffers[self.err_r].decode("utf-8", errors="replace"),
+            "exit_code": exit_code,
+            "timed_out": self.timed_out,
+            "truncated": self.truncated,
+            "elapsed_ms": int((time.monotonic() - self.started) * 1000),
+        }
+
+
+def _spawn(index, compiled, stdin_data, timeout, max_output, limits):
+    with tempfile.TemporaryFile() as stdin_file:
+        stdin_file.write(stdin_data.encode("utf-8"))
+        stdin_file.seek(0)
+        out_r, out_w = os.pipe()
+        err_r, err_w = os.pipe()
+
+        sys.stdout.flush()
+        pid = os.fork()
+        if pid == 0:
+            os.close(out_r)
+            os.close(err_r)
+            _run_child(compiled, stdin_file.fileno(), out_w, err_w, limits)
+
+        os.close(out_w)
+        os.close(err_w)
+    return _Child(index, pid, out_r, err_r, timeout, max_output)
+
+
+def _compile_error(index, error):
+    return {
+        "index": index,
+        "stdout": "",
+        "stderr": "".join(traceback.format_exception_only(error.__class__, error)),
+        "exit_code": 1,
+        "timed_out": False,
+        "truncated": False,
+        "elapsed_ms": 0,
+    }
+
+
+def _run(request, emit):
+    code = request["code"]
+    inputs = [test.get("input") or "" for test in request.get("tests") or [{}]]
+    timeout = float(request.get("timeout", 10))
+    max_output = int(request.get("max_output", 10000))
+    parallelism = max(1, int(request.get("parallelism", 1)))
+    limits = request.get("limits") or {}
+    stream_output = bool(request.get("stream_output"))
+
+    # Let tracebacks show source lines without a file on disk.
+    linecache.cache[_FILENAME] = (len(code), None, code.splitlines(True), _FILENAME)
+    try:
+        compiled = compile(code, _FILENAME, "exec")
+    except (SyntaxError, ValueError) as error:
+        for index in range(len(inputs)):
+            emit(_compile_error(index, error))
+        return
+
+    pending = list(enumerate(inputs))
+    running = []
+    while pending or running:
+        while pending and len(running) < parallelism:
+            index, stdin_data = pending.pop(0)
+            running.append(
+                _spawn(index, compiled, stdin_data, timeout, max_output, limits)
+            )
+
+        now = time.monotonic()
+        for child in list(running):
+            if child.truncated or (not child.open_fds and child.reap()):
+                done = True
+            elif now >= child.deadline:
+                child.timed_out = True
+                done = True
+            else:
+                done = False
+            if done:
+                running.remove(child)
+                emit(child.finish())
+        if not running:
+            continue
+
+        fds = {fd: child for child in running for fd in child.open_fds}
+        wait = max(0.0, min(child.deadline for child in running) - now)
+        if any(not child.open_fds for child in running):
+            wait = min(wait, _REAP_POLL_SECONDS)
+        readable, _, _ = select.select(list(fds), [], [], wait)
+        for fd in readable:
+            child = fds[fd]
+            text = child.read(fd)
+            if text and stream_output:
+                emit(
+                    {
+                        "index": child.index,
+                        "stream": child.stream_name(fd),
+                        "data": text,
+                    }
+                )
+
+
+def main():
+    protocol = sys.stdout
+
+    def emit(message):
+        protocol.write(json.dumps(message) + "\n")
+        protocol.flush()
+
+    emit({"ready": True})
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            _run(json.loads(line), emit)
+        except Exception as error:
+            emit({"error": str(error)})
+        emit({"done": True})
+
+
+if __name__ == "__main__":
+    main()
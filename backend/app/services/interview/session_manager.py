@@ -1,8 +1,12 @@
 """Session manager for interview sessions with caching and persistence."""
 
-from datetime import datetime
-from typing import Dict, List, Optional
+import asyncio
+import logging
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import AsyncContextManager, List, Optional
 
+from app.core.settings import get_settings
 from app.models.interview.enums import InterviewEventType, InterviewStatus
 from app.models.interview.schemas import (
     CandidateProfile,
@@ -10,20 +14,75 @@ from app.models.interview.schemas import (
     InterviewEvent,
     InterviewSession,
 )
+from app.services.interview.session_store import (
+    InMemorySessionStore,
+    SessionStore,
+    create_session_store,
+)
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
 
 
 class SessionManager:
-    """Manages interview sessions with in-memory caching.
+    """Manages interview sessions on top of a pluggable :class:`SessionStore`.
 
-    For production, this can be extended to persist to PostgreSQL
-    via the Next.js API routes or directly using asyncpg.
+    The in-memory store keeps everything in this process; the Redis and
+    Postgres stores let several workers and replicas share sessions. Events
+    for remote stores are buffered and written behind in batches.
     """
 
-    def __init__(self):
-        # In-memory session storage
-        self._sessions: Dict[str, InterviewSession] = {}
-        # In-memory event storage
-        self._events: Dict[str, List[InterviewEvent]] = {}
+    def __init__(self, store: Optional[SessionStore] = None):
+        self._store = store or InMemorySessionStore()
+        # Write-behind buffer for events not yet persisted
+        self._pending_events: List[InterviewEvent] = []
+        self._pending_counts: Counter = Counter()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._sweep_task: Optional[asyncio.Task] = None
+
+    @property
+    def backend_name(self) -> str:
+        """Name of the storage backend in use."""
+        return self._store.name
+
+    async def start(self) -> None:
+        """Connect the storage backend and start the expiry sweeper.
+
+        Falls back to the in-memory store if the backend is unavailable.
+        """
+        try:
+            await self._store.connect()
+        except Exception as error:
+            logger.warning(
+                "Interview session backend %r unavailable, using memory: %s",
+                self._store.name,
+                error,
+            )
+            self._store = InMemorySessionStore()
+
+        if self._sweep_task is None or self._sweep_task.done():
+            self._sweep_task = asyncio.create_task(self._sweep_expired_sessions())
+
+    async def close(self) -> None:
+        """Stop the sweeper, flush buffered events and release the backend."""
+        for task in (self._sweep_task, self._flush_task):
+            if task and not task.done():
+                task.cancel()
+        self._sweep_task = None
+        await self.flush_events()
+        await self._store.close()
+
+    async def _sweep_expired_sessions(self) -> None:
+        interval = max(settings.INTERVIEW_SESSION_SWEEP_INTERVAL_SECONDS, 1)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                removed = await self.cleanup_old_sessions()
+            except Exception as error:
+                logger.warning("Interview session sweep failed: %s", error)
+                continue
+            if removed:
+                logger.info("Expired %d interview sessions", removed)
 
     async def create(
         self,
@@ -46,29 +105,58 @@ class SessionManager:
             created_at=datetime.utcnow(),
         )
 
-        self._sessions[session.session_id] = session
-        self._events[session.session_id] = []
+        await self._store.save(session)
 
         return session
 
-    async def get(self, session_id: str) -> Optional[InterviewSession]:
+    async def get(
+        self,
+        session_id: str,
+        include_events: bool = False,
+    ) -> Optional[InterviewSession]:
         """Get a session by ID.
 
         Args:
             session_id: The session ID to look up
+            include_events: Also load the full event list into ``session.events``
+                of a copy, so the stored session never holds the events
 
         Returns:
             InterviewSession if found, None otherwise
         """
-        return self._sessions.get(session_id)
+        session = await self._store.load(session_id)
+        if session is None:
+            return None
+
+        session.tab_switch_count = await self.count_events(
+            session_id, InterviewEventType.TAB_SWITCH
+        )
+        if include_events:
+            events = await self.get_events(session_id)
+            session = session.model_copy(
+                update={"events": [event.model_dump() for event in events]}
+            )
+
+        return session
 
     async def save(self, session: InterviewSession) -> None:
         """Save/update a session.
 
         Args:
             session: The session to save
+
+        Raises:
+            SessionConflictError: If the session changed since it was loaded
         """
-        self._sessions[session.session_id] = session
+        await self._store.save(session)
+
+    def lock(self, session_id: str) -> AsyncContextManager[None]:
+        """Hold a session exclusively while it is loaded, updated and saved.
+
+        Raises:
+            SessionLockTimeoutError: If another request kept it locked too long
+        """
+        return self._store.lock(session_id)
 
     async def delete(self, session_id: str) -> bool:
         """Delete a session.
@@ -79,12 +167,12 @@ class SessionManager:
         Returns:
             True if deleted, False if not found
         """
-        if session_id in self._sessions:
-            del self._sessions[session_id]
-            if session_id in self._events:
-                del self._events[session_id]
-            return True
-        return False
+        if any(e.session_id == session_id for e in self._pending_events):
+            self._pending_events = [
+                e for e in self._pending_events if e.session_id != session_id
+            ]
+            self._recount_pending()
+        return await self._store.delete(session_id)
 
     async def list_sessions(
         self,
@@ -100,15 +188,7 @@ class SessionManager:
         Returns:
             List of matching sessions
         """
-        sessions = list(self._sessions.values())
-
-        if status:
-            sessions = [s for s in sessions if s.status == status]
-
-        # Sort by created_at descending
-        sessions.sort(key=lambda s: s.created_at, reverse=True)
-
-        return sessions[:limit]
+        return await self._store.list_sessions(status=status, limit=limit)
 
     async def record_event(self, event: InterviewEvent) -> None:
         """Record an interview event.
@@ -116,20 +196,57 @@ class SessionManager:
         Args:
             event: The event to record
         """
-        session_id = event.session_id
+        if not self._store.buffers_events:
+            await self._store.append_events([event])
+            return
 
-        if session_id not in self._events:
-            self._events[session_id] = []
+        self._pending_events.append(event)
+        self._pending_counts[(event.session_id, event.event_type)] += 1
+        if len(self._pending_events) >= settings.INTERVIEW_EVENT_FLUSH_BATCH_SIZE:
+            await self.flush_events()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_events_later())
 
-        self._events[session_id].append(event)
-        session = self._sessions.get(session_id)
-        if session:
-            session.events.append(event.model_dump())
+    async def _flush_events_later(self) -> None:
+        await asyncio.sleep(settings.INTERVIEW_EVENT_FLUSH_INTERVAL_MS / 1000)
+        await self.flush_events()
 
-        # Update session event count if it's a tab switch
-        if event.event_type == InterviewEventType.TAB_SWITCH:
-            if session:
-                session.tab_switch_count += 1
+    async def flush_events(self) -> int:
+        """Persist buffered events in one batch.
+
+        Returns:
+            Number of events written
+        """
+        if not self._pending_events:
+            return 0
+
+        batch, self._pending_events = self._pending_events, []
+        try:
+            await self._store.append_events(batch)
+        except Exception as error:
+            logger.warning("Could not flush %d interview events: %s", len(batch), error)
+            # Keep them for the next flush, ahead of anything recorded since.
+            self._pending_events = batch + self._pending_events
+            return 0
+        self._recount_pending()
+        return len(batch)
+
+    def _recount_pending(self) -> None:
+        self._pending_counts = Counter(
+            (e.session_id, e.event_type) for e in self._pending_events
+        )
+
+    def _pending_for(
+        self,
+        session_id: str,
+        event_type: Optional[InterviewEventType] = None,
+    ) -> List[InterviewEvent]:
+        return [
+            e
+            for e in self._pending_events
+            if e.session_id == session_id
+            and (event_type is None or e.event_type == event_type)
+        ]
 
     async def get_events(
         self,
@@ -145,12 +262,8 @@ class SessionManager:
         Returns:
             List of matching events
         """
-        events = self._events.get(session_id, [])
-
-        if event_type:
-            events = [e for e in events if e.event_type == event_type]
-
-        return events
+        events = await self._store.load_events(session_id, event_type)
+        return events + self._pending_for(session_id, event_type)
 
     async def count_events(
         self,
@@ -166,8 +279,8 @@ class SessionManager:
         Returns:
             Number of matching events
         """
-        events = await self.get_events(session_id, event_type)
-        return len(events)
+        stored = await self._store.count_events(session_id, event_type)
+        return stored + self._pending_counts[(session_id, event_type)]
 
     async def start_interview(self, session_id: str) -> Optional[InterviewSession]:
         """Mark an interview as started.
@@ -216,32 +329,25 @@ class SessionManager:
             await self.save(session)
         return session
 
-    def get_session_count(self) -> int:
-        """Get the total number of sessions in memory."""
-        return len(self._sessions)
+    async def get_session_count(self) -> int:
+        """Get the total number of stored sessions."""
+        return await self._store.count()
 
-    async def cleanup_old_sessions(self, max_age_hours: int = 24) -> int:
+    async def cleanup_old_sessions(self, max_age_hours: Optional[int] = None) -> int:
         """Remove sessions older than max_age_hours.
 
         Args:
-            max_age_hours: Maximum age in hours
+            max_age_hours: Maximum age in hours; defaults to
+                ``INTERVIEW_SESSION_MAX_AGE_HOURS``
 
         Returns:
             Number of sessions removed
         """
-        now = datetime.utcnow()
-        removed = 0
-
-        session_ids = list(self._sessions.keys())
-        for session_id in session_ids:
-            session = self._sessions[session_id]
-            age = (now - session.created_at).total_seconds() / 3600
-
-            if age > max_age_hours:
-                await self.delete(session_id)
-                removed += 1
-
-        return removed
+        if max_age_hours is None:
+            max_age_hours = settings.INTERVIEW_SESSION_MAX_AGE_HOURS
+        await self.flush_events()
+        cutoff = datetime.utcnow() - timedelta(hours=max_age_hours)
+        return await self._store.delete_created_before(cutoff)
 
 
 # Global session manager instance
@@ -252,5 +358,5 @@ def get_session_manager() -> SessionManager:
     """Get the global session manager instance."""
     global _session_manager
     if _session_manager is None:
-        _session_manager = SessionManager()
+        _session_manager = SessionManager(store=create_session_store())
     return _session_manager
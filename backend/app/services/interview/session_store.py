@@ -0,0 +1,868 @@
+"""Storage backends for interview sessions and their events.
+
+Sessions are saved with optimistic versioning: every successful save bumps
+``InterviewSession.version`` and a save whose version no longer matches the
+stored one raises :class:`SessionConflictError` instead of silently
+overwriting a concurrent update from another worker. Requests that read,
+work on and then save a session additionally hold its lock (see
+:meth:`SessionStore.lock`), so they run one at a time instead of failing.
+"""
+
+import asyncio
+import bisect
+import heapq
+import json
+import logging
+import uuid
+import weakref
+from contextlib import asynccontextmanager, nullcontext
+from datetime import datetime, timezone
+from typing import (
+    AsyncContextManager,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from app.core.settings import get_settings
+from app.models.interview.enums import InterviewEventType, InterviewStatus
+from app.models.interview.schemas import InterviewEvent, InterviewSession
+from app.services.interview.event_log import InterviewEventLog
+
+try:
+    import redis.asyncio as redis_async
+except Exception:
+    redis_async = None
+
+try:
+    import asyncpg
+except Exception:
+    asyncpg = None
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Events live in their own log, so they are not duplicated in the session.
+_SESSION_EXCLUDE = {"events"}
+
+
+class SessionConflictError(RuntimeError):
+    """Raised when a session was modified concurrently since it was loaded."""
+
+    def __init__(self, session_id: str):
+        super().__init__(f"Session was modified concurrently: {session_id}")
+        self.session_id = session_id
+
+
+class SessionLockTimeoutError(SessionConflictError):
+    """Raised when another request held a session's lock for too long."""
+
+    def __init__(self, session_id: str):
+        super().__init__(session_id)
+        self.args = (f"Session is busy with another request: {session_id}",)
+
+
+# Per-process session locks, dropped once nothing holds or waits on them
+_local_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = (
+    weakref.WeakValueDictionary()
+)
+_LOCK_POLL_SECONDS = 0.05
+
+
+def _session_ttl_seconds() -> int:
+    return max(settings.INTERVIEW_SESSION_MAX_AGE_HOURS, 1) * 3600
+
+
+def _event_log_max_events() -> Optional[int]:
+    return settings.INTERVIEW_EVENT_LOG_MAX_EVENTS or None
+
+
+def _timestamp(value: datetime) -> float:
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+class SessionStore:
+    """Interface implemented by every session storage backend.
+
+    ``buffers_events`` tells the session manager whether appending events is
+    expensive enough (network round trip) to batch them write-behind.
+    """
+
+    name = "base"
+    buffers_events = False
+
+    async def connect(self) -> None:
+        """Open connections and prepare storage; called on startup."""
+
+    async def close(self) -> None:
+        """Release connections; called on shutdown."""
+
+    async def load(self, session_id: str) -> Optional[InterviewSession]:
+        raise NotImplementedError
+
+    async def save(self, session: InterviewSession) -> None:
+        raise NotImplementedError
+
+    async def delete(self, session_id: str) -> bool:
+        raise NotImplementedError
+
+    async def list_sessions(
+        self,
+        status: Optional[InterviewStatus] = None,
+        limit: int = 100,
+    ) -> List[InterviewSession]:
+        raise NotImplementedError
+
+    async def append_events(self, events: List[InterviewEvent]) -> None:
+        raise NotImplementedError
+
+    async def load_events(
+        self,
+        session_id: str,
+        event_type: Optional[InterviewEventType] = None,
+    ) -> List[InterviewEvent]:
+        raise NotImplementedError
+
+    async def count_events(
+        self,
+        session_id: str,
+        event_type: InterviewEventType,
+    ) -> int:
+        raise NotImplementedError
+
+    async def count(self) -> int:
+        raise NotImplementedError
+
+    async def delete_created_before(self, cutoff: datetime) -> int:
+        raise NotImplementedError
+
+    @asynccontextmanager
+    async def lock(self, session_id: str) -> AsyncIterator[None]:
+        """Hold a session exclusively across a load-modify-save sequence.
+
+        Requests in this process queue on a local lock; backends shared
+        between processes take a lock of their own on top of it.
+
+        Raises:
+            SessionLockTimeoutError: If the shared lock could not be taken
+                within ``INTERVIEW_SESSION_LOCK_TIMEOUT_SECONDS``
+        """
+        local = _local_locks.get(session_id)
+        if local is None:
+            local = _local_locks[session_id] = asyncio.Lock()
+        async with local, self._shared_lock(session_id):
+            yield
+
+    def _shared_lock(self, session_id: str) -> AsyncContextManager[None]:
+        """Lock shared with other processes; none for a single process."""
+        return nullcontext()
+
+
+class _CreatedIndex:
+    """Session IDs kept sorted by ``created_at`` for newest-first paging."""
+
+    __slots__ = ("_keys",)
+
+    def __init__(self):
+        self._keys: List[Tuple[datetime, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, created_at: datetime, session_id: str) -> None:
+        # New sessions are the newest, so this is almost always an append.
+        bisect.insort(self._keys, (created_at, session_id))
+
+    def discard(self, created_at: datetime, session_id: str) -> None:
+        key = (created_at, session_id)
+        position = bisect.bisect_left(self._keys, key)
+        if position < len(self._keys) and self._keys[position] == key:
+            del self._keys[position]
+
+    def newest_first(self) -> Iterator[str]:
+        for _, session_id in reversed(self._keys):
+            yield session_id
+
+
+class InMemorySessionStore(SessionStore):
+    """Process-local store; the default, and what tests should use.
+
+    Besides the sessions themselves it keeps a ``created_at`` index overall
+    and per status, so listing reads only the newest ``limit`` entries, and
+    a min-heap of creation times so expiry pops only what is due.
+    """
+
+    name = "memory"
+
+    def __init__(self):
+        self._sessions: Dict[str, InterviewSession] = {}
+        self._event_logs: Dict[str, InterviewEventLog] = {}
+        self._indexed_status: Dict[str, InterviewStatus] = {}
+        self._created_index = _CreatedIndex()
+        self._status_index: Dict[InterviewStatus, _CreatedIndex] = {
+            status: _CreatedIndex() for status in InterviewStatus
+        }
+        self._expiry_heap: List[Tuple[datetime, str]] = []
+
+    def _is_expired(self, session: InterviewSession) -> bool:
+        age = datetime.utcnow() - session.created_at
+        return age.total_seconds() > _session_ttl_seconds()
+
+    def _index(self, session: InterviewSession) -> None:
+        session_id = session.session_id
+        previous = self._indexed_status.get(session_id)
+        if previous is None:
+            self._created_index.add(session.created_at, session_id)
+            heapq.heappush(self._expiry_heap, (session.created_at, session_id))
+        elif previous != session.status:
+            self._status_index[previous].discard(session.created_at, session_id)
+        if previous != session.status:
+            self._status_index[session.status].add(session.created_at, session_id)
+            self._indexed_status[session_id] = session.status
+
+    async def load(self, session_id: str) -> Optional[InterviewSession]:
+        session = self._sessions.get(session_id)
+        if session is not None and self._is_expired(session):
+            # Not swept yet; treat as gone, the sweeper will reclaim it.
+            return None
+        return session
+
+    async def save(self, session: InterviewSession) -> None:
+        current = self._sessions.get(session.session_id)
+        if current is not None and current is not session:
+            if current.version != session.version:
+                raise SessionConflictError(session.session_id)
+        session.version += 1
+        self._sessions[session.session_id] = session
+        self._index(session)
+
+    async def delete(self, session_id: str) -> bool:
+        self._event_logs.pop(session_id, None)
+        session = self._sessions.pop(session_id, None)
+        if session is None:
+            return False
+
+        status = self._indexed_status.pop(session_id, None)
+        self._created_index.discard(session.created_at, session_id)
+        if status is not None:
+            self._status_index[status].discard(session.created_at, session_id)
+        # The expiry heap entry is left behind and skipped when popped.
+        return True
+
+    async def list_sessions(
+        self,
+        status: Optional[InterviewStatus] = None,
+        limit: int = 100,
+    ) -> List[InterviewSession]:
+        index = self._status_index[status] if status else self._created_index
+        sessions: List[InterviewSession] = []
+        if limit <= 0:
+            return sessions
+
+        for session_id in index.newest_first():
+            session = self._sessions[session_id]
+            # Status may have been changed in place without a save yet.
+            if status and session.status != status:
+                continue
+            if self._is_expired(session):
+                continue
+            sessions.append(session)
+            if len(sessions) >= limit:
+                break
+        return sessions
+
+    async def append_events(self, events: List[InterviewEvent]) -> None:
+        for event in events:
+            log = self._event_logs.get(event.session_id)
+            if log is None:
+                log = InterviewEventLog(event.session_id, _event_log_max_events())
+                self._event_logs[event.session_id] = log
+            log.append(event)
+
+    async def load_events(
+        self,
+        session_id: str,
+        event_type: Optional[InterviewEventType] = None,
+    ) -> List[InterviewEvent]:
+        log = self._event_logs.get(session_id)
+        return log.events(event_type) if log else []
+
+    async def count_events(
+        self,
+        session_id: str,
+        event_type: InterviewEventType,
+    ) -> int:
+        log = self._event_logs.get(session_id)
+        return log.count(event_type) if log else 0
+
+    async def count(self) -> int:
+        return len(self._sessions)
+
+    async def delete_created_before(self, cutoff: datetime) -> int:
+        removed = 0
+        while self._expiry_heap and self._expiry_heap[0][0] < cutoff:
+            created_at, session_id = heapq.heappop(self._expiry_heap)
+            session = self._sessions.get(session_id)
+            # Skip heap entries for sessions deleted (or recreated) since.
+            if session is None or session.created_at != created_at:
+                continue
+            await self.delete(session_id)
+            removed += 1
+        return removed
+
+
+# Compare-and-set on the stored version, then move the session between the
+# per-status indexes. KEYS: session hash, all-sessions index, status index.
+# ARGV: expected version, new version, status, payload, ttl, score, id, prefix.
+_REDIS_SAVE_SCRIPT = """
+local current = tonumber(redis.call('HGET', KEYS[1], 'version') or '0')
+if current ~= tonumber(ARGV[1]) then
+    return 0
+end
+local previous_status = redis.call('HGET', KEYS[1], 'status')
+if previous_status and previous_status ~= ARGV[3] then
+    redis.call('ZREM', ARGV[8] .. ':sessions:status:' .. previous_status, ARGV[7])
+end
+redis.call('HSET', KEYS[1], 'version', ARGV[2], 'status', ARGV[3], 'data', ARGV[4])
+redis.call('EXPIRE', KEYS[1], ARGV[5])
+redis.call('ZADD', KEYS[2], ARGV[6], ARGV[7])
+redis.call('ZADD', KEYS[3], ARGV[6], ARGV[7])
+return 1
+"""
+
+# Delete or extend a session lock only while it still holds our token.
+# KEYS: lock key. ARGV: token (and, to extend, the lease in milliseconds).
+_REDIS_UNLOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+_REDIS_RENEW_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+class RedisSessionStore(SessionStore):
+    """Redis-backed store shared by every worker and replica.
+
+    Each session is a hash (``version``, ``status``, ``data``) that expires
+    after ``INTERVIEW_SESSION_MAX_AGE_HOURS``. Sorted sets scored by
+    ``created_at`` index all sessions and sessions per status; events are a
+    list per session with a hash of per-type counters next to it.
+    """
+
+    name = "redis"
+    buffers_events = True
+
+    def __init__(self, url: Optional[str] = None, prefix: str = "talentsync:interview"):
+        self._url = url or settings.REDIS_URL
+        self._prefix = prefix
+        self._client = None
+        self._save_script = None
+        self._unlock_script = None
+        self._renew_lock_script = None
+
+    def _session_key(self, session_id: str) -> str:
+        return f"{self._prefix}:session:{session_id}"
+
+    def _events_key(self, session_id: str) -> str:
+        return f"{self._prefix}:events:{session_id}"
+
+    def _counts_key(self, session_id: str) -> str:
+        return f"{self._prefix}:event_counts:{session_id}"
+
+    def _index_key(self, status: Optional[InterviewStatus] = None) -> str:
+        if status is None:
+            return f"{self._prefix}:sessions"
+        return f"{self._prefix}:sessions:status:{status.value}"
+
+    def _lock_key(self, session_id: str) -> str:
+        return f"{self._prefix}:lock:{session_id}"
+
+    async def connect(self) -> None:
+        if self._client is not None:
+            return
+        if redis_async is None:
+            raise RuntimeError("redis package is not installed")
+
+        client = redis_async.from_url(
+            self._url,
+            encoding="utf-8",
+            decode_responses=True,
+        )
+        await client.ping()
+        self._client = client
+        self._save_script = client.register_script(_REDIS_SAVE_SCRIPT)
+        self._unlock_script = client.register_script(_REDIS_UNLOCK_SCRIPT)
+        self._renew_lock_script = client.register_script(_REDIS_RENEW_LOCK_SCRIPT)
+
+    async def close(self) -> None:
+        if self._client is None:
+            return
+        try:
+            await self._client.aclose()
+        except Exception:
+            logger.debug("Redis session store close failed", exc_info=True)
+        finally:
+            self._client = None
+            self._save_script = None
+            self._unlock_script = None
+            self._renew_lock_script = None
+
+    async def _redis(self):
+        if self._client is None:
+            await self.connect()
+        return self._client
+
+    @asynccontextmanager
+    async def _shared_lock(self, session_id: str) -> AsyncIterator[None]:
+        """Lease-based Redis lock, renewed while held.
+
+        The lease outlives a crashed holder by at most
+        ``INTERVIEW_SESSION_LOCK_TTL_SECONDS``.
+        """
+        client = await self._redis()
+        key = self._lock_key(session_id)
+        token = uuid.uuid4().hex
+        lease_ms = settings.INTERVIEW_SESSION_LOCK_TTL_SECONDS * 1000
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.INTERVIEW_SESSION_LOCK_TIMEOUT_SECONDS
+
+        while not await client.set(key, token, nx=True, px=lease_ms):
+            if loop.time() >= deadline:
+                raise SessionLockTimeoutError(session_id)
+            await asyncio.sleep(_LOCK_POLL_SECONDS)
+
+        renewal = asyncio.create_task(self._renew_lock(key, token, lease_ms))
+        try:
+            yield
+        finally:
+            renewal.cancel()
+            await self._unlock_script(keys=[key], args=[token])
+
+    async def _renew_lock(self, key: str, token: str, lease_ms: int) -> None:
+        while True:
+            await asyncio.sleep(lease_ms / 3000)
+            try:
+                renewed = await self._renew_lock_script(
+                    keys=[key], args=[token, lease_ms]
+                )
+            except Exception:
+                logger.warning("Could not renew session lock %s", key, exc_info=True)
+                continue
+            if not renewed:
+                logger.warning("Session lock %s expired while held", key)
+                return
+
+    async def load(self, session_id: str) -> Optional[InterviewSession]:
+        client = await self._redis()
+        stored = await client.hmget(self._session_key(session_id), "data", "version")
+        if not stored[0]:
+            return None
+        session = InterviewSession.model_validate_json(stored[0])
+        session.version = int(stored[1] or 0)
+        return session
+
+    async def save(self, session: InterviewSession) -> None:
+        await self._redis()
+        new_version = session.version + 1
+        saved = await self._save_script(
+            keys=[
+                self._session_key(session.session_id),
+                self._index_key(),
+                self._index_key(session.status),
+            ],
+            args=[
+                session.version,
+                new_version,
+                session.status.value,
+                session.model_dump_json(exclude=_SESSION_EXCLUDE),
+                _session_ttl_seconds(),
+                _timestamp(session.created_at),
+                session.session_id,
+                self._prefix,
+            ],
+        )
+        if not saved:
+            raise SessionConflictError(session.session_id)
+        session.version = new_version
+
+    async def delete(self, session_id: str) -> bool:
+        client = await self._redis()
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.delete(self._session_key(session_id))
+            pipe.delete(self._events_key(session_id), self._counts_key(session_id))
+            pipe.zrem(self._index_key(), session_id)
+            for status in InterviewStatus:
+                pipe.zrem(self._index_key(status), session_id)
+            results = await pipe.execute()
+        return bool(results[0])
+
+    async def list_sessions(
+        self,
+        status: Optional[InterviewStatus] = None,
+        limit: int = 100,
+    ) -> List[InterviewSession]:
+        if limit <= 0:
+            return []
+
+        client = await self._redis()
+        index_key = self._index_key(status)
+        session_ids = await client.zrevrange(index_key, 0, limit - 1)
+        if not session_ids:
+            return []
+
+        async with client.pipeline(transaction=False) as pipe:
+            for session_id in session_ids:
+                pipe.hmget(self._session_key(session_id), "data", "version")
+            rows = await pipe.execute()
+
+        sessions: List[InterviewSession] = []
+        expired: List[str] = []
+        for session_id, (data, version) in zip(session_ids, rows):
+            if not data:
+                expired.append(session_id)
+                continue
+            session = InterviewSession.model_validate_json(data)
+            session.version = int(version or 0)
+            sessions.append(session)
+
+        if expired:
+            # Session hashes expire on their own; prune the index lazily.
+            await client.zrem(index_key, *expired)
+        return sessions
+
+    async def append_events(self, events: List[InterviewEvent]) -> None:
+        if not events:
+            return
+
+        client = await self._redis()
+        ttl = _session_ttl_seconds()
+        async with client.pipeline(transaction=False) as pipe:
+            touched = set()
+            for event in events:
+                pipe.rpush(self._events_key(event.session_id), event.model_dump_json())
+                pipe.hincrby(
+                    self._counts_key(event.session_id), event.event_type.value, 1
+                )
+                touched.add(event.session_id)
+            max_events = _event_log_max_events()
+            for session_id in touched:
+                if max_events:
+                    pipe.ltrim(self._events_key(session_id), -max_events, -1)
+                pipe.expire(self._events_key(session_id), ttl)
+                pipe.expire(self._counts_key(session_id), ttl)
+            await pipe.execute()
+
+    async def load_events(
+        self,
+        session_id: str,
+        event_type: Optional[InterviewEventType] = None,
+    ) -> List[InterviewEvent]:
+        client = await self._redis()
+        raw_events = await client.lrange(self._events_key(session_id), 0, -1)
+        events = [InterviewEvent.model_validate_json(raw) for raw in raw_events]
+        if event_type:
+            events = [e for e in events if e.event_type == event_type]
+        return events
+
+    async def count_events(
+        self,
+        session_id: str,
+        event_type: InterviewEventType,
+    ) -> int:
+        client = await self._redis()
+        count = await client.hget(self._counts_key(session_id), event_type.value)
+        return int(count or 0)
+
+    async def count(self) -> int:
+        client = await self._redis()
+        return await client.zcard(self._index_key())
+
+    async def delete_created_before(self, cutoff: datetime) -> int:
+        client = await self._redis()
+        session_ids = await client.zrangebyscore(
+            self._index_key(), "-inf", f"({_timestamp(cutoff)}"
+        )
+        removed = 0
+        for session_id in session_ids:
+            if await self.delete(session_id):
+                removed += 1
+        return removed
+
+
+_POSTGRES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS interview_sessions (
+    session_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    data JSONB NOT NULL,
+    created_at TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP NOT NULL DEFAULT (now() AT TIME ZONE 'utc')
+);
+CREATE INDEX IF NOT EXISTS interview_sessions_created_at_idx
+    ON interview_sessions (created_at DESC);
+CREATE INDEX IF NOT EXISTS interview_sessions_status_created_at_idx
+    ON interview_sessions (status, created_at DESC);
+CREATE TABLE IF NOT EXISTS interview_events (
+    id TEXT PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    timestamp TIMESTAMP NOT NULL,
+    metadata JSONB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS interview_events_session_type_idx
+    ON interview_events (session_id, event_type);
+"""
+
+
+def _asyncpg_dsn(url: str) -> str:
+    """Drop Prisma-only query parameters that asyncpg would reject."""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query) if k != "schema"]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def _session_from_row(data: str, version: int) -> InterviewSession:
+    session = InterviewSession.model_validate_json(data)
+    session.version = version
+    return session
+
+
+def _event_from_row(row) -> InterviewEvent:
+    return InterviewEvent(
+        id=row["id"],
+        session_id=row["session_id"],
+        event_type=InterviewEventType(row["event_type"]),
+        timestamp=row["timestamp"],
+        metadata=json.loads(row["metadata"]),
+    )
+
+
+class PostgresSessionStore(SessionStore):
+    """PostgreSQL store (asyncpg) sharing the application database.
+
+    Sessions are one JSONB row each with a version column used for
+    compare-and-set updates; events are rows in ``interview_events``.
+    """
+
+    name = "postgres"
+    buffers_events = True
+
+    def __init__(self, dsn: Optional[str] = None):
+        self._dsn = dsn or settings.DATABASE_URL
+        self._pool = None
+
+    async def connect(self) -> None:
+        if self._pool is not None:
+            return
+        if asyncpg is None:
+            raise RuntimeError("asyncpg package is not installed")
+        if not self._dsn:
+            raise RuntimeError("DATABASE_URL is not configured")
+
+        pool = await asyncpg.create_pool(_asyncpg_dsn(self._dsn), min_size=1)
+        async with pool.acquire() as conn:
+            await conn.execute(_POSTGRES_SCHEMA)
+        self._pool = pool
+
+    async def close(self) -> None:
+        if self._pool is None:
+            return
+        try:
+            await self._pool.close()
+        except Exception:
+            logger.debug("Postgres session store close failed", exc_info=True)
+        finally:
+            self._pool = None
+
+    async def _postgres(self):
+        if self._pool is None:
+            await self.connect()
+        return self._pool
+
+    @asynccontextmanager
+    async def _shared_lock(self, session_id: str) -> AsyncIterator[None]:
+        """Session-level advisory lock, held on a dedicated connection."""
+        pool = await self._postgres()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.INTERVIEW_SESSION_LOCK_TIMEOUT_SECONDS
+
+        async with pool.acquire() as conn:
+            while not await conn.fetchval(
+                "SELECT pg_try_advisory_lock(hashtextextended($1, 0))",
+                f"interview_session:{session_id}",
+            ):
+                if loop.time() >= deadline:
+                    raise SessionLockTimeoutError(session_id)
+                await asyncio.sleep(_LOCK_POLL_SECONDS)
+            try:
+                yield
+            finally:
+                await conn.execute(
+                    "SELECT pg_advisory_unlock(hashtextextended($1, 0))",
+                    f"interview_session:{session_id}",
+                )
+
+    async def load(self, session_id: str) -> Optional[InterviewSession]:
+        pool = await self._postgres()
+        row = await pool.fetchrow(
+            "SELECT data::text AS data, version FROM interview_sessions"
+            " WHERE session_id = $1",
+            session_id,
+        )
+        if row is None:
+            return None
+        return _session_from_row(row["data"], row["version"])
+
+    async def save(self, session: InterviewSession) -> None:
+        pool = await self._postgres()
+        new_version = session.version + 1
+        payload = session.model_dump_json(exclude=_SESSION_EXCLUDE)
+
+        if session.version == 0:
+            result = await pool.execute(
+                "INSERT INTO interview_sessions"
+                " (session_id, status, version, data, created_at)"
+                " VALUES ($1, $2, $3, $4::jsonb, $5)"
+                " ON CONFLICT (session_id) DO NOTHING",
+                session.session_id,
+                session.status.value,
+                new_version,
+                payload,
+                session.created_at,
+            )
+        else:
+            result = await pool.execute(
+                "UPDATE interview_sessions"
+                " SET status = $2, version = $3, data = $4::jsonb,"
+                " updated_at = now() AT TIME ZONE 'utc'"
+                " WHERE session_id = $1 AND version = $5",
+                session.session_id,
+                session.status.value,
+                new_version,
+                payload,
+                session.version,
+            )
+
+        if not result.endswith(" 1"):
+            raise SessionConflictError(session.session_id)
+        session.version = new_version
+
+    async def delete(self, session_id: str) -> bool:
+        pool = await self._postgres()
+        async with pool.acquire() as conn, conn.transaction():
+            await conn.execute(
+                "DELETE FROM interview_events WHERE session_id = $1", session_id
+            )
+            result = await conn.execute(
+                "DELETE FROM interview_sessions WHERE session_id = $1", session_id
+            )
+        return result.endswith(" 1")
+
+    async def list_sessions(
+        self,
+        status: Optional[InterviewStatus] = None,
+        limit: int = 100,
+    ) -> List[InterviewSession]:
+        pool = await self._postgres()
+        rows = await pool.fetch(
+            "SELECT data::text AS data, version FROM interview_sessions"
+            " WHERE ($1::text IS NULL OR status = $1)"
+            " ORDER BY created_at DESC LIMIT $2",
+            status.value if status else None,
+            max(limit, 0),
+        )
+        return [_session_from_row(row["data"], row["version"]) for row in rows]
+
+    async def append_events(self, events: List[InterviewEvent]) -> None:
+        if not events:
+            return
+
+        pool = await self._postgres()
+        await pool.executemany(
+            "INSERT INTO interview_events"
+            " (id, session_id, event_type, timestamp, metadata)"
+            " VALUES ($1, $2, $3, $4, $5::jsonb)"
+            " ON CONFLICT (id) DO NOTHING",
+            [
+                (
+                    event.id,
+                    event.session_id,
+                    event.event_type.value,
+                    event.timestamp,
+                    json.dumps(event.metadata, ensure_ascii=True, default=str),
+                )
+                for event in events
+            ],
+        )
+
+    async def load_events(
+        self,
+        session_id: str,
+        event_type: Optional[InterviewEventType] = None,
+    ) -> List[InterviewEvent]:
+        pool = await self._postgres()
+        rows = await pool.fetch(
+            "SELECT id, session_id, event_type, timestamp, metadata::text AS metadata"
+            " FROM interview_events"
+            " WHERE session_id = $1 AND ($2::text IS NULL OR event_type = $2)"
+            " ORDER BY timestamp",
+            session_id,
+            event_type.value if event_type else None,
+        )
+        return [_event_from_row(row) for row in rows]
+
+    async def count_events(
+        self,
+        session_id: str,
+        event_type: InterviewEventType,
+    ) -> int:
+        pool = await self._postgres()
+        return await pool.fetchval(
+            "SELECT count(*) FROM interview_events"
+            " WHERE session_id = $1 AND event_type = $2",
+            session_id,
+            event_type.value,
+        )
+
+    async def count(self) -> int:
+        pool = await self._postgres()
+        return await pool.fetchval("SELECT count(*) FROM interview_sessions")
+
+    async def delete_created_before(self, cutoff: datetime) -> int:
+        pool = await self._postgres()
+        async with pool.acquire() as conn, conn.transaction():
+            rows = await conn.fetch(
+                "DELETE FROM interview_sessions WHERE created_at < $1"
+                " RETURNING session_id",
+                cutoff,
+            )
+            session_ids = [row["session_id"] for row in rows]
+            if session_ids:
+                await conn.execute(
+                    "DELETE FROM interview_events WHERE session_id = ANY($1::text[])",
+                    session_ids,
+                )
+        return len(session_ids)
+
+
+def create_session_store(backend: Optional[str] = None) -> SessionStore:
+    """Build the store selected by ``INTERVIEW_SESSION_BACKEND``."""
+    backend = (backend or settings.INTERVIEW_SESSION_BACKEND).strip().lower()
+    if backend == "redis":
+        return RedisSessionStore()
+    if backend in ("postgres", "postgresql"):
+        return PostgresSessionStore()
+    if backend != "memory":
+        logger.warning("Unknown interview session backend %r, using memory", backend)
+    return InMemorySessionStore()
@@ -0,0 +1,243 @@
+"""Running summary digests for interview sessions.
+
+The final summary used to be built from every question, answer and piece of
+feedback once the interview ended. Instead, each answered question is
+condensed into a short digest (scores, topic, the evaluator's strengths
+and improvements, a trimmed excerpt of the answer) as the interview goes,
+and score aggregates are kept alongside. The summary prompt is built from
+these digests, and the summary produced from them is stored with a
+fingerprint of its inputs so it can be served again until they change.
+
+Digests live in Redis through the shared cache helpers, with a process-local
+copy when Redis is unavailable.
+"""
+
+import asyncio
+import hashlib
+import json
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from app.core.cache import build_cache_key, get_cached_json, set_cached_json
+from app.core.settings import get_settings
+from app.models.interview.schemas import InterviewQuestion, InterviewSession
+
+settings = get_settings()
+
+_DIGEST_NAMESPACE = "interview_summary_digest"
+_LOCAL_SESSIONS = 1024
+_QUESTION_CHARS = 160
+_ANSWER_CHARS = 240
+_POINT_CHARS = 100
+_POINTS = 2
+
+
+def _clip(text: Optional[str], limit: int) -> str:
+    text = " ".join((text or "").split())
+    if len(text) <= limit:
+        return text
+    return text[: limit - 3].rstrip() + "..."
+
+
+class QuestionDigest(BaseModel):
+    """Compact record of one answered question."""
+
+    question_id: str
+    index: int
+    difficulty: str
+    topic: str
+    score: int
+    skipped: bool = False
+    answered_at: Optional[str] = None
+    text: str
+
+    @classmethod
+    def from_question(cls, question: InterviewQuestion) -> "QuestionDigest":
+        skipped = question.answer == "[SKIPPED]"
+        score = question.score or 0
+        topic = question.topic or "General"
+        lines = [
+            f"Q{question.index + 1} ({question.difficulty.value}, {topic}) "
+            f"{score}/5: {_clip(question.question, _QUESTION_CHARS)}"
+        ]
+        if skipped:
+            lines.append("Skipped by the candidate.")
+        else:
+            lines.append(f"Answer: {_clip(question.answer, _ANSWER_CHARS)}")
+            if question.strengths:
+                points = "; ".join(
+                    _clip(point, _POINT_CHARS) for point in question.strengths[:_POINTS]
+                )
+                lines.append(f"Strengths: {points}")
+            if question.improvements:
+                points = "; ".join(
+                    _clip(point, _POINT_CHARS)
+                    for point in question.improvements[:_POINTS]
+                )
+                lines.append(f"Improve: {points}")
+
+        return cls(
+            question_id=question.id,
+            index=question.index,
+            difficulty=question.difficulty.value,
+            topic=topic,
+            score=score,
+            skipped=skipped,
+            answered_at=(
+                question.answered_at.isoformat() if question.answered_at else None
+            ),
+            text="\n".join(lines),
+        )
+
+
+class ScoreAggregate(BaseModel):
+    count: int = 0
+    total: int = 0
+
+    def add(self, score: int) -> None:
+        self.count += 1
+        self.total += score
+
+    def render(self) -> str:
+        average = self.total / self.count if self.count else 0
+        return f"{average:.1f}/5 over {self.count}"
+
+
+class SessionDigest(BaseModel):
+    """Per-question digests and score aggregates for one session."""
+
+    session_id: str
+    questions: Dict[str, QuestionDigest] = Field(default_factory=dict)
+    overall: ScoreAggregate = Field(default_factory=ScoreAggregate)
+    by_difficulty: Dict[str, ScoreAggregate] = Field(default_factory=dict)
+    by_topic: Dict[str, ScoreAggregate] = Field(default_factory=dict)
+    skipped: int = 0
+    # Summary generated from these digests, and the fingerprint of its inputs
+    summary: Optional[Dict[str, Any]] = None
+    summary_fingerprint: Optional[str] = None
+
+    def refresh(self, session: InterviewSession) -> int:
+        """Digest answered questions that are new or changed since last time.
+
+        Returns:
+            Number of questions (re)digested
+        """
+        updated = 0
+        for question in session.questions:
+            if question.answer is None:
+                continue
+            answered_at = (
+                question.answered_at.isoformat() if question.answered_at else None
+            )
+            known = self.questions.get(question.id)
+            if known is not None and known.answered_at == answered_at:
+                continue
+            self.questions[question.id] = QuestionDigest.from_question(question)
+            updated += 1
+
+        if updated:
+            self._aggregate()
+        return updated
+
+    def _aggregate(self) -> None:
+        self.overall = ScoreAggregate()
+        self.by_difficulty = {}
+        self.by_topic = {}
+        self.skipped = 0
+        for digest in self.questions.values():
+            self.overall.add(digest.score)
+            self.by_difficulty.setdefault(digest.difficulty, ScoreAggregate()).add(
+                digest.score
+            )
+            self.by_topic.setdefault(digest.topic, ScoreAggregate()).add(digest.score)
+            if digest.skipped:
+                self.skipped += 1
+
+    def render(self) -> str:
+        """Digests and aggregates formatted for the summary prompt."""
+        digests = sorted(self.questions.values(), key=lambda digest: digest.index)
+        lines: List[str] = [digest.text for digest in digests]
+        lines.append("---")
+        lines.append(f"Average score: {self.overall.render()} answered")
+        if self.skipped:
+            lines.append(f"Skipped: {self.skipped}")
+        lines.append(
+            "By difficulty: "
+            + ", ".join(
+                f"{name} {aggregate.render()}"
+                for name, aggregate in sorted(self.by_difficulty.items())
+            )
+        )
+        lines.append(
+            "By topic: "
+            + ", ".join(
+                f"{name} {aggregate.render()}"
+                for name, aggregate in sorted(self.by_topic.items())
+            )
+        )
+        return "\n".join(lines)
+
+    def fingerprint(self, *inputs: Any) -> str:
+        """Hash of the rendered digests plus any other summary inputs."""
+        payload = json.dumps([self.render(), *inputs], default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SummaryDigestStore:
+    """Loads and saves session digests, one writer per session at a time."""
+
+    def __init__(self):
+        self._local: OrderedDict[str, dict] = OrderedDict()
+        # Dropped automatically once no task holds or waits on a session's lock
+        self._locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = (
+            weakref.WeakValueDictionary()
+        )
+
+    @property
+    def _ttl_seconds(self) -> int:
+        return settings.INTERVIEW_SESSION_MAX_AGE_HOURS * 3600
+
+    def lock(self, session_id: str) -> asyncio.Lock:
+        """Lock held while a session's digest is updated or summarized."""
+        lock = self._locks.get(session_id)
+        if lock is None:
+            lock = self._locks[session_id] = asyncio.Lock()
+        return lock
+
+    async def load(self, session_id: str) -> SessionDigest:
+        record = await get_cached_json(build_cache_key(_DIGEST_NAMESPACE, session_id))
+        if record is None:
+            record = self._local.get(session_id)
+        if record is not None:
+            try:
+                return SessionDigest.model_validate(record)
+            except ValueError:
+                pass
+        return SessionDigest(session_id=session_id)
+
+    async def save(self, digest: SessionDigest) -> None:
+        record = digest.model_dump(mode="json")
+        self._local[digest.session_id] = record
+        self._local.move_to_end(digest.session_id)
+        while len(self._local) > _LOCAL_SESSIONS:
+            self._local.popitem(last=False)
+        await set_cached_json(
+            build_cache_key(_DIGEST_NAMESPACE, digest.session_id),
+            record,
+            ttl_seconds=self._ttl_seconds,
+        )
+
+
+# Global digest store instance
+_digest_store: Optional[SummaryDigestStore] = None
+
+
+def get_summary_digest_store() -> SummaryDigestStore:
+    """Get or create the shared digest store."""
+    global _digest_store
+    if _digest_store is None:
+        _digest_store = SummaryDigestStore()
+    return _digest_store
@@ -11,17 +11,106 @@ from app.data.prompt.interview_summary import (
     get_streaming_summary_prompt,
     get_summary_prompt,
 )
+from app.core.metrics import increment, observe
 from app.models.interview.schemas import InterviewSession
-from app.services.llm_helpers import chain_invoke_text_async
+from app.services.interview.summary_digest import (
+    SessionDigest,
+    SummaryDigestStore,
+    get_summary_digest_store,
+)
+from app.services.llm_helpers import chain_invoke_text_async, llm_stream_text_async
 
 
 class SummaryGenerator:
-    """Generates comprehensive interview summaries."""
+    """Generates comprehensive interview summaries.
+
+    Prompts are built from the running per-question digests kept in the
+    digest store rather than from every full answer and feedback. The
+    graph calls ``update_digest`` after each answer, and once the last one
+    is in, the summary itself is generated ahead of the request for it.
+    """
 
-    def __init__(self, llm: Optional[BaseChatModel] = None):
+    def __init__(
+        self,
+        llm: Optional[BaseChatModel] = None,
+        digest_store: Optional[SummaryDigestStore] = None,
+    ):
         self.llm = llm or get_llm()
         self.prompt = get_summary_prompt()
         self.streaming_prompt = get_streaming_summary_prompt()
+        self.digest_store = digest_store or get_summary_digest_store()
+
+    async def update_digest(
+        self,
+        session: InterviewSession,
+        precompute: bool = False,
+    ) -> None:
+        """Fold newly answered questions into the session's digest.
+
+        With ``precompute`` the summary is generated too, so it can be served
+        as soon as it is asked for.
+        """
+        async with self.digest_store.lock(session.session_id):
+            digest = await self._refreshed_digest(session)
+            if precompute and self.llm:
+                await self._summarize(session, digest)
+
+    async def _refreshed_digest(self, session: InterviewSession) -> SessionDigest:
+        """Load the digest and bring it up to date; call with the lock held."""
+        digest = await self.digest_store.load(session.session_id)
+        if digest.refresh(session):
+            await self.digest_store.save(digest)
+        return digest
+
+    def _summary_fingerprint(
+        self, session: InterviewSession, digest: SessionDigest
+    ) -> str:
+        return digest.fingerprint(
+            session.config.role,
+            len(session.questions),
+            self._calculate_final_score(session),
+            session.tab_switch_count,
+            self._format_events(session),
+        )
+
+    async def _summarize(
+        self,
+        session: InterviewSession,
+        digest: SessionDigest,
+    ) -> Dict[str, Any]:
+        """Summary for the digest, reusing the stored one if inputs match.
+
+        Raises whatever the LLM call raises; failed summaries are not stored.
+        """
+        fingerprint = self._summary_fingerprint(session, digest)
+        if digest.summary is not None and digest.summary_fingerprint == fingerprint:
+            increment("interview.summary.precomputed", outcome="hit")
+            return dict(digest.summary)
+        increment("interview.summary.precomputed", outcome="miss")
+
+        final_score = self._calculate_final_score(session)
+        questions_summary = digest.render()
+        observe("interview.summary.prompt_chars", len(questions_summary))
+
+        chain = self.prompt | self.llm
+        content = await chain_invoke_text_async(
+            chain,
+            {
+                "role": session.config.role,
+                "total_questions": len(session.questions),
+                "final_score": final_score,
+                "questions_summary": questions_summary,
+                "tab_switch_count": session.tab_switch_count,
+                "other_events": self._format_events(session),
+            },
+            cache_namespace="interview_summary_generation",
+        )
+        summary = self._parse_summary_response(content, final_score)
+
+        digest.summary = summary
+        digest.summary_fingerprint = fingerprint
+        await self.digest_store.save(digest)
+        return dict(summary)
 
     async def generate_summary(
         self,
@@ -37,28 +126,11 @@ class SummaryGenerator:
                 "hiring_recommendation": "maybe",
             }
 
-        # Prepare questions summary
-        questions_summary = self._format_questions_summary(session)
-
-        # Calculate final score
-        final_score = self._calculate_final_score(session)
-
-        chain = self.prompt | self.llm
-
         try:
-            content = await chain_invoke_text_async(
-                chain,
-                {
-                    "role": session.config.role,
-                    "total_questions": len(session.questions),
-                    "final_score": final_score,
-                    "questions_summary": questions_summary,
-                    "tab_switch_count": session.tab_switch_count,
-                    "other_events": self._format_events(session),
-                },
-                cache_namespace="interview_summary_generation",
-            )
-            return self._parse_summary_response(content, final_score)
+            # Waits for an in-flight precompute rather than duplicating it
+            async with self.digest_store.lock(session.session_id):
+                digest = await self._refreshed_digest(session)
+                return await self._summarize(session, digest)
         except Exception as e:
             return {
                 "summary": f"Error generating summary: {str(e)}",
@@ -66,52 +138,84 @@ class SummaryGenerator:
                 "weaknesses": [],
                 "recommendations": [],
                 "hiring_recommendation": "maybe",
-                "final_score": final_score,
+                "final_score": self._calculate_final_score(session),
             }
 
     async def generate_summary_streaming(
         self,
         session: InterviewSession,
     ) -> AsyncGenerator[str, None]:
-        """Stream summary generation for SSE."""
+        """Stream summary generation for SSE.
+
+        A summary precomputed for the same answers is sent whole instead.
+        """
         if not self.llm:
             yield "Summary generation service is unavailable."
             return
 
-        # Prepare questions summary
-        questions_summary = self._format_questions_summary(session)
-        final_score = self._calculate_final_score(session)
+        try:
+            async with self.digest_store.lock(session.session_id):
+                digest = await self._refreshed_digest(session)
+                fingerprint = self._summary_fingerprint(session, digest)
+        except Exception as e:
+            yield f"\n\nError during summary generation: {str(e)}"
+            return
 
+        if digest.summary is not None and digest.summary_fingerprint == fingerprint:
+            increment("interview.summary.precomputed", outcome="hit")
+            yield self._format_summary_markdown(digest.summary)
+            return
+        increment("interview.summary.precomputed", outcome="miss")
+
+        questions_summary = digest.render()
+        observe("interview.summary.prompt_chars", len(questions_summary))
         prompt_text = self.streaming_prompt.format(
             role=session.config.role,
-            final_score=final_score,
+            final_score=self._calculate_final_score(session),
             total_questions=len(session.questions),
             questions_summary=questions_summary,
             tab_switch_count=session.tab_switch_count,
         )
 
         try:
-            async for chunk in self.llm.astream(prompt_text):
-                if hasattr(chunk, "content") and chunk.content:
-                    yield chunk.content
-                elif isinstance(chunk, str):
-                    yield chunk
+            async for chunk in llm_stream_text_async(
+                self.llm,
+                prompt_text,
+                cache_namespace="interview_summary_stream",
+            ):
+                yield chunk
         except Exception as e:
             yield f"\n\nError during summary generation: {str(e)}"
 
-    def _format_questions_summary(self, session: InterviewSession) -> str:
-        """Format questions and answers for the summary prompt."""
-        lines = []
-        for i, q in enumerate(session.questions, 1):
-            lines.append(f"\nQuestion {i}: {q.question}")
-            lines.append(f"Difficulty: {q.difficulty.value}")
-            lines.append(f"Topic: {q.topic or 'General'}")
-            lines.append(f"Answer: {q.answer or 'No answer provided'}")
-            lines.append(f"Score: {q.score or 0}/5")
-            if q.feedback:
-                lines.append(f"Feedback: {q.feedback[:200]}...")
-            lines.append("---")
-        return "\n".join(lines)
+    def _format_summary_markdown(self, summary: Dict[str, Any]) -> str:
+        """Render a structured summary in the streaming summary's format."""
+        sections = [f"## Overall Assessment\n\n{summary.get('summary', '')}"]
+        for title, key in (
+            ("Key Strengths", "strengths"),
+            ("Areas for Improvement", "weaknesses"),
+            ("Recommendations", "recommendations"),
+        ):
+            items = summary.get(key) or []
+            if items:
+                sections.append(
+                    f"## {title}\n\n" + "\n".join(f"- {item}" for item in items)
+                )
+        for title, key in (
+            ("Technical Proficiency", "technical_proficiency"),
+            ("Communication Skills", "communication_skills"),
+        ):
+            if summary.get(key):
+                sections.append(f"## {title}\n\n{summary[key]}")
+
+        recommendation = str(summary.get("hiring_recommendation") or "maybe")
+        hiring = (
+            "## Hiring Recommendation\n\n"
+            f"**Recommendation: {recommendation.replace('_', ' ').upper()}**"
+        )
+        if summary.get("hiring_justification"):
+            hiring += f"\n\n{summary['hiring_justification']}"
+        sections.append(hiring)
+        return "\n\n".join(sections) + "\n"
 
     def _format_events(self, session: InterviewSession) -> str:
         """Format session events for context."""
@@ -17,6 +17,7 @@ from app.models.resume.schemas import ComprehensiveAnalysisData
 from app.services.improver import calculate_resume_diff
 from app.services.language import get_language_name
 from app.services.llm_helpers import llm_complete_json_async
+from app.services.prompt_context import compact_json
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +39,7 @@ async def _score_resume(
 ) -> dict[str, Any]:
     prompt = SCORE_RESUME_AGAINST_JD_PROMPT.format(
         job_keywords=json.dumps(job_keywords, ensure_ascii=True),
-        resume_json=json.dumps(resume_data, ensure_ascii=True),
+        resume_json=compact_json(resume_data, label="jd_score"),
     )
     try:
         return await llm_complete_json_async(
@@ -65,7 +66,7 @@ async def _edit_resume(
         job_description=job_description,
         job_keywords=json.dumps(job_keywords, ensure_ascii=True),
         company_name=company_name or "the company",
-        original_resume=json.dumps(resume_data, ensure_ascii=True),
+        original_resume=compact_json(resume_data, drop_empty=False, label="jd_edit"),
         schema=RESUME_SCHEMA,
         output_language=output_language,
     )
@@ -86,8 +87,8 @@ async def _compute_changes(
     llm,
 ) -> list[JDEditChange]:
     prompt = COMPUTE_JD_CHANGES_PROMPT.format(
-        original_resume=json.dumps(original_data, ensure_ascii=True),
-        edited_resume=json.dumps(edited_data, ensure_ascii=True),
+        original_resume=compact_json(original_data, label="jd_changes"),
+        edited_resume=compact_json(edited_data),
         job_description=job_description,
     )
     try:
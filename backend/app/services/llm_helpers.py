@@ -1,12 +1,15 @@
 """Helpers for invoking LLMs and parsing JSON responses."""
 
+import asyncio
 import hashlib
 import json
 import logging
-from typing import Any
+import re
+from typing import Any, AsyncIterator
 
 from langchain_core.language_models import BaseChatModel
 
+from app.core.broadcast import StreamBroadcast
 from app.core.cache import (
     build_cache_key,
     get_cached_json,
@@ -14,7 +17,17 @@ from app.core.cache import (
     set_cached_json,
     set_cached_json_sync,
 )
+from app.core.metrics import increment, observe
+from app.core.settings import get_settings
 from app.core.streaming import publish_event
+from app.core.tracing import span
+
+settings = get_settings()
+
+_REPLAY_TOKEN_PATTERN = re.compile(r"\S+\s*|\s+")
+# Rough English average, for estimating tokens not generated after a cancel
+_CHARS_PER_TOKEN = 4
+_COMPLETION_CHARS_SMOOTHING = 0.2
 
 
 def _extract_text_from_llm_result(result: Any) -> str:
@@ -100,7 +113,8 @@ def llm_complete_json(
     if cached and isinstance(cached.get("result"), dict):
         return cached["result"]
 
-    response = llm.invoke(message)
+    with span("llm.invoke", namespace="llm_json_sync"):
+        response = llm.invoke(message)
     raw_response = _extract_text_from_llm_result(response)
     parsed = parse_llm_json(raw_response)
     set_cached_json_sync(key, {"result": parsed})
@@ -128,7 +142,8 @@ async def llm_complete_json_async(
     if cached and isinstance(cached.get("result"), dict):
         return cached["result"]
 
-    response = await llm.ainvoke(message)
+    with span("llm.invoke", namespace="llm_json_async"):
+        response = await llm.ainvoke(message)
     raw_response = _extract_text_from_llm_result(response)
     parsed = parse_llm_json(raw_response)
     await set_cached_json(key, {"result": parsed})
@@ -156,7 +171,8 @@ async def llm_invoke_text_async(
     if cached and isinstance(cached.get("text"), str):
         return cached["text"]
 
-    response = await llm.ainvoke(message)
+    with span("llm.invoke", namespace=cache_namespace):
+        response = await llm.ainvoke(message)
     text = _extract_text_from_llm_result(response)
     await set_cached_json(key, {"text": text})
     await publish_event(
@@ -183,7 +199,8 @@ def llm_invoke_text_sync(
     if cached and isinstance(cached.get("text"), str):
         return cached["text"]
 
-    response = llm.invoke(message)
+    with span("llm.invoke", namespace=cache_namespace):
+        response = llm.invoke(message)
     text = _extract_text_from_llm_result(response)
     set_cached_json_sync(key, {"text": text})
     return text
@@ -201,7 +218,8 @@ async def chain_invoke_text_async(
     if cached and isinstance(cached.get("text"), str):
         return cached["text"]
 
-    response = await chain.ainvoke(payload)
+    with span("llm.chain", namespace=cache_namespace):
+        response = await chain.ainvoke(payload)
     text = _extract_text_from_llm_result(response)
     await set_cached_json(key, {"text": text})
     await publish_event(
@@ -226,7 +244,164 @@ def chain_invoke_text_sync(
     if cached and isinstance(cached.get("text"), str):
         return cached["text"]
 
-    response = chain.invoke(payload)
+    with span("llm.chain", namespace=cache_namespace):
+        response = chain.invoke(payload)
     text = _extract_text_from_llm_result(response)
     set_cached_json_sync(key, {"text": text})
     return text
+
+
+# Upstream streams currently in progress in this process, by cache key
+_inflight_streams: dict[str, StreamBroadcast] = {}
+_stream_tasks: set[asyncio.Task] = set()
+# Smoothed length of completed streams per namespace, in characters
+_completion_chars: dict[str, float] = {}
+
+
+async def _replay_cached_text(text: str) -> AsyncIterator[str]:
+    """Yield cached text in word-aligned chunks, paced like a live stream."""
+    interval = settings.LLM_STREAM_REPLAY_INTERVAL_MS / 1000
+    chunk = ""
+    for token in _REPLAY_TOKEN_PATTERN.findall(text):
+        chunk += token
+        if len(chunk) >= settings.LLM_STREAM_REPLAY_CHUNK_CHARS:
+            yield chunk
+            chunk = ""
+            if interval:
+                await asyncio.sleep(interval)
+    if chunk:
+        yield chunk
+
+
+def _forget_stream(key: str, broadcast: StreamBroadcast) -> None:
+    if _inflight_streams.get(key) is broadcast:
+        del _inflight_streams[key]
+
+
+def _record_completed_stream(cache_namespace: str, chars: int) -> None:
+    previous = _completion_chars.get(cache_namespace)
+    if previous is None:
+        _completion_chars[cache_namespace] = float(chars)
+    else:
+        _completion_chars[cache_namespace] = previous + _COMPLETION_CHARS_SMOOTHING * (
+            chars - previous
+        )
+
+
+def _record_cancelled_stream(cache_namespace: str, chars: int) -> None:
+    """Count a stream cancelled because nobody was listening any more.
+
+    Tokens saved are estimated from how long completed streams in the same
+    namespace usually are.
+    """
+    increment("llm.stream.cancelled", namespace=cache_namespace)
+    observe("llm.stream.cancelled_after_chars", chars, namespace=cache_namespace)
+    typical = _completion_chars.get(cache_namespace)
+    if typical is not None and typical > chars:
+        increment(
+            "llm.stream.tokens_saved",
+            round((typical - chars) / _CHARS_PER_TOKEN),
+            namespace=cache_namespace,
+        )
+
+
+async def _pump_llm_stream(
+    llm: BaseChatModel,
+    message: str,
+    key: str,
+    broadcast: StreamBroadcast,
+    cache_namespace: str,
+) -> None:
+    parts: list[str] = []
+    try:
+        with span("llm.stream", namespace=cache_namespace) as current:
+            async for chunk in llm.astream(message):
+                text = _extract_text_from_llm_result(chunk)
+                if text:
+                    if not parts:
+                        current.set_attribute(
+                            "llm.first_chunk_ms", round(current.elapsed_ms(), 1)
+                        )
+                    parts.append(text)
+                    await broadcast.publish(text)
+    except asyncio.CancelledError:
+        _forget_stream(key, broadcast)
+        await broadcast.finish(RuntimeError("LLM stream was cancelled"))
+        _record_cancelled_stream(cache_namespace, sum(map(len, parts)))
+        raise
+    except Exception as error:
+        _forget_stream(key, broadcast)
+        await broadcast.finish(error)
+        return
+
+    # Listeners are released before the cache write so they never wait on
+    # it; the stream stays registered until the cache can serve the text.
+    await broadcast.finish()
+    _record_completed_stream(cache_namespace, sum(map(len, parts)))
+    try:
+        await set_cached_json(key, {"text": "".join(parts)})
+    finally:
+        _forget_stream(key, broadcast)
+    await publish_event(
+        "llm.stream.completed",
+        {
+            "namespace": cache_namespace,
+            "model": _llm_signature(llm),
+            "prompt_chars": len(message),
+        },
+    )
+
+
+async def llm_stream_text_async(
+    llm: BaseChatModel | None,
+    message: str,
+    *,
+    cache_namespace: str = "llm_stream_async",
+) -> AsyncIterator[str]:
+    """Stream an LLM response through the shared text cache.
+
+    A cached response is replayed as paced chunks. Otherwise the live stream
+    is teed into the cache; concurrent callers with the same prompt follow
+    that one upstream stream instead of starting their own. Once every
+    listener has gone (the client disconnected and its request was
+    cancelled), the upstream stream is cancelled as well, which closes the
+    provider connection; nothing is cached then. Upstream errors are raised
+    to every listener and nothing is cached.
+    """
+    if llm is None:
+        raise ValueError("LLM is required")
+
+    key = _cache_key(cache_namespace, message, llm)
+
+    broadcast = _inflight_streams.get(key)
+    if broadcast is not None and not broadcast.abandoned:
+        increment("llm.stream_cache", outcome="joined", namespace=cache_namespace)
+        async for chunk in broadcast.listen():
+            yield chunk
+        return
+
+    cached = await get_cached_json(key)
+    if cached and isinstance(cached.get("text"), str):
+        increment("llm.stream_cache", outcome="hit", namespace=cache_namespace)
+        async for chunk in _replay_cached_text(cached["text"]):
+            yield chunk
+        return
+
+    # Another caller may have started the stream while the cache was read.
+    broadcast = _inflight_streams.get(key)
+    if broadcast is None or broadcast.abandoned:
+        increment("llm.stream_cache", outcome="miss", namespace=cache_namespace)
+        broadcast = StreamBroadcast()
+        _inflight_streams[key] = broadcast
+        broadcast.task = asyncio.create_task(
+            _pump_llm_stream(llm, message, key, broadcast, cache_namespace)
+        )
+        _stream_tasks.add(broadcast.task)
+        broadcast.task.add_done_callback(_stream_tasks.discard)
+        # Also covers a pump cancelled before it got to run.
+        broadcast.task.add_done_callback(lambda _: _forget_stream(key, broadcast))
+    else:
+        increment("llm.stream_cache", outcome="joined", namespace=cache_namespace)
+
+    async for chunk in broadcast.listen():
+        yield chunk
@@ -4,6 +4,8 @@ import hashlib
 import logging
 import os
 import re
+from collections import Counter
+from dataclasses import dataclass
 
 import fitz
 import pymupdf4llm
@@ -17,11 +19,14 @@ from app.core.cache import (
 )
 from app.core.settings import get_settings
 from app.core.streaming import publish_event
+from app.core.tracing import traced
+from app.services.prompt_context import estimate_tokens
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
 
+@traced("resume.llm_fallback")
 def _fallback_convert_to_text(file_bytes: bytes) -> str:
     """Fallback method to convert document bytes to plain text using Google GenAI.
 
@@ -66,32 +71,169 @@ def _fallback_convert_to_text(file_bytes: bytes) -> str:
     return str(cleaned_output)
 
 
+@traced("resume.convert")
 def _convert_document_to_markdown(file_bytes: bytes, filetype: str) -> str:
     """Render document bytes to Markdown using PyMuPDF for consistent parsing."""
     with fitz.open(stream=file_bytes, filetype=filetype) as doc:
-        return pymupdf4llm.to_markdown(
+        pages = pymupdf4llm.to_markdown(
             doc,
             force_text=True,
             ignore_images=False,
             ignore_graphics=False,
             page_separators=False,
+            page_chunks=True,
         )
+    page_texts = [str(page.get("text", "")) for page in pages]
+    return "\n\n".join(_strip_repeated_page_edges(page_texts))
 
 
+@dataclass(frozen=True)
+class TextNormalizationStats:
+    original_chars: int
+    normalized_chars: int
+    original_tokens: int
+    normalized_tokens: int
+
+    @property
+    def saved_chars(self) -> int:
+        return self.original_chars - self.normalized_chars
+
+    @property
+    def saved_tokens(self) -> int:
+        return self.original_tokens - self.normalized_tokens
+
+
+_PAGE_EDGE_LINES = 3
+_PAGE_NUMBER_PATTERN = re.compile(
+    r"^[\s\-–—|*_]*(?:page\s*)?\d{1,3}(?:\s*(?:of|/)\s*\d{1,3})?[\s\-–—|*_]*$",
+    re.IGNORECASE,
+)
+_TABLE_SEPARATOR_PATTERN = re.compile(
+    r"^\s*\|?\s*:?-{3,}:?\s*(?:\|\s*:?-{3,}:?\s*)*\|?\s*$"
+)
+# Only words broken between two lowercase letters; "2019-\npresent" keeps
+# its hyphen.
+_HYPHENATION_PATTERN = re.compile(r"([a-z])-\n[ \t]*([a-z])")
+_INLINE_WHITESPACE_PATTERN = re.compile(r"[ \t\u00a0]+")
+_BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
+_HTML_BREAK_PATTERN = re.compile(r"<br\s*/?>", re.IGNORECASE)
+
+
+def _edge_key(line: str) -> str:
+    # Page numbers embedded in running headers ("Jane Doe - Page 2") differ
+    # per page, so compare edge lines with digits masked.
+    return re.sub(r"\d+", "#", " ".join(line.split())).lower()
+
+
+def _is_repeated_edge_to_drop(line: str, page_index: int) -> bool:
+    if _PAGE_NUMBER_PATTERN.match(line):
+        # A number near the edge is only a page number if it is this page's.
+        return int(re.search(r"\d+", line).group()) == page_index + 1
+    # Running headers often carry the candidate's name and contact details,
+    # so the first page keeps its copy.
+    return page_index > 0
+
+
+def _strip_repeated_page_edges(page_texts: list[str]) -> list[str]:
+    """Drop header/footer lines repeated at the top or bottom of most pages."""
+    if len(page_texts) < 2:
+        return page_texts
+
+    edge_counts: Counter[str] = Counter()
+    for text in page_texts:
+        lines = [line for line in text.splitlines() if line.strip()]
+        edges = lines[:_PAGE_EDGE_LINES] + lines[-_PAGE_EDGE_LINES:]
+        edge_counts.update({_edge_key(line) for line in edges})
+
+    threshold = max(2, (len(page_texts) + 1) // 2)
+    repeated = {key for key, count in edge_counts.items() if count >= threshold}
+    if not repeated:
+        return page_texts
+
+    cleaned_pages: list[str] = []
+    for page_index, text in enumerate(page_texts):
+        lines = text.splitlines()
+        non_empty = [index for index, line in enumerate(lines) if line.strip()]
+        edge_indexes = set(non_empty[:_PAGE_EDGE_LINES] + non_empty[-_PAGE_EDGE_LINES:])
+        cleaned_pages.append(
+            "\n".join(
+                line
+                for index, line in enumerate(lines)
+                if index not in edge_indexes
+                or _edge_key(line) not in repeated
+                or not _is_repeated_edge_to_drop(line, page_index)
+            )
+        )
+    return cleaned_pages
+
+
+def _normalize_table_row(line: str) -> str:
+    cells = [cell.strip() for cell in line.strip().strip("|").split("|")]
+    return " | ".join(cell for cell in cells if cell)
+
+
+def normalize_document_text(text: str) -> tuple[str, TextNormalizationStats]:
+    """Deterministically strip extraction artifacts before text reaches an LLM.
+
+    Removes markdown table scaffolding, hyphenation breaks and whitespace
+    runs. Page numbers are left to ``_strip_repeated_page_edges``, which can
+    tell them from numbers in the content. The output is also what LLM cache
+    keys are derived from, so near-identical re-exports of a resume share
+    cached results.
+    """
+    normalized = text.replace("\r\n", "\n").replace("\r", "\n")
+    normalized = _HTML_BREAK_PATTERN.sub(" ", normalized)
+    normalized = _HYPHENATION_PATTERN.sub(r"\1\2", normalized)
+
+    lines: list[str] = []
+    for line in normalized.split("\n"):
+        if line.strip() and _TABLE_SEPARATOR_PATTERN.match(line):
+            continue
+        if line.lstrip().startswith("|"):
+            line = _normalize_table_row(line)
+        lines.append(_INLINE_WHITESPACE_PATTERN.sub(" ", line).strip())
+
+    normalized = _BLANK_LINES_PATTERN.sub("\n\n", "\n".join(lines)).strip()
+
+    stats = TextNormalizationStats(
+        original_chars=len(text),
+        normalized_chars=len(normalized),
+        original_tokens=estimate_tokens(text),
+        normalized_tokens=estimate_tokens(normalized),
+    )
+    return normalized, stats
+
+
+@traced("resume.normalize")
+def _normalize_and_report(text: str, file_name: str | None) -> str:
+    normalized, stats = normalize_document_text(text)
+    logger.debug(
+        "Normalized %s: %d -> %d chars, ~%d tokens saved",
+        file_name or "document",
+        stats.original_chars,
+        stats.normalized_chars,
+        stats.saved_tokens,
+    )
+    return normalized
+
+
+@traced("resume.extract")
 def _process_document_local(file_bytes: bytes, file_name: str | None) -> str | None:
     file_extension = os.path.splitext(file_name or "")[1].lower()
     try:
         if file_extension in {".txt", ".md"}:
-            return file_bytes.decode()
+            return _normalize_and_report(file_bytes.decode(), file_name)
 
         if file_extension in {".pdf", ".doc", ".docx"}:
             filetype = file_extension.lstrip(".")
             processed_txt = _convert_document_to_markdown(file_bytes, filetype)
 
             if not processed_txt.strip() and file_extension == ".pdf":
-                return _fallback_convert_to_text(file_bytes)
+                return _normalize_and_report(
+                    _fallback_convert_to_text(file_bytes), file_name
+                )
 
-            return processed_txt
+            return _normalize_and_report(processed_txt, file_name)
 
         logger.warning(
             "Unsupported file type: %s. Please upload TXT, MD, PDF, or DOCX.",
@@ -107,9 +249,11 @@ def _process_document_local(file_bytes: bytes, file_name: str | None) -> str | N
 def _build_document_cache_key(file_bytes: bytes, file_name: str | None) -> str:
     file_hash = hashlib.sha256(file_bytes).hexdigest()
     safe_name = (file_name or "unknown").strip().lower()
-    return build_cache_key("document", f"{safe_name}:{file_hash}")
+    # Versioned so text cached before normalization is not served
+    return build_cache_key("document:v2", f"{safe_name}:{file_hash}")
 
 
+@traced("resume.celery")
 def _process_document_with_celery(
     file_bytes: bytes, file_name: str | None
 ) -> str | None:
@@ -134,6 +278,7 @@ def _process_document_with_celery(
     return None
 
 
+@traced("resume.process")
 def process_document(file_bytes: bytes, file_name: str | None) -> str | None:
     if not file_bytes:
         return None
@@ -156,6 +301,7 @@ def process_document(file_bytes: bytes, file_name: str | None) -> str | None:
     return result
 
 
+@traced("resume.process")
 async def process_document_async(
     file_bytes: bytes, file_name: str | None
 ) -> str | None:
@@ -195,6 +341,42 @@ def process_document_local(file_bytes: bytes, file_name: str | None) -> str | No
     return _process_document_local(file_bytes, file_name)
 
 
+_MOJIBAKE_PATTERN = re.compile(r"[\ufffd]|Ã.|â€|Â")
+_LETTER_SPACED_PATTERN = re.compile(r"\b(?:\w ){4,}\w\b")
+
+
+def needs_llm_text_formatting(text: str) -> bool:
+    """Quality gate: does extracted text still need an LLM clean-up pass?
+
+    Normalized text that is readable line by line can go straight to
+    structured extraction. Garbled encodings, letter-spaced headings,
+    single-blob text or hard-wrapped sentences still benefit from the
+    LLM formatter.
+    """
+    stripped = text.strip()
+    if not stripped:
+        return False
+
+    if len(_MOJIBAKE_PATTERN.findall(stripped)) > max(3, len(stripped) // 500):
+        return True
+
+    if len(_LETTER_SPACED_PATTERN.findall(stripped)) >= 3:
+        return True
+
+    lines = [line for line in stripped.splitlines() if line.strip()]
+    if len(stripped) > 1500 and len(lines) < 8:
+        return True
+
+    # Sentences wrapped mid-way (next line continues in lowercase) point at
+    # column-layout or hard-wrapped extraction.
+    broken = sum(
+        1
+        for current, following in zip(lines, lines[1:])
+        if following.lstrip()[:1].islower() and current.rstrip()[-1:] not in ".:;,"
+    )
+    return len(lines) >= 10 and broken / len(lines) > 0.3
+
+
 def is_valid_resume(text: str) -> bool:
     if not text:
         return False
@@ -0,0 +1,150 @@
+"""Compact serialization of structured resume data for LLM prompts."""
+
+import json
+import logging
+import math
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_EMPTY_VALUES = (None, "", [], {})
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (about four characters per token)."""
+    return math.ceil(len(text) / 4)
+
+
+def prune_empty(value: Any) -> Any:
+    """Recursively drop ``None``, empty strings, lists and dicts."""
+    if isinstance(value, dict):
+        pruned = {key: prune_empty(item) for key, item in value.items()}
+        return {key: item for key, item in pruned.items() if item not in _EMPTY_VALUES}
+    if isinstance(value, list):
+        pruned = [prune_empty(item) for item in value]
+        return [item for item in pruned if item not in _EMPTY_VALUES]
+    if isinstance(value, str):
+        return value.strip()
+    return value
+
+
+def _report_savings(label: str | None, data: Any, compact: str) -> None:
+    if not label or not logger.isEnabledFor(logging.DEBUG):
+        return
+
+    baseline = json.dumps(data, indent=2, ensure_ascii=True, default=str)
+    baseline_tokens = estimate_tokens(baseline)
+    compact_tokens = estimate_tokens(compact)
+    logger.debug(
+        "Prompt context %s: ~%d -> ~%d tokens (saved ~%d)",
+        label,
+        baseline_tokens,
+        compact_tokens,
+        baseline_tokens - compact_tokens,
+    )
+
+
+def compact_json(
+    data: Any, *, drop_empty: bool = True, label: str | None = None
+) -> str:
+    """Serialize ``data`` as minified JSON for prompts that expect JSON input.
+
+    Keep ``drop_empty=False`` when the LLM is asked to return the same
+    structure, so empty sections are not silently lost in its output.
+    """
+    payload = prune_empty(data) if drop_empty else data
+    compact = json.dumps(
+        payload,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+    _report_savings(label, data, compact)
+    return compact
+
+
+def _is_scalar(value: Any) -> bool:
+    return not isinstance(value, (dict, list))
+
+
+def _format_scalar(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return " ".join(str(value).split())
+
+
+def _table_columns(items: list[Any]) -> list[str] | None:
+    """Return shared columns when ``items`` is a list of flat dicts."""
+    if len(items) < 2:
+        return None
+    if not all(isinstance(item, dict) for item in items):
+        return None
+    if not all(_is_scalar(value) for item in items for value in item.values()):
+        return None
+
+    columns: list[str] = []
+    for item in items:
+        for key in item:
+            if key not in columns:
+                columns.append(key)
+    return columns
+
+
+def _render(value: Any, depth: int, lines: list[str]) -> None:
+    pad = "  " * depth
+
+    if isinstance(value, list):
+        for item in value:
+            if _is_scalar(item):
+                lines.append(f"{pad}- {_format_scalar(item)}")
+                continue
+            nested: list[str] = []
+            _render(item, depth + 1, nested)
+            if nested:
+                nested[0] = f"{pad}- {nested[0].lstrip()}"
+                lines.extend(nested)
+        return
+
+    if not isinstance(value, dict):
+        lines.append(f"{pad}{_format_scalar(value)}")
+        return
+
+    for key, item in value.items():
+        if _is_scalar(item):
+            lines.append(f"{pad}{key}: {_format_scalar(item)}")
+            continue
+
+        if isinstance(item, list):
+            columns = _table_columns(item)
+            if columns:
+                # One header per list instead of repeating keys per entry.
+                lines.append(f"{pad}{key}[{' | '.join(columns)}]:")
+                for row in item:
+                    cells = (_format_scalar(row.get(column, "")) for column in columns)
+                    lines.append(f"{pad}  {' | '.join(cells)}")
+                continue
+
+            scalars = [_format_scalar(entry) for entry in item if _is_scalar(entry)]
+            # Short tags (skills, technologies) fit on one line; sentences
+            # such as bullet points keep one line each.
+            if len(scalars) == len(item) and all(
+                "," not in entry and len(entry.split()) <= 3 for entry in scalars
+            ):
+                lines.append(f"{pad}{key}: {', '.join(scalars)}")
+                continue
+
+        lines.append(f"{pad}{key}:")
+        _render(item, depth + 1, lines)
+
+
+def render_resume_context(data: Any, *, label: str | None = None) -> str:
+    """Render structured resume data as compact, YAML-like text.
+
+    Intended for prompts that only read the resume as context. Empty fields
+    are dropped and lists of flat records become a header plus one row each.
+    """
+    lines: list[str] = []
+    _render(prune_empty(data), 0, lines)
+    rendered = "\n".join(lines)
+    _report_savings(label, data, rendered)
+    return rendered
@@ -21,6 +21,7 @@ from app.models.refinement.schemas import (
     RefinementResult,
 )
 from app.services.llm_helpers import llm_complete_json_async
+from app.services.prompt_context import compact_json
 
 logger = logging.getLogger(__name__)
 
@@ -279,8 +280,10 @@ async def inject_keywords(
 
     prompt = KEYWORD_INJECTION_PROMPT.format(
         keywords_to_inject=json.dumps(keywords_to_inject, ensure_ascii=True),
-        current_resume=json.dumps(tailored, indent=2, ensure_ascii=True),
-        master_resume=json.dumps(master, indent=2, ensure_ascii=True),
+        current_resume=compact_json(
+            tailored, drop_empty=False, label="refiner_current"
+        ),
+        master_resume=compact_json(master, label="refiner_master"),
         job_description=truncated_jd,
     )
 
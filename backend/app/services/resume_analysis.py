@@ -1,9 +1,15 @@
+import logging
 import os
+import time
 
 from fastapi import HTTPException, UploadFile
 from langchain_core.language_models import BaseChatModel
 from pydantic import ValidationError
 
+from app.core.metrics import increment, observe
+from app.core.settings import get_settings
+from app.core.streaming import publish_event
+from app.core.tracing import span
 from app.models.schemas import (
     ComprehensiveAnalysisData,
     ComprehensiveAnalysisResponse,
@@ -21,13 +27,76 @@ from app.services.data_processor import (
 )
 from app.services.process_resume import (
     is_valid_resume,
+    needs_llm_text_formatting,
     process_document,
     process_document_async,
 )
 
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_FILL_RATE_FIELDS = (
+    "name",
+    "email",
+    "contact",
+    "linkedin",
+    "github",
+    "portfolio",
+    "predicted_field",
+    "college",
+    "work_experience",
+    "projects",
+    "skills",
+)
+
+
+def _should_format_text_with_llm(resume_text: str, file_extension: str) -> bool:
+    if not resume_text.strip() or file_extension in [".md", ".txt"]:
+        return False
+
+    mode = settings.RESUME_TEXT_FORMATTING_MODE.strip().lower()
+    if mode == "always":
+        return True
+    if mode == "never":
+        return False
+    return needs_llm_text_formatting(resume_text)
+
+
+def _field_fill_rate(analysis_data: ResumeAnalysis) -> float:
+    filled = sum(1 for field in _FILL_RATE_FIELDS if getattr(analysis_data, field))
+    return filled / len(_FILL_RATE_FIELDS)
+
+
+async def _record_analysis_metrics(
+    formatting_mode: str,
+    started_at: float,
+    analysis_data: ResumeAnalysis,
+) -> None:
+    latency_ms = (time.perf_counter() - started_at) * 1000
+    fill_rate = _field_fill_rate(analysis_data)
+
+    increment("resume_analysis.requests", mode=formatting_mode)
+    observe("resume_analysis.latency_ms", latency_ms, mode=formatting_mode)
+    observe("resume_analysis.field_fill_rate", fill_rate, mode=formatting_mode)
+    logger.info(
+        "Resume analysis (%s) took %.0f ms, field fill rate %.2f",
+        formatting_mode,
+        latency_ms,
+        fill_rate,
+    )
+    await publish_event(
+        "resume.analysis.completed",
+        {
+            "formatting_mode": formatting_mode,
+            "latency_ms": round(latency_ms, 2),
+            "field_fill_rate": round(fill_rate, 4),
+        },
+    )
+
 
 async def analyze_resume_service(file: UploadFile, llm: BaseChatModel):
     cleaned_data_dict = None
+    started_at = time.perf_counter()
     try:
         uploads_dir = os.path.join(
             os.path.dirname(__file__),
@@ -41,7 +110,8 @@ async def analyze_resume_service(file: UploadFile, llm: BaseChatModel):
             uploads_dir,
             f"temp_{file.filename}",
         )
-        file_bytes = await file.read()
+        with span("resume.upload_read"):
+            file_bytes = await file.read()
 
         with open(temp_file_path, "wb") as buffer:
             buffer.write(file_bytes)
@@ -62,8 +132,13 @@ async def analyze_resume_service(file: UploadFile, llm: BaseChatModel):
             os.path.splitext(file.filename)[1].lower() if file.filename else ""
         )
 
-        if resume_text.strip() and file_extension not in [".md", ".txt"]:
+        # Structured extraction follows, so the full LLM rewrite is only
+        # worth its latency when the extracted text is still messy.
+        if _should_format_text_with_llm(resume_text, file_extension):
+            formatting_mode = "two_pass"
             resume_text = format_resume_text_with_llm(resume_text, llm)
+        else:
+            formatting_mode = "single_pass"
 
         os.remove(temp_file_path)
 
@@ -83,7 +158,8 @@ async def analyze_resume_service(file: UploadFile, llm: BaseChatModel):
                     "LLM service is not available or returned empty data."
                 )
             cleaned_data_dict = resume_data
-            analysis_data = ResumeAnalysis(**resume_data)
+            with span("resume.validate"):
+                analysis_data = ResumeAnalysis(**resume_data)
 
             if alias := cleaned_data_dict.get("personal_website, or any other link"):
                 analysis_data.portfolio = alias
@@ -139,6 +215,8 @@ async def analyze_resume_service(file: UploadFile, llm: BaseChatModel):
 
             analysis_data.projects = filtered_projects
 
+        await _record_analysis_metrics(formatting_mode, started_at, analysis_data)
+
         return ResumeUploadResponse(
             data=analysis_data,
             cleaned_data_dict=cleaned_data_dict,
@@ -168,7 +246,8 @@ async def comprehensive_resume_analysis_service(file: UploadFile, llm: BaseChatM
             exist_ok=True,
         )
 
-        file_bytes = await file.read()
+        with span("resume.upload_read"):
+            file_bytes = await file.read()
 
         temp_file_path = os.path.join(
             uploads_dir,
@@ -209,7 +288,8 @@ async def comprehensive_resume_analysis_service(file: UploadFile, llm: BaseChatM
             )
         analysis_dict = {str(k): v for k, v in analysis_dict.items()}
 
-        comprehensive_data = ComprehensiveAnalysisData(**analysis_dict)
+        with span("resume.validate"):
+            comprehensive_data = ComprehensiveAnalysisData(**analysis_dict)
 
         if alias := analysis_dict.get("personal_website, or any other link"):
             comprehensive_data.portfolio = alias
@@ -247,7 +327,8 @@ async def format_and_analyze_resume_service(file: UploadFile, llm: BaseChatModel
         )
 
         os.makedirs(uploads_dir, exist_ok=True)
-        file_bytes = await file.read()
+        with span("resume.upload_read"):
+            file_bytes = await file.read()
 
         temp_file_path = os.path.join(
             uploads_dir,
@@ -274,7 +355,8 @@ async def format_and_analyze_resume_service(file: UploadFile, llm: BaseChatModel
             llm=llm,
         )
 
-        analysis = ComprehensiveAnalysisData(**analysis_dict)
+        with span("resume.validate"):
+            analysis = ComprehensiveAnalysisData(**analysis_dict)
 
         if alias := analysis_dict.get("personal_website, or any other link"):
             analysis.portfolio = alias
@@ -328,7 +410,8 @@ async def analyze_resume_v2_service(formated_resume: str, llm: BaseChatModel):
             )
         analysis_dict = {str(k): v for k, v in analysis_dict.items()}
 
-        return ComprehensiveAnalysisData(**analysis_dict)
+        with span("resume.validate"):
+            return ComprehensiveAnalysisData(**analysis_dict)
 
     except HTTPException:
         raise
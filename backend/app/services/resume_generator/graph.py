@@ -15,6 +15,7 @@ from langgraph.prebuilt import ToolNode, tools_condition
 from app.agents.web_content_agent import return_markdown
 from app.core.llm import MODEL_NAME, get_llm
 from app.core.settings import get_settings
+from app.core.tracing import span
 from app.services.data_processor import polish_resume_json_with_llm
 from app.services.ats import ats_evaluate_service
 
@@ -53,7 +54,8 @@ class GraphBuilder:
     def agent_function(self, state: MessagesState):
         user_question = state["messages"]
         input_question = [*self.system_prompt] + user_question
-        response = self.llm_with_tools.invoke(input_question)
+        with span("graph.resume_generator.agent"):
+            response = self.llm_with_tools.invoke(input_question)
         return {"messages": [response]}
 
     def build_graph(self):
@@ -196,15 +198,16 @@ async def run_resume_pipeline(
         "Only include these keys. If a field is empty, return an empty array or null for optional strings. Ensure all strings are properly quoted and the output is strictly valid JSON."
     )
 
-    response = graph.invoke(
-        {
-            "messages": [
-                HumanMessage(
-                    content=json_instruction,
-                )
-            ]
-        }
-    )
+    with span("graph.resume_generator.run"):
+        response = graph.invoke(
+            {
+                "messages": [
+                    HumanMessage(
+                        content=json_instruction,
+                    )
+                ]
+            }
+        )
     text = response["messages"][-1].content.strip()
 
     # Try to extract JSON substring
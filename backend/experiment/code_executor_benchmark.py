@@ -0,0 +1,121 @@
+"""Benchmark cold vs warm interview code execution latency.
+
+Runs the same small programs through ``CodeExecutor`` with and without the
+warm sandbox worker pool and reports per-language latency percentiles.
+Languages whose runtime (or, for TypeScript, the ``typescript`` package) is
+not installed are reported as unavailable.
+
+Run from the backend directory:
+
+    python -m experiment.code_executor_benchmark --runs 30
+    python -m experiment.code_executor_benchmark --languages python javascript
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.services.interview.code_executor import CodeExecutor
+from app.services.interview.sandbox_pool import (
+    close_sandbox_pools,
+    get_sandbox_pool,
+    start_sandbox_pools,
+)
+
+PROGRAMS = {
+    "python": (
+        "n = int(input())\nprint(sum(i * i for i in range(n)))\n",
+        "1000",
+        "332833500",
+    ),
+    "javascript": (
+        "let data = '';\n"
+        "process.stdin.on('data', (chunk) => (data += chunk));\n"
+        "process.stdin.on('end', () => {\n"
+        "  let total = 0;\n"
+        "  for (let i = 0; i < Number(data); i++) total += i * i;\n"
+        "  console.log(total);\n"
+        "});\n",
+        "1000",
+        "332833500",
+    ),
+    "typescript": (
+        "const n: number = 1000;\nlet total: number = 0;\n"
+        "for (let i = 0; i < n; i++) total += i * i;\nconsole.log(total);\n",
+        None,
+        "332833500",
+    ),
+}
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(fraction * (len(ordered) - 1)))
+    return ordered[index]
+
+
+async def _measure(
+    executor: CodeExecutor, language: str, runs: int
+) -> list[float] | None:
+    code, test_input, expected = PROGRAMS[language]
+    timings: list[float] = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = await executor.execute(code, language, test_input)
+        timings.append((time.perf_counter() - started) * 1000)
+        if not result.success or result.stdout.strip() != expected:
+            return None
+    return timings
+
+
+def _row(language: str, mode: str, timings: list[float] | None) -> str:
+    if timings is None:
+        return f"{language:<12}{mode:<6}{'unavailable':>12}"
+    return (
+        f"{language:<12}{mode:<6}"
+        f"{statistics.median(timings):>10.1f}ms"
+        f"{_percentile(timings, 0.95):>10.1f}ms"
+        f"{min(timings):>10.1f}ms"
+    )
+
+
+async def _run(languages: list[str], runs: int, pool_size: int) -> None:
+    executor = CodeExecutor()
+    results: dict[tuple[str, str], list[float] | None] = {}
+
+    for language in languages:
+        results[(language, "cold")] = await _measure(executor, language, runs)
+
+    await start_sandbox_pools({language: pool_size for language in languages})
+    try:
+        for language in languages:
+            if get_sandbox_pool(language) is None:
+                results[(language, "warm")] = None
+                continue
+            results[(language, "warm")] = await _measure(executor, language, runs)
+    finally:
+        await close_sandbox_pools()
+
+    print(f"{'language':<12}{'mode':<6}{'median':>12}{'p95':>12}{'min':>12}")
+    for language in languages:
+        for mode in ("cold", "warm"):
+            print(_row(language, mode, results[(language, mode)]))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--pool-size", type=int, default=1)
+    parser.add_argument(
+        "--languages",
+        nargs="+",
+        default=list(PROGRAMS),
+        choices=list(PROGRAMS),
+    )
+    args = parser.parse_args()
+    asyncio.run(_run(args.languages, args.runs, args.pool_size))
+
+
+if __name__ == "__main__":
+    main()
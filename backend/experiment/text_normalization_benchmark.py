@@ -0,0 +1,122 @@
+"""Benchmark the pre-LLM document text normalizer.
+
+Builds a corpus of multi-page resume PDFs from analysis/UpdatedResumeDataSet.csv
+(with running headers, footers and page numbers, as exported by common resume
+builders), extracts them the same way uploads are processed and reports the
+characters and estimated tokens removed by normalization.
+
+Run from the backend directory:
+
+    python -m experiment.text_normalization_benchmark --limit 50
+    python -m experiment.text_normalization_benchmark path/to/resumes/*.pdf
+"""
+
+import argparse
+import csv
+import statistics
+import sys
+import textwrap
+from pathlib import Path
+
+import fitz
+import pymupdf4llm
+
+from app.services.process_resume import (
+    _convert_document_to_markdown,
+    normalize_document_text,
+)
+from app.services.prompt_context import estimate_tokens
+
+_LINES_PER_PAGE = 50
+DATASET_PATH = (
+    Path(__file__).resolve().parents[2] / "analysis" / "UpdatedResumeDataSet.csv"
+)
+
+
+def _build_pdf(name: str, category: str, body: str) -> bytes:
+    lines: list[str] = []
+    for paragraph in body.splitlines():
+        lines.extend(textwrap.wrap(paragraph, width=95) or [""])
+
+    document = fitz.open()
+    for page_number, start in enumerate(range(0, len(lines), _LINES_PER_PAGE), 1):
+        page = document.new_page(width=612, height=792)
+        page.insert_text((54, 40), f"{name} | {category} Resume", fontsize=9)
+        for offset, line in enumerate(lines[start : start + _LINES_PER_PAGE]):
+            page.insert_text((54, 72 + offset * 13), line, fontsize=10)
+        page.insert_text((290, 770), f"Page {page_number}", fontsize=9)
+
+    data = document.tobytes()
+    document.close()
+    return data
+
+
+def _dataset_corpus(limit: int) -> list[tuple[str, bytes]]:
+    corpus: list[tuple[str, bytes]] = []
+    with DATASET_PATH.open(encoding="utf-8") as handle:
+        for index, row in enumerate(csv.DictReader(handle)):
+            if index >= limit:
+                break
+            body = row["Resume"].replace(" * ", "\n* ").replace(". ", ".\n")
+            name = f"Candidate {index}"
+            corpus.append((name, _build_pdf(name, row["Category"], body * 2)))
+    return corpus
+
+
+def _file_corpus(paths: list[str]) -> list[tuple[str, bytes]]:
+    return [(path, Path(path).read_bytes()) for path in paths]
+
+
+def _raw_markdown(file_bytes: bytes) -> str:
+    with fitz.open(stream=file_bytes, filetype="pdf") as doc:
+        return pymupdf4llm.to_markdown(
+            doc,
+            force_text=True,
+            ignore_images=False,
+            ignore_graphics=False,
+            page_separators=False,
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("files", nargs="*", help="PDF files to benchmark")
+    parser.add_argument("--limit", type=int, default=25)
+    args = parser.parse_args()
+
+    corpus = _file_corpus(args.files) if args.files else _dataset_corpus(args.limit)
+    if not corpus:
+        print("No documents to benchmark.")
+        return 1
+
+    reductions: list[float] = []
+    total_before = 0
+    total_after = 0
+
+    for name, file_bytes in corpus:
+        before = _raw_markdown(file_bytes)
+        after, _ = normalize_document_text(
+            _convert_document_to_markdown(file_bytes, "pdf")
+        )
+        before_tokens = estimate_tokens(before)
+        after_tokens = estimate_tokens(after)
+        total_before += before_tokens
+        total_after += after_tokens
+        if before_tokens:
+            reductions.append(1 - after_tokens / before_tokens)
+        print(
+            f"{name[:40]:<40} {len(before):>7} -> {len(after):>7} chars  "
+            f"~{before_tokens:>6} -> ~{after_tokens:>6} tokens"
+        )
+
+    print()
+    print(f"documents:           {len(corpus)}")
+    print(f"tokens before/after: ~{total_before} / ~{total_after}")
+    print(f"total reduction:     {1 - total_after / max(total_before, 1):.1%}")
+    if reductions:
+        print(f"median reduction:    {statistics.median(reductions):.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,6 +10,7 @@ export const maxDuration = 1800;
 interface EnhanceRequestBody {
   resumeId: string;
   answers: AnswerInput[];
+  analysisId?: string | null;
 }
 
 export async function POST(request: NextRequest) {
@@ -28,7 +29,7 @@ export async function POST(request: NextRequest) {
 
     // Parse request body
     const body: EnhanceRequestBody = await request.json();
-    const { resumeId, answers } = body;
+    const { resumeId, answers, analysisId } = body;
 
     if (!resumeId) {
       return NextResponse.json(
@@ -99,6 +100,7 @@ export async function POST(request: NextRequest) {
         predicted_field: resume.analysis.predictedField || "",
       },
       answers,
+      analysis_id: analysisId,
     };
 
     // Sanitize to prevent Pydantic validation errors when a string is expected but null is given.
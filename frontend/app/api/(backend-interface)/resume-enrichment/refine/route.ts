@@ -10,6 +10,7 @@ export const maxDuration = 1800;
 interface RefineRequestBody {
   resumeId: string;
   refinements: RefinementInput[];
+  analysisId?: string | null;
 }
 
 export async function POST(request: NextRequest) {
@@ -28,7 +29,7 @@ export async function POST(request: NextRequest) {
 
     // Parse request body
     const body: RefineRequestBody = await request.json();
-    const { resumeId, refinements } = body;
+    const { resumeId, refinements, analysisId } = body;
 
     if (!resumeId) {
       return NextResponse.json(
@@ -99,6 +100,7 @@ export async function POST(request: NextRequest) {
         predicted_field: resume.analysis.predictedField || "",
       },
       refinements,
+      analysis_id: analysisId,
     };
 
     // Sanitize to prevent Pydantic validation errors when a string is expected but null is given.
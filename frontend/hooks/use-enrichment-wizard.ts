@@ -319,6 +319,7 @@ export function useEnrichmentWizard(): UseEnrichmentWizardReturn {
       const preview = await refineEnhancementsMutation.mutateAsync({
         resumeId: state.resumeId,
         refinements,
+        analysisId: state.analysisResult?.analysis_id,
       });
       dispatch({ type: "REFINE_SUCCESS", preview });
     } catch (error: any) {
@@ -344,6 +345,7 @@ export function useEnrichmentWizard(): UseEnrichmentWizardReturn {
     state.resumeId,
     state.enhancementPreview,
     state.patchReviews,
+    state.analysisResult,
     refineEnhancementsMutation,
   ]);
 
@@ -364,6 +366,7 @@ export function useEnrichmentWizard(): UseEnrichmentWizardReturn {
       const preview = await enhanceResumeMutation.mutateAsync({
         resumeId: state.resumeId,
         answers: answersArray,
+        analysisId: state.analysisResult.analysis_id,
       });
       dispatch({ type: "ENHANCE_SUCCESS", preview });
     } catch (error: any) {
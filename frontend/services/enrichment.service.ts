@@ -30,6 +30,7 @@ export interface AnalyzeResumeParams {
 export interface EnhanceResumeParams {
   resumeId: string;
   answers: AnswerInput[];
+  analysisId?: string | null;
 }
 
 export interface ApplyEnhancementsParams {
@@ -40,6 +41,7 @@ export interface ApplyEnhancementsParams {
 export interface RefineEnhancementsParams {
   resumeId: string;
   refinements: RefinementInput[];
+  analysisId?: string | null;
 }
 
 export interface RegenerateItemsParams {
@@ -82,6 +84,7 @@ export const enrichmentService = {
       {
         resumeId: params.resumeId,
         answers: params.answers,
+        analysisId: params.analysisId,
       }
     );
 
@@ -127,6 +130,7 @@ export const enrichmentService = {
       {
         resumeId: params.resumeId,
         refinements: params.refinements,
+        analysisId: params.analysisId,
       }
     );
 
@@ -29,6 +29,7 @@ export interface AnalysisResponse {
   items_to_enrich: EnrichmentItem[];
   questions: EnrichmentQuestion[];
   analysis_summary?: string | null;
+  analysis_id?: string | null;
 }
 
 // ============================================================================